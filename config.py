@@ -47,6 +47,16 @@ def _get_secret(key: str, default=None):
     return default
 
 
+def _env_path(key: str, default: Path) -> Path:
+    """Resolve a filesystem path from the environment, falling back to default.
+    
+    Paths are built once at import time so callers can hand them straight to
+    sqlite3/pathlib without re-wrapping a string on every open.
+    """
+    value = os.getenv(key)
+    return Path(value) if value else default
+
+
 class Config:
     """Central configuration class for CareerLens application."""
     
@@ -54,18 +64,12 @@ class Config:
     PROJECT_ROOT = Path(__file__).parent.absolute()
     
     # Database paths
-    DB_PATH_JOB_SEEKER = os.getenv(
-        'DB_PATH_JOB_SEEKER',
-        str(PROJECT_ROOT / 'job_seeker.db')
-    )
-    DB_PATH_HEAD_HUNTER = os.getenv(
-        'DB_PATH_HEAD_HUNTER',
-        str(PROJECT_ROOT / 'head_hunter_jobs.db')
-    )
-    DB_PATH_CHROMA = os.getenv(
-        'DB_PATH_CHROMA',
-        str(PROJECT_ROOT / '.chroma_db')
-    )
+    DB_PATH_JOB_SEEKER = _env_path('DB_PATH_JOB_SEEKER', PROJECT_ROOT / 'job_seeker.db')
+    DB_PATH_HEAD_HUNTER = _env_path('DB_PATH_HEAD_HUNTER', PROJECT_ROOT / 'head_hunter_jobs.db')
+    DB_PATH_CHROMA = _env_path('DB_PATH_CHROMA', PROJECT_ROOT / '.chroma_db')
+    DB_PATH_EMBEDDING_CACHE = _env_path('DB_PATH_EMBEDDING_CACHE', PROJECT_ROOT / 'embedding_cache.db')
+    DB_PATH_ANALYSIS_CACHE = _env_path('DB_PATH_ANALYSIS_CACHE', PROJECT_ROOT / 'analysis_cache.db')
+    DB_PATH_COMPLETION_CACHE = _env_path('DB_PATH_COMPLETION_CACHE', PROJECT_ROOT / 'completion_cache.db')
     
     # Azure OpenAI Configuration
     AZURE_OPENAI_API_KEY = None
@@ -79,6 +83,17 @@ class Config:
     AZURE_ENDPOINT = None
     AZURE_API_VERSION = '2024-02-15-preview'
     AZURE_MODEL = 'gpt-4o-mini'
+    # Deployment used for resume role/skill analysis (falls back to AZURE_MODEL)
+    RESUME_ANALYSIS_MODEL = None
+    # Deployment tried after the primary one keeps failing with 429/timeouts/5xx
+    # (deployment names are per-resource, so there is no default)
+    AZURE_FALLBACK_MODEL = None
+    RESUME_ANALYSIS_MAX_INPUT_TOKENS = 750
+    # Interview routing: questions/answer scoring on the fast deployment,
+    # summaries (and low-confidence scores) on the quality one
+    INTERVIEW_FAST_MODEL = None
+    INTERVIEW_QUALITY_MODEL = None
+    INTERVIEW_ESCALATION_CONFIDENCE = 0.6
     
     # RapidAPI Configuration
     RAPIDAPI_KEY = None
@@ -91,6 +106,17 @@ class Config:
     MODEL_NAME = 'all-MiniLM-L6-v2'
     INDEX_NAME = 'job-matcher'
     EMBEDDING_DIMENSION = 384
+    # 'auto' uses ONNX Runtime when optimum/onnxruntime are installed
+    EMBEDDING_BACKEND = os.getenv('EMBEDDING_BACKEND', 'auto')
+    DIR_ONNX_MODELS = _env_path('DIR_ONNX_MODELS', PROJECT_ROOT / 'models')
+    
+    # Resume analysis semantic cache
+    ANALYSIS_CACHE_THRESHOLD = 0.97
+    ANALYSIS_CACHE_TTL_HOURS = 24 * 7
+    ANALYSIS_CACHE_MAX_CANDIDATES = 200
+    
+    # Chat completion semantic cache (CV parsing, interview calls)
+    COMPLETION_CACHE_MAX_CANDIDATES = 200
     
     _initialized = False
     
@@ -131,6 +157,13 @@ class Config:
         cls.AZURE_ENDPOINT = cls.AZURE_OPENAI_ENDPOINT
         cls.AZURE_API_VERSION = cls.AZURE_OPENAI_API_VERSION
         cls.AZURE_MODEL = cls.AZURE_OPENAI_DEPLOYMENT or 'gpt-4o-mini'
+        cls.RESUME_ANALYSIS_MODEL = _get_secret('RESUME_ANALYSIS_MODEL', cls.AZURE_MODEL)
+        cls.AZURE_FALLBACK_MODEL = _get_secret('AZURE_FALLBACK_MODEL', None)
+        cls.INTERVIEW_FAST_MODEL = _get_secret('INTERVIEW_FAST_MODEL', cls.AZURE_MODEL)
+        cls.INTERVIEW_QUALITY_MODEL = _get_secret('INTERVIEW_QUALITY_MODEL', cls.AZURE_MODEL)
+        cls.INTERVIEW_ESCALATION_CONFIDENCE = float(
+            _get_secret('INTERVIEW_ESCALATION_CONFIDENCE', cls.INTERVIEW_ESCALATION_CONFIDENCE)
+        )
         
         # RapidAPI
         cls.RAPIDAPI_KEY = _get_secret('RAPIDAPI_KEY')
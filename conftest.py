@@ -3,12 +3,19 @@ import os
 import pytest
 
 
+# Endpoint settings read by the fixtures below, resolved once at import
+_ENV_NAMES = (
+    "API_KEY", "AZURE_OPENAI_API_KEY", "OPENAI_API_KEY",
+    "BASE_URL", "AZURE_OPENAI_ENDPOINT",
+    "DEPLOYMENT", "AZURE_OPENAI_DEPLOYMENT", "AZURE_OPENAI_EMBEDDING_DEPLOYMENT",
+)
+_ENV_CACHE = {name: (os.environ.get(name) or "").strip() or None for name in _ENV_NAMES}
+
+
 def _env(name: str) -> str | None:
-    value = os.getenv(name)
-    if value is None:
-        return None
-    value = value.strip()
-    return value or None
+    if name not in _ENV_CACHE:
+        _ENV_CACHE[name] = (os.environ.get(name) or "").strip() or None
+    return _ENV_CACHE[name]
 
 
 @pytest.fixture
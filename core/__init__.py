@@ -3,82 +3,93 @@ Core modules for CareerLens application.
 
 This package contains centralized, reusable components that are shared
 across the application.
+
+Exports are resolved lazily (PEP 562): ``from core import RateLimiter``
+only imports ``core.rate_limiting``, so heavy dependencies (python-docx,
+reportlab, sentence-transformers, ...) load when a symbol that needs them
+is first used rather than on every import of the package.
 """
 
-from .job_processor import JobSeekerBackend, JobMatcherBackend
-from .job_matcher import (
-    JobMatcher,
-    calculate_match_scores,
-    analyze_match_simple,
-    calculate_job_match_score
-)
-from .resume_parser import (
-    ResumeParser,
-    GPT4JobRoleDetector,
-    extract_relevant_resume_sections,
-    extract_structured_profile,
-    generate_tailored_resume,
-    # Streamlit-integrated functions (from modules/resume_upload)
-    extract_text_from_resume,
-    extract_profile_from_resume,
-    verify_profile_data_pass2
-)
-from .rate_limiting import TokenUsageTracker, RateLimiter
-from .interview import (
-    initialize_interview_session,
-    generate_interview_question,
-    evaluate_answer,
-    generate_final_summary
-    # NOTE: ai_interview_page is UI, not business logic
-    # UI is in modules/ui/pages/ai_interview_page.py
-)
-from .salary_analyzer import (
-    SalaryAnalyzer,
-    extract_salary_from_text,
-    extract_salary_from_text_regex,
-    filter_jobs_by_salary,
-    calculate_salary_band
-)
-from .domain_filter import (
-    DomainFilter,
-    filter_jobs_by_domains,
-    DOMAIN_KEYWORDS
-)
-from .resume_generator import (
-    ResumeGenerator,
-    generate_docx_from_json,
-    generate_pdf_from_json,
-    format_resume_as_text
-)
-from .semantic_search import (
-    SemanticJobSearch,
-    fetch_jobs_with_cache,
-    is_cache_valid,
-    generate_and_store_resume_embedding
-)
-from .job_seeker_flow import (
-    # Step 1: Resume Upload & Profile Creation
-    process_resume_and_create_profile,
-    save_job_seeker_profile,
-    get_job_seeker_profile,
-    # Step 2: Job Matching & API Storage
-    search_and_match_jobs,
-    get_matched_jobs_for_seeker,
-    get_top_matched_jobs,
-    # Step 3: AI Resume & Interview
-    get_job_for_resume_tailoring,
-    generate_tailored_resume_for_job,
-    get_job_for_interview,
-    get_jobs_for_interview_from_matches,
-    convert_matched_job_to_interview_tuple,
-    convert_profile_to_interview_tuple,
-    # Utilities
-    get_current_job_seeker_id,
-    set_current_job_seeker_id,
-    clear_matched_jobs_for_seeker,
-    get_match_statistics,
-    MATCH_SCORE_THRESHOLD
-)
+import importlib
+
+# Public name -> defining submodule
+_LAZY_IMPORTS = {
+    # core.job_processor
+    'JobSeekerBackend': 'core.job_processor',
+    'JobMatcherBackend': 'core.job_processor',
+    # core.job_matcher
+    'JobMatcher': 'core.job_matcher',
+    'get_job_matcher': 'core.job_matcher',
+    'calculate_match_scores': 'core.job_matcher',
+    'analyze_match_simple': 'core.job_matcher',
+    'match_score_matrix': 'core.job_matcher',
+    'top_matches_for_job': 'core.job_matcher',
+    'calculate_job_match_score': 'core.job_matcher',
+    # core.resume_parser
+    'ResumeParser': 'core.resume_parser',
+    'GPT4JobRoleDetector': 'core.resume_parser',
+    'get_gpt4_detector': 'core.resume_parser',
+    'analyze_resume_cached': 'core.resume_parser',
+    'extract_relevant_resume_sections': 'core.resume_parser',
+    'extract_structured_profile': 'core.resume_parser',
+    'generate_tailored_resume': 'core.resume_parser',
+    'extract_text_from_resume': 'core.resume_parser',
+    'extract_profile_from_resume': 'core.resume_parser',
+    'verify_profile_data_pass2': 'core.resume_parser',
+    # core.rate_limiting
+    'TokenUsageTracker': 'core.rate_limiting',
+    'RateLimiter': 'core.rate_limiting',
+    # core.interview
+    'initialize_interview_session': 'core.interview',
+    'reset_interview_session': 'core.interview',
+    'generate_interview_question': 'core.interview',
+    'evaluate_answer': 'core.interview',
+    'evaluate_answers': 'core.interview',
+    'evaluate_answers_batch': 'core.interview',
+    'evaluate_and_generate_next': 'core.interview',
+    'prefetch_interview_question': 'core.interview',
+    'evaluate_and_summarize': 'core.interview',
+    'apply_batch_evaluation': 'core.interview',
+    'generate_final_summary': 'core.interview',
+    # core.salary_analyzer
+    'SalaryAnalyzer': 'core.salary_analyzer',
+    'extract_salary_from_text': 'core.salary_analyzer',
+    'extract_salary_from_text_regex': 'core.salary_analyzer',
+    'filter_jobs_by_salary': 'core.salary_analyzer',
+    'calculate_salary_band': 'core.salary_analyzer',
+    # core.domain_filter
+    'DomainFilter': 'core.domain_filter',
+    'filter_jobs_by_domains': 'core.domain_filter',
+    'DOMAIN_KEYWORDS': 'core.domain_filter',
+    # core.resume_generator
+    'ResumeGenerator': 'core.resume_generator',
+    'generate_docx_from_json': 'core.resume_generator',
+    'generate_pdf_from_json': 'core.resume_generator',
+    'format_resume_as_text': 'core.resume_generator',
+    # core.semantic_search
+    'SemanticJobSearch': 'core.semantic_search',
+    'fetch_jobs_with_cache': 'core.semantic_search',
+    'is_cache_valid': 'core.semantic_search',
+    'generate_and_store_resume_embedding': 'core.semantic_search',
+    # core.job_seeker_flow
+    'process_resume_and_create_profile': 'core.job_seeker_flow',
+    'save_job_seeker_profile': 'core.job_seeker_flow',
+    'get_job_seeker_profile': 'core.job_seeker_flow',
+    'search_and_match_jobs': 'core.job_seeker_flow',
+    'get_matched_jobs_for_seeker': 'core.job_seeker_flow',
+    'get_top_matched_jobs': 'core.job_seeker_flow',
+    'get_job_for_resume_tailoring': 'core.job_seeker_flow',
+    'generate_tailored_resume_for_job': 'core.job_seeker_flow',
+    'get_job_for_interview': 'core.job_seeker_flow',
+    'get_jobs_for_interview_from_matches': 'core.job_seeker_flow',
+    'convert_matched_job_to_interview_tuple': 'core.job_seeker_flow',
+    'convert_profile_to_interview_tuple': 'core.job_seeker_flow',
+    'get_current_job_seeker_id': 'core.job_seeker_flow',
+    'set_current_job_seeker_id': 'core.job_seeker_flow',
+    'clear_matched_jobs_for_seeker': 'core.job_seeker_flow',
+    'get_match_statistics': 'core.job_seeker_flow',
+    'MATCH_SCORE_THRESHOLD': 'core.job_seeker_flow',
+}
 
 __all__ = [
     # Job Processing
@@ -87,13 +98,18 @@ __all__ = [
     
     # Job Matching
     'JobMatcher',
+    'get_job_matcher',
     'calculate_match_scores',
     'analyze_match_simple',
+    'match_score_matrix',
+    'top_matches_for_job',
     'calculate_job_match_score',
     
     # Resume Processing
     'ResumeParser',
     'GPT4JobRoleDetector',
+    'get_gpt4_detector',
+    'analyze_resume_cached',
     'extract_relevant_resume_sections',
     'extract_structured_profile',
     'generate_tailored_resume',
@@ -107,8 +123,15 @@ __all__ = [
     
     # Interview Logic (business logic only)
     'initialize_interview_session',
+    'reset_interview_session',
     'generate_interview_question',
     'evaluate_answer',
+    'evaluate_answers',
+    'evaluate_answers_batch',
+    'evaluate_and_generate_next',
+    'prefetch_interview_question',
+    'evaluate_and_summarize',
+    'apply_batch_evaluation',
     'generate_final_summary',
     
     # Salary Analysis
@@ -154,3 +177,18 @@ __all__ = [
     'get_match_statistics',
     'MATCH_SCORE_THRESHOLD',
 ]
+
+
+
+def __getattr__(name):
+    module_path = _LAZY_IMPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,80 @@
+"""
+Shared Azure OpenAI client construction.
+
+Building an AzureOpenAI client sets up a fresh httpx session, so every
+per-call construction pays a new TCP/TLS handshake. Clients are memoized
+per credential set (and transport options) and reused across calls and
+Streamlit reruns, each with a pooled keep-alive connection set.
+"""
+
+import functools
+from typing import Optional
+
+# Connection pool for each shared client. Prefetches and concurrent
+# evaluations overlap with UI calls, so keep several warm keep-alive
+# connections instead of paying a TLS handshake per request.
+HTTP_MAX_CONNECTIONS = 32
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 16
+HTTP_TIMEOUT_SECONDS = 30
+
+
+def clean_endpoint(endpoint: Optional[str]) -> Optional[str]:
+    """Strip a trailing '/openai' to prevent double /openai path issues."""
+    if endpoint:
+        endpoint = endpoint.rstrip('/')
+        if endpoint.endswith('/openai'):
+            endpoint = endpoint[:-7]
+    return endpoint
+
+
+def http2_available() -> bool:
+    """HTTP/2 in httpx needs the optional ``h2`` package."""
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def _build_http_client(verify: bool = True):
+    """Pooled httpx client (HTTP/2 when the optional h2 package is installed)."""
+    import httpx
+
+    return httpx.Client(
+        http2=http2_available(),
+        verify=verify,
+        timeout=HTTP_TIMEOUT_SECONDS,
+        limits=httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS
+        )
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def get_azure_openai_client(endpoint: str, api_key: str, api_version: str,
+                            verify: bool = True, max_retries: Optional[int] = None):
+    """Return a shared AzureOpenAI client for these credentials.
+
+    Keyed on the credential values, so changing config (e.g. in tests)
+    builds a new client instead of reusing a stale one.
+
+    Args:
+        endpoint: Azure OpenAI endpoint (a trailing '/openai' is removed)
+        api_key: Azure OpenAI API key
+        api_version: Azure OpenAI API version
+        verify: Verify TLS certificates (some cloud hosts need False)
+        max_retries: SDK retry count; None keeps the SDK default
+    """
+    from openai import AzureOpenAI
+
+    kwargs = {}
+    if max_retries is not None:
+        kwargs['max_retries'] = max_retries
+    return AzureOpenAI(
+        azure_endpoint=clean_endpoint(endpoint),
+        api_key=api_key,
+        api_version=api_version,
+        http_client=_build_http_client(verify),
+        **kwargs
+    )
@@ -0,0 +1,275 @@
+"""
+Semantic cache for Azure OpenAI chat completions.
+
+This module provides:
+- CompletionCache: SQLite store of completions keyed by prompt embedding
+- semantic_cache: decorator that short-circuits repeated/near-duplicate calls
+
+Entries are namespaced by call site, model and temperature so that e.g.
+``gpt-4o-mini`` at t=0 and t=0.8 never answer for each other. An exact
+prompt hash is checked first (in memory, then SQLite) before anything is
+embedded; the embedding comparison only handles near-duplicates.
+"""
+
+import time
+import random
+import sqlite3
+import hashlib
+import functools
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Optional
+
+from utils.json_utils import json_dumps
+
+# Sampled (temperature > this) completions are only cached when the call
+# site declares a reused answer acceptable (``idempotent=True``)
+CACHEABLE_MAX_TEMPERATURE = 0.3
+
+
+class CompletionCache:
+    """SQLite-backed semantic cache of chat completion results.
+
+    Mirrors ResumeAnalysisCache: normalized embeddings are stored as float32
+    blobs and compared against the most recent entries of the same namespace.
+    Recent exact-hash entries are also kept in a small in-process LRU.
+    """
+
+    def __init__(self, db_path: str, embed_fn: Optional[Callable] = None,
+                 max_candidates: int = 200, memory_size: int = 256):
+        self.db_path = Path(db_path)
+        self.max_candidates = max_candidates
+        self.memory_size = memory_size
+        self._embed_fn = embed_fn
+        self._conn = None
+        self._lock = threading.Lock()
+        self._memory = OrderedDict()  # prompt_hash -> (content, ts)
+
+    def _get_conn(self):
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS completion_cache (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    namespace TEXT NOT NULL,
+                    prompt_hash TEXT NOT NULL,
+                    embedding BLOB,
+                    content TEXT NOT NULL,
+                    ts REAL NOT NULL
+                )
+            """)
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_completion_cache_ns "
+                "ON completion_cache(namespace, ts)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_completion_cache_hash "
+                "ON completion_cache(prompt_hash)"
+            )
+            self._conn.commit()
+        return self._conn
+
+    @staticmethod
+    def make_hash(namespace: str, prompt: str) -> str:
+        """Stable hash of a prompt within its namespace."""
+        return hashlib.blake2b(
+            f"{namespace}\0{prompt}".encode('utf-8'), digest_size=16
+        ).hexdigest()
+
+    def embed(self, text: str):
+        """Embed text with the local model, or return None if unavailable."""
+        try:
+            if self._embed_fn is None:
+                from core.job_matcher import get_job_matcher
+                self._embed_fn = get_job_matcher().generate_embedding
+            return self._embed_fn(text)
+        except Exception as e:
+            print(f"⚠️ Completion cache embedding unavailable: {e}")
+            return None
+
+    def _remember(self, prompt_hash: str, content: str, ts: float):
+        self._memory[prompt_hash] = (content, ts)
+        self._memory.move_to_end(prompt_hash)
+        if len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def get_exact(self, prompt_hash: str, ttl: float) -> Optional[str]:
+        """Return the newest completion stored under this exact prompt hash."""
+        cutoff = time.time() - ttl
+        with self._lock:
+            entry = self._memory.get(prompt_hash)
+            if entry is not None and entry[1] >= cutoff:
+                self._memory.move_to_end(prompt_hash)
+                return entry[0]
+            row = self._get_conn().execute(
+                "SELECT content, ts FROM completion_cache "
+                "WHERE prompt_hash = ? AND ts >= ? ORDER BY ts DESC LIMIT 1",
+                (prompt_hash, cutoff)
+            ).fetchone()
+            if row is None:
+                return None
+            self._remember(prompt_hash, row[0], row[1])
+            return row[0]
+
+    def lookup(self, namespace: str, prompt_hash: str, embedding,
+               threshold: float, ttl: float) -> Optional[str]:
+        """Return a cached completion for this prompt, or None.
+
+        Args:
+            namespace: Call site / model / temperature key
+            prompt_hash: Exact hash of the full prompt
+            embedding: Normalized embedding of the cache key text (may be None)
+            threshold: Minimum cosine similarity for a semantic hit
+            ttl: Maximum entry age in seconds
+        """
+        hit = self.get_exact(prompt_hash, ttl)
+        if hit is not None or embedding is None:
+            return hit
+        return self.lookup_similar(namespace, embedding, threshold, ttl)
+
+    def lookup_similar(self, namespace: str, embedding, threshold: float,
+                       ttl: float, sample: bool = False) -> Optional[str]:
+        """Return the most similar recent completion above threshold, or None.
+        
+        With ``sample=True`` a random completion among all entries above the
+        threshold is returned instead, so a pool of sampled answers for
+        similar prompts is served with some variety.
+        """
+        cutoff = time.time() - ttl
+        with self._lock:
+            rows = self._get_conn().execute(
+                "SELECT embedding, content FROM completion_cache "
+                "WHERE namespace = ? AND ts >= ? AND embedding IS NOT NULL "
+                "ORDER BY ts DESC LIMIT ?",
+                (namespace, cutoff, self.max_candidates)
+            ).fetchall()
+        if not rows:
+            return None
+
+        import numpy as np
+        query = np.asarray(embedding, dtype=np.float32)
+        candidates = [
+            (np.frombuffer(row[0], dtype=np.float32), row[1]) for row in rows
+        ]
+        candidates = [(vec, content) for vec, content in candidates if vec.shape == query.shape]
+        if not candidates:
+            return None
+        scores = np.vstack([vec for vec, _ in candidates]) @ query
+        if sample:
+            matches = np.flatnonzero(scores >= threshold)
+            if not len(matches):
+                return None
+            return candidates[int(random.choice(matches))][1]
+        best = int(np.argmax(scores))
+        if scores[best] < threshold:
+            return None
+        return candidates[best][1]
+
+    def store(self, namespace: str, prompt_hash: str, embedding, content: str):
+        """Insert a completion under its namespace, hash and embedding."""
+        blob = None
+        if embedding is not None:
+            import numpy as np
+            blob = np.asarray(embedding, dtype=np.float32).tobytes()
+        ts = time.time()
+        with self._lock:
+            conn = self._get_conn()
+            conn.execute(
+                "INSERT INTO completion_cache "
+                "(namespace, prompt_hash, embedding, content, ts) VALUES (?, ?, ?, ?, ?)",
+                (namespace, prompt_hash, blob, content, ts)
+            )
+            conn.commit()
+            self._remember(prompt_hash, content, ts)
+
+
+_completion_cache = None
+_completion_cache_lock = threading.Lock()
+
+
+def get_completion_cache() -> CompletionCache:
+    """Return the process-wide completion cache."""
+    global _completion_cache
+    if _completion_cache is None:
+        with _completion_cache_lock:
+            if _completion_cache is None:
+                from config import Config
+                _completion_cache = CompletionCache(
+                    getattr(Config, 'DB_PATH_COMPLETION_CACHE', 'completion_cache.db'),
+                    max_candidates=getattr(Config, 'COMPLETION_CACHE_MAX_CANDIDATES', 200)
+                )
+    return _completion_cache
+
+
+def semantic_cache(threshold: float = 0.95, ttl: float = 3600,
+                   namespace: Optional[str] = None, idempotent: bool = False,
+                   sample: bool = False, exact: bool = False):
+    """Cache a chat completion helper by prompt similarity.
+
+    The decorated function must take keyword arguments ``model``,
+    ``messages`` and ``temperature`` and return the completion text.
+    An optional ``cache_key`` keyword names the text to embed; pass the
+    variable part of the prompt (resume, question + answer, ...) so long
+    shared templates don't drown out the difference between calls. It is
+    not forwarded to the wrapped function.
+
+    Exceptions from the wrapped call propagate and are never cached.
+    Pass ``no_cache=True`` to force a fresh call (the result is still stored).
+    Calls above CACHEABLE_MAX_TEMPERATURE bypass the cache entirely unless
+    the decorator is marked ``idempotent``.
+
+    Args:
+        threshold: Minimum cosine similarity for a near-duplicate hit
+        ttl: Maximum age of a reusable entry, in seconds
+        namespace: Cache namespace prefix (defaults to the function name)
+        idempotent: Reusing an earlier sampled answer is acceptable
+        sample: Serve a random near-duplicate above threshold instead of the
+            closest one (exact prompt repeats still get their own answer)
+        exact: Only reuse answers for byte-identical prompts (no embedding,
+            no near-duplicate lookup), for outputs that must reflect every
+            detail of a long input
+    """
+    def decorator(fn):
+        prefix = namespace or fn.__qualname__
+
+        @functools.wraps(fn)
+        def wrapper(*args, cache_key: Optional[str] = None, no_cache: bool = False, **kwargs):
+            temperature = kwargs.get('temperature')
+            if not idempotent and (temperature or 0) > CACHEABLE_MAX_TEMPERATURE:
+                return fn(*args, **kwargs)
+
+            ns = f"{prefix}|{kwargs.get('model')}|{temperature}"
+            prompt = json_dumps(kwargs.get('messages'), sort_keys=True)
+            prompt_hash = CompletionCache.make_hash(ns, prompt)
+
+            cache = get_completion_cache()
+            hit = None
+            if not no_cache:
+                # Exact repeats are answered before paying for an embedding
+                try:
+                    hit = cache.get_exact(prompt_hash, ttl)
+                except sqlite3.Error as e:
+                    print(f"⚠️ Completion cache lookup failed: {e}")
+            embedding = None
+            if hit is None and not exact:
+                embedding = cache.embed(cache_key or prompt)
+                if not no_cache and embedding is not None:
+                    try:
+                        hit = cache.lookup_similar(ns, embedding, threshold, ttl, sample=sample)
+                    except sqlite3.Error as e:
+                        print(f"⚠️ Completion cache lookup failed: {e}")
+            if hit is not None:
+                print(f"✅ Completion cache hit ({fn.__name__})")
+                return hit
+
+            content = fn(*args, **kwargs)
+            if content:
+                try:
+                    cache.store(ns, prompt_hash, embedding, content)
+                except sqlite3.Error as e:
+                    print(f"⚠️ Completion cache store failed: {e}")
+            return content
+        return wrapper
+    return decorator
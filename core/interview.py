@@ -2,22 +2,400 @@
 AI Interview business logic.
 
 This module provides core interview functionality:
-- Interview session initialization (returns state dict, no Streamlit dependency)
+- Interview session initialization and in-place reset (state dict, no Streamlit dependency)
 - Interview question generation (Azure OpenAI)
-- Answer evaluation (Azure OpenAI)
+- Answer evaluation (Azure OpenAI), singly or concurrently for rescoring
+- Answer evaluation fused with next-question generation (one call per turn)
+- Background prefetch of the next question during answer time
 - Final interview summary generation (Azure OpenAI)
+- Batched scoring of all answers plus summary in one call (Azure OpenAI)
 
 Note: UI rendering is handled in modules/ui/pages/ai_interview_page.py
 """
 
-from typing import Dict
+import re
+import json
+import random
+import difflib
+import functools
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
 
+from core.azure_client import get_azure_openai_client
+from core.completion_cache import semantic_cache
+from utils.json_utils import json_dumps, json_loads
 
-def initialize_interview_session(job_data: tuple) -> Dict:
+# Shared persona for every interview call. It leads the system message,
+# followed by the job/seeker context, so all calls in one interview send a
+# byte-identical prefix that Azure OpenAI's automatic prompt caching reuses.
+INTERVIEW_SYSTEM_PROMPT = (
+    "You are a recruitment interviewer and interview assessor: you ask "
+    "targeted questions, score answers objectively and summarize "
+    "performance with career advice."
+)
+
+QUESTION_ROLE = "Role: interviewer."
+EVALUATION_ROLE = "Role: answer assessor."
+SUMMARY_ROLE = "Role: career advisor."
+
+# Terse shared prompt fragments; strict schemas (where the API supports
+# them) enforce the JSON shape, the one-line shapes cover plain JSON mode.
+SCORE_CRITERIA = (
+    "Score 0-10 on: relevance/accuracy, professional knowledge, "
+    "communication/logic, fit with the position."
+)
+FEEDBACK_LENGTH = "Feedback: 2-3 sentences; each list item: one short sentence."
+SCORE_JSON = '{"score": 0-10, "feedback": str, "strengths": [str], "improvements": [str]}'
+EVALUATION_JSON = SCORE_JSON[:-1] + ', "confidence": 0.0-1.0}'
+SUMMARY_POINTS = (
+    "overall score (0-100), core strengths, improvement areas, fit for the "
+    "position, specific recommendations"
+)
+SUMMARY_JSON = (
+    '{"overall_score": 0-100, "summary": str, "key_strengths": [str], '
+    '"improvement_areas": [str], "job_fit": "High"|"Medium"|"Low", '
+    '"recommendations": [str]}'
+)
+
+# Static part of the single-answer scoring prompt. It precedes the question
+# and answer so consecutive evaluations share the longest possible prefix.
+EVALUATION_RUBRIC = f"""{EVALUATION_ROLE}
+Evaluate the answer below for the position above.
+{SCORE_CRITERIA}
+{FEEDBACK_LENGTH}
+Return JSON: {EVALUATION_JSON}
+"""
+
+# Static question instructions. Calls only join the short turn-specific
+# suffix onto these instead of re-formatting the whole prompt.
+_Q_OPENING_PROMPT = (
+    f"{QUESTION_ROLE}\n"
+    "Ask one interview question for the position above that tests core "
+    "abilities, experience and skills at a suitable difficulty (behavioral, "
+    "technical or situational). Return only the question.\n"
+)
+_Q_FOLLOWUP_PROMPT = (
+    f"{QUESTION_ROLE}\n"
+    "Ask one follow-up question for the position above that probes the "
+    "previous answer below, tests depth of thinking and ties to the "
+    "position's requirements. Return only the question.\n"
+    "\n【Previous Q&A】\nQuestion: "
+)
+_Q_ASKED_HEADER = "\n【Questions Already Asked】\n"
+_Q_ASKED_FOOTER = "\nAsk about a different aspect; do not repeat these.\n"
+
+# Output budgets: decode time grows with every generated token, but a
+# budget below the worst-case JSON truncates it and forces a retry. Sized
+# from the prompts' length limits: an evaluation is ~90 tokens of feedback
+# + 2 lists of ~3 one-sentence items (~25 each) + ~40 of keys/punctuation
+# (~280); a summary is ~120 of text + 3 lists of ~3 items + ~60 (~400).
+QUESTION_MAX_TOKENS = 150
+EVALUATION_MAX_TOKENS = 300
+SUMMARY_MAX_TOKENS = 600
+
+# Answers this short (in words and characters, so unspaced CJK text isn't
+# counted as one word), or near-copies of the question, get a canned low
+# score without an API call
+TRIVIAL_ANSWER_MIN_WORDS = 8
+TRIVIAL_ANSWER_MIN_CHARS = 40
+TRIVIAL_ANSWER_ECHO_RATIO = 0.8
+TRIVIAL_ANSWER_EVALUATION = json_dumps({
+    "score": 2,
+    "feedback": "Answer too brief to assess. Expand on your approach with a concrete example.",
+    "strengths": [],
+    "improvements": ["Provide more detail", "Use a specific example from your experience"],
+    "confidence": 1.0,
+})
+
+# Fixed sampling seed sent with temperature-0 calls (scoring/summaries) so
+# repeated requests return the same JSON as far as the service allows
+DETERMINISTIC_SEED = 42
+
+# Token budget for the job's required-skills field in the system prompt
+SKILLS_PROMPT_TOKENS = 120
+
+# Structured outputs (response_format json_schema) need this API version or
+# newer; older ones get plain JSON mode with the same prompts.
+STRUCTURED_OUTPUTS_MIN_API_VERSION = '2024-08-01'
+
+
+def _strict_schema(name: str, properties: Dict) -> Dict:
+    """json_schema response format entry requiring every listed property."""
+    return {
+        "name": name,
+        "strict": True,
+        "schema": _strict_object(properties),
+    }
+
+
+def _strict_object(properties: Dict) -> Dict:
+    return {
+        "type": "object",
+        "properties": properties,
+        "required": list(properties),
+        "additionalProperties": False,
+    }
+
+
+_STRING_LIST = {"type": "array", "items": {"type": "string"}}
+_SCORE_PROPERTIES = {
+    "score": {"type": "number"},
+    "feedback": {"type": "string"},
+    "strengths": _STRING_LIST,
+    "improvements": _STRING_LIST,
+}
+_EVALUATION_PROPERTIES = dict(_SCORE_PROPERTIES, confidence={"type": "number"})
+_SUMMARY_PROPERTIES = {
+    "overall_score": {"type": "number"},
+    "summary": {"type": "string"},
+    "key_strengths": _STRING_LIST,
+    "improvement_areas": _STRING_LIST,
+    "job_fit": {"type": "string", "enum": ["High", "Medium", "Low"]},
+    "recommendations": _STRING_LIST,
+}
+_SCORES_LIST = {"type": "array", "items": _strict_object(_SCORE_PROPERTIES)}
+
+EVALUATION_SCHEMA = _strict_schema("interview_evaluation", _EVALUATION_PROPERTIES)
+TURN_SCHEMA = _strict_schema("interview_turn", {
+    "evaluation": _strict_object(_EVALUATION_PROPERTIES),
+    "next_question": {"type": "string"},
+})
+SUMMARY_SCHEMA = _strict_schema("interview_summary", _SUMMARY_PROPERTIES)
+BATCH_SCHEMA = _strict_schema("interview_batch", {
+    "scores": _SCORES_LIST,
+    "summary": _strict_object(_SUMMARY_PROPERTIES),
+})
+RESCORE_SCHEMA = _strict_schema("interview_rescore", {"scores": _SCORES_LIST})
+
+_tiktoken_encoding = None
+
+
+def _get_tiktoken_encoding():
+    """Lazy load tiktoken cl100k_base encoding."""
+    global _tiktoken_encoding
+    if _tiktoken_encoding is None:
+        import tiktoken
+        _tiktoken_encoding = tiktoken.get_encoding("cl100k_base")
+    return _tiktoken_encoding
+
+
+def summarize_skills(text: str, budget_tokens: int = SKILLS_PROMPT_TOKENS) -> str:
+    """Keep the leading skills of a requirements string within a token budget.
+    
+    Whole comma/semicolon/newline-separated skills are kept in order until
+    the budget is reached; a single oversized entry is cut at the budget.
+    Falls back to ~4 characters per token without tiktoken.
+    
+    Args:
+        text: Raw required-skills text
+        budget_tokens: Maximum tokens to keep
+        
+    Returns:
+        Trimmed skills string (unchanged when already within budget)
+    """
+    if not text:
+        return text
+    try:
+        encoding = _get_tiktoken_encoding()
+    except Exception:
+        encoding = None
+
+    def count(piece: str) -> int:
+        if encoding is not None:
+            return len(encoding.encode(piece))
+        return (len(piece) + 3) // 4
+
+    if count(text) <= budget_tokens:
+        return text
+
+    skills = [s.strip() for s in re.split(r"[,;\n]", text) if s.strip()]
+    kept, used = [], 0
+    for skill in skills:
+        cost = count(skill) + 1  # separator
+        if used + cost > budget_tokens:
+            break
+        kept.append(skill)
+        used += cost
+    if kept:
+        return ", ".join(kept)
+    if encoding is not None:
+        return encoding.decode(encoding.encode(skills[0])[:budget_tokens])
+    return skills[0][:budget_tokens * 4]
+
+
+def _get_client(endpoint: str, api_key: str, api_version: str):
+    """Return the shared, pooled AzureOpenAI client for these credentials."""
+    return get_azure_openai_client(endpoint, api_key, api_version)
+
+
+def _configured_client(config=None):
+    """Resolve the config and return ``(config, client, error_msg)``.
+    
+    The credential check and the shared client lookup run once per public
+    call instead of being repeated inline; ``error_msg`` is None when
+    credentials are configured, otherwise ``client`` is None.
+    """
+    if config is None:
+        from config import Config
+        config = Config
+    is_configured, error_msg = config.check_azure_credentials()
+    if not is_configured:
+        return config, None, error_msg or "Azure OpenAI is not configured"
+    return config, _get_client(config.AZURE_ENDPOINT, config.AZURE_API_KEY,
+                               config.AZURE_API_VERSION), None
+
+
+def _log_prompt_cache_usage(response):
+    """Report how much of the prompt Azure served from its prefix cache."""
+    usage = getattr(response, 'usage', None)
+    details = getattr(usage, 'prompt_tokens_details', None)
+    cached = getattr(details, 'cached_tokens', None)
+    if cached is not None:
+        print(f"ℹ️ Prompt cache: {cached}/{usage.prompt_tokens} prompt tokens cached")
+
+
+def _warn_if_truncated(choice, max_tokens: int):
+    """Report a completion cut off by its output budget (its JSON won't parse)."""
+    if getattr(choice, 'finish_reason', None) == 'length':
+        print(f"⚠️ Completion hit max_tokens={max_tokens}; output is truncated")
+
+
+def _response_format(client, json_mode: Union[bool, Dict]) -> Optional[Dict]:
+    """response_format for a JSON call: strict schema when the API supports it."""
+    if not json_mode:
+        return None
+    if isinstance(json_mode, dict):
+        api_version = (getattr(client, 'default_query', None) or {}).get('api-version') or ''
+        if api_version[:10] >= STRUCTURED_OUTPUTS_MIN_API_VERSION:
+            return {"type": "json_schema", "json_schema": json_mode}
+    return {"type": "json_object"}
+
+
+def _chat_completion(client, *, model: str, messages: list,
+                     temperature: float, max_tokens: int,
+                     json_mode: Union[bool, Dict] = False,
+                     on_token: Optional[Callable[[str], None]] = None) -> str:
+    """Run one chat completion and return the stripped message text.
+    
+    ``json_mode`` requests ``response_format={"type": "json_object"}`` so
+    the reply is always a parseable JSON object (the prompt must ask for
+    JSON). Passing a json_schema entry (e.g. EVALUATION_SCHEMA) instead
+    enforces that exact shape on API versions with structured outputs.
+    Temperature-0 calls also send DETERMINISTIC_SEED. With ``on_token`` the
+    completion is streamed and each text delta is passed to it as it
+    arrives; the full text is still returned (and cached) at the end.
+    Cache hits return without calling ``on_token``.
+    """
+    response_format = _response_format(client, json_mode)
+    extra = {"response_format": response_format} if response_format else {}
+    if temperature == 0:
+        extra["seed"] = DETERMINISTIC_SEED
+    if on_token is None:
+        response = client.chat.completions.create(
+            model=model,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            **extra
+        )
+        _log_prompt_cache_usage(response)
+        _warn_if_truncated(response.choices[0], max_tokens)
+        return response.choices[0].message.content.strip()
+
+    stream = client.chat.completions.create(
+        model=model,
+        messages=messages,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        stream=True,
+        **extra
+    )
+    parts = []
+    for chunk in stream:
+        # Azure sends a leading chunk with no choices (content filter results)
+        if not chunk.choices:
+            continue
+        delta = chunk.choices[0].delta.content
+        if delta:
+            parts.append(delta)
+            on_token(delta)
+        _warn_if_truncated(chunk.choices[0], max_tokens)
+    return "".join(parts).strip()
+
+
+# Opening questions are sampled (t=0.8) but reusable across seekers and
+# similar postings ("Sr. Backend Dev - Finance" ~ "Senior Backend Engineer -
+# Fintech"): they are generated from a job-only prompt (no seeker details,
+# so nothing personal is shared between candidates), keyed on the job's
+# title/industry/seniority, and a random stored question above the
+# threshold is served. A QUESTION_SEED_REFRESH_RATE share of calls skips
+# the lookup and adds a fresh question to the pool, so it grows beyond one
+# question per job cluster. Bump the version to invalidate the pool after
+# prompt changes.
+QUESTION_SEED_CACHE_VERSION = 2
+QUESTION_SEED_THRESHOLD = 0.9
+QUESTION_SEED_TTL = 7 * 24 * 3600
+QUESTION_SEED_REFRESH_RATE = 0.3
+
+# Per-call-site caches for scoring and summaries, exact prompt matches only:
+# the embedding model only sees the first ~256 word pieces, so two answers or
+# interviews differing further down would otherwise share scores. Scoring
+# runs at t=0 in JSON mode, so identical Q&A replays (reruns, repeated
+# practice on the same job) are answered from the cache for a day.
+INTERVIEW_CACHE_TTL = 24 * 3600
+
+_question_completion = semantic_cache(
+    threshold=QUESTION_SEED_THRESHOLD, ttl=QUESTION_SEED_TTL,
+    namespace=f'interview_q_seed_v{QUESTION_SEED_CACHE_VERSION}',
+    idempotent=True, sample=True
+)(_chat_completion)
+_evaluation_completion = semantic_cache(
+    ttl=INTERVIEW_CACHE_TTL, namespace='interview_evaluation', exact=True
+)(_chat_completion)
+_summary_completion = semantic_cache(
+    ttl=INTERVIEW_CACHE_TTL, namespace='interview_summary', exact=True
+)(_chat_completion)
+_batch_completion = semantic_cache(
+    ttl=INTERVIEW_CACHE_TTL, namespace='interview_batch', exact=True
+)(_chat_completion)
+_turn_completion = semantic_cache(
+    ttl=INTERVIEW_CACHE_TTL, namespace='interview_turn', exact=True
+)(_chat_completion)
+_rescore_completion = semantic_cache(
+    ttl=INTERVIEW_CACHE_TTL, namespace='interview_rescore', exact=True
+)(_chat_completion)
+
+
+def _interview_model(config, tier: str) -> str:
+    """Return the deployment for an interview call tier.
+    
+    'fast' serves questions and per-answer scoring; 'quality' serves
+    summaries and low-confidence re-scoring. Both fall back to the main
+    deployment when not configured separately.
+    """
+    name = 'INTERVIEW_FAST_MODEL' if tier == 'fast' else 'INTERVIEW_QUALITY_MODEL'
+    return getattr(config, name, None) or config.AZURE_OPENAI_DEPLOYMENT or "gpt-4o-mini"
+
+
+def _evaluation_confidence(evaluation: str) -> float:
+    """Self-reported confidence of an evaluation (1.0 if absent, 0.0 if unparseable)."""
+    try:
+        data = json_loads(evaluation)
+        return float(data.get('confidence', 1.0))
+    except (json.JSONDecodeError, TypeError, ValueError, AttributeError):
+        return 0.0
+
+
+def initialize_interview_session(job_data: tuple, seeker_profile: tuple = None) -> Dict:
     """Create initial interview session state.
     
+    The interview's system prompt is built once here ('ctx_system') and
+    passed to every LLM helper, so the session reuses one string object.
+    
     Args:
         job_data: Tuple of job fields from database query
+        seeker_profile: Optional tuple of seeker fields from database
         
     Returns:
         Dictionary containing initial interview state
@@ -31,136 +409,200 @@ def initialize_interview_session(job_data: tuple) -> Dict:
         'questions': [],
         'answers': [],
         'scores': [],
+        'pending': [],  # {'q', 'a'} pairs awaiting evaluate_and_summarize
+        'prefetched': {},  # question number -> Future from prefetch_interview_question
         'completed': False,
-        'summary': None
+        'summary': None,
+        'ctx_system': build_interview_context(
+            tuple(job_data), tuple(seeker_profile) if seeker_profile else None
+        )
     }
 
 
+def reset_interview_session(interview_data: Dict) -> Dict:
+    """Clear an interview's progress in place for a restart.
+    
+    Keeps the job fields and the prebuilt 'ctx_system' so a restart
+    doesn't rebuild the session; queued question prefetches are cancelled.
+    
+    Args:
+        interview_data: Interview state dict from initialize_interview_session
+        
+    Returns:
+        The same dict, reset
+    """
+    for future in interview_data.get('prefetched', {}).values():
+        future.cancel()
+    interview_data.update({
+        'current_question': 0,
+        'questions': [],
+        'answers': [],
+        'scores': [],
+        'pending': [],
+        'prefetched': {},
+        'completed': False,
+        'summary': None
+    })
+    return interview_data
+
+
+@functools.lru_cache(maxsize=64)
+def build_interview_context(job_data: tuple, seeker_profile: tuple = None) -> str:
+    """Build the stable system prompt for one interview.
+    
+    Depends only on the job and seeker tuples and uses fixed formatting, so
+    every question/evaluation/summary call for the same interview sends the
+    same leading bytes (the cacheable prefix). Turn-specific text belongs in
+    the user message. Required skills are trimmed to SKILLS_PROMPT_TOKENS.
+    
+    Args:
+        job_data: Tuple of job fields from database
+        seeker_profile: Optional tuple of seeker fields from database
+        
+    Returns:
+        System message content
+    """
+    parts = [
+        INTERVIEW_SYSTEM_PROMPT,
+        "",
+        "【Position Information】",
+        f"Position Title: {job_data[1]}",
+        f"Company: {job_data[5]}",
+        f"Industry: {job_data[6]}",
+        f"Experience Requirement: {job_data[7]}",
+        f"Job Description: {job_data[2]}",
+        f"Main Responsibilities: {job_data[3]}",
+        f"Required Skills: {summarize_skills(job_data[4])}",
+    ]
+    if seeker_profile:
+        parts += [
+            "",
+            "【Job Seeker Information】",
+            f"- Education: {seeker_profile[0]}",
+            f"- Experience: {seeker_profile[1]}",
+            f"- Hard Skills: {seeker_profile[2]}",
+            f"- Soft Skills: {seeker_profile[3]}",
+            f"- Project Experience: {seeker_profile[4]}",
+        ]
+    return "\n".join(parts)
+
+
+def _question_seed_key(job_data: tuple) -> str:
+    """Text that opening questions are cached under: title, industry, seniority."""
+    return " ".join(str(job_data[i] or "").strip() for i in (1, 6, 7)).strip()
+
+
+def _interview_messages(job_data: tuple, seeker_profile, user_content: str,
+                        context: str = None) -> list:
+    """Stable context as the system message, turn-specific text as the user message.
+    
+    ``context`` is a prebuilt build_interview_context() result (the session's
+    'ctx_system'); it is only rebuilt from the tuples when not supplied.
+    
+    Each call is self-contained rather than chained server-side (Responses
+    API ``previous_response_id``): prefetched and concurrent calls, and the
+    completion cache, need requests that don't depend on an earlier
+    response. The resent context is the byte-identical prefix Azure caches.
+    """
+    if context is None:
+        context = build_interview_context(
+            tuple(job_data), tuple(seeker_profile) if seeker_profile else None
+        )
+    return [
+        {"role": "system", "content": context},
+        {"role": "user", "content": user_content},
+    ]
+
+
 def generate_interview_question(job_data: tuple, seeker_profile: tuple, 
-                                 previous_qa: Dict = None, config=None) -> str:
+                                 previous_qa: Dict = None, config=None,
+                                 asked_questions: Sequence[str] = None,
+                                 context: str = None,
+                                 on_token: Optional[Callable[[str], None]] = None) -> str:
     """Generate interview questions using Azure OpenAI.
     
     Args:
         job_data: Tuple of job fields from database
-        seeker_profile: Tuple of seeker fields from database
+        seeker_profile: Tuple of seeker fields from database (used for
+            follow-ups; opening questions are shared and job-only)
         previous_qa: Optional dict with 'question' and 'answer' keys for follow-up
         config: Optional config object
+        asked_questions: Optional questions already asked; a new, different
+            question is generated (bypassing the completion cache)
+        context: Optional prebuilt system prompt (interview['ctx_system'])
+        on_token: Optional callback receiving streamed text deltas
         
     Returns:
         Generated interview question string, or error message
     """
     try:
-        if config is None:
-            from config import Config
-            config = Config
-        
-        # Check if API keys are configured
-        is_configured, error_msg = config.check_azure_credentials()
-        if not is_configured:
+        config, client, error_msg = _configured_client(config)
+        if error_msg is not None:
             return f"Error: {error_msg}"
-        
-        from openai import AzureOpenAI
-        
-        # Clean endpoint to prevent double /openai path issues
-        endpoint = config.AZURE_ENDPOINT
-        if endpoint:
-            endpoint = endpoint.rstrip('/')
-            if endpoint.endswith('/openai'):
-                endpoint = endpoint[:-7]
-        
-        client = AzureOpenAI(
-            azure_endpoint=endpoint,
-            api_key=config.AZURE_API_KEY,
-            api_version=config.AZURE_API_VERSION
-        )
 
-        # Prepare position information
-        job_info = f"""
-Position Title: {job_data[1]}
-Company: {job_data[5]}
-Industry: {job_data[6]}
-Experience Requirement: {job_data[7]}
-Job Description: {job_data[2]}
-Main Responsibilities: {job_data[3]}
-Required Skills: {job_data[4]}
-        """
-
-        # Prepare job seeker information
-        seeker_info = ""
-        if seeker_profile:
-            seeker_info = f"""
-Job Seeker Background:
-- Education: {seeker_profile[0]}
-- Experience: {seeker_profile[1]}
-- Hard Skills: {seeker_profile[2]}
-- Soft Skills: {seeker_profile[3]}
-- Project Experience: {seeker_profile[4]}
-            """
-
-        # Build prompt
+        # Build prompt (position/seeker details are in the system context)
         if previous_qa:
-            prompt = f"""
-As a professional interviewer, please continue the interview based on the following information:
-
-【Position Information】
-{job_info}
-
-【Job Seeker Information】
-{seeker_info}
-
-【Previous Q&A】
-Question: {previous_qa['question']}
-Answer: {previous_qa['answer']}
-
-Based on the job seeker's previous answer, please ask a relevant follow-up question. The question should:
-1. Deeply explore key points from the previous answer
-2. Assess the job seeker's thinking depth and professional abilities
-3. Be closely related to position requirements
-
-Please only return the question content, without additional explanations.
-            """
+            parts = [_Q_FOLLOWUP_PROMPT, previous_qa['question'],
+                     "\nAnswer: ", previous_qa['answer'], "\n"]
         else:
-            prompt = f"""
-As a professional interviewer, please design an interview question for the following position:
+            parts = [_Q_OPENING_PROMPT]
+        if asked_questions:
+            parts.append(_Q_ASKED_HEADER)
+            parts.append("\n".join(f"- {q}" for q in asked_questions))
+            parts.append(_Q_ASKED_FOOTER)
+        prompt = "".join(parts)
 
-【Position Information】
-{job_info}
+        request = dict(
+            model=_interview_model(config, 'fast'),
+            temperature=0.8,
+            max_tokens=QUESTION_MAX_TOKENS,
+            on_token=on_token
+        )
+        # Only opening questions are reused; a cached follow-up or a cached
+        # "different" question would repeat an earlier one, so those skip
+        # the cache (and its embedding) entirely
+        if previous_qa or asked_questions:
+            request['messages'] = _interview_messages(job_data, seeker_profile, prompt, context)
+            return _chat_completion(client, **request)
+        # Shared across seekers: job-only context, never the session's
+        request['messages'] = _interview_messages(job_data, None, prompt)
+        return _question_completion(
+            client, cache_key=_question_seed_key(job_data),
+            no_cache=random.random() < QUESTION_SEED_REFRESH_RATE, **request
+        )
 
-【Job Seeker Information】
-{seeker_info}
+    except Exception as e:
+        return f"AI question generation failed: {str(e)}"
 
-Please ask a professional interview question that should:
-1. Assess core abilities related to the position
-2. Examine the job seeker's experience and skills
-3. Have appropriate challenge level
-4. Can be behavioral, technical, or situational questions
 
-Please only return the question content, without additional explanations.
-            """
+def _evaluation_request(question: str, answer: str, job_data: tuple,
+                        seeker_profile, context: str = None) -> Dict:
+    """Completion kwargs (minus model) for scoring one answer."""
+    prompt = "".join((EVALUATION_RUBRIC, "【Interview Question】\n", question,
+                      "\n\n【Job Seeker Answer】\n", answer, "\n"))
 
-        response = client.chat.completions.create(
-            model=config.AZURE_OPENAI_DEPLOYMENT or "gpt-4o-mini",
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are a professional recruitment interviewer, skilled at asking targeted interview questions to assess candidates' abilities and suitability."
-                },
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            temperature=0.8,
-            max_tokens=500
-        )
+    return dict(
+        messages=_interview_messages(job_data, seeker_profile, prompt, context),
+        temperature=0,
+        json_mode=EVALUATION_SCHEMA,
+        max_tokens=EVALUATION_MAX_TOKENS
+    )
 
-        return response.choices[0].message.content.strip()
 
-    except Exception as e:
-        return f"AI question generation failed: {str(e)}"
+def _screen_answer(question: str, answer: str) -> Optional[str]:
+    """Return the canned evaluation for an empty, very short or echoed answer."""
+    text = (answer or "").strip()
+    if len(text.split()) < TRIVIAL_ANSWER_MIN_WORDS and len(text) < TRIVIAL_ANSWER_MIN_CHARS:
+        return TRIVIAL_ANSWER_EVALUATION
+    ratio = difflib.SequenceMatcher(None, (question or "").lower(), text.lower()).ratio()
+    if ratio > TRIVIAL_ANSWER_ECHO_RATIO:
+        return TRIVIAL_ANSWER_EVALUATION
+    return None
 
 
-def evaluate_answer(question: str, answer: str, job_data: tuple, config=None) -> str:
+def evaluate_answer(question: str, answer: str, job_data: tuple, config=None,
+                    seeker_profile: tuple = None, context: str = None,
+                    on_token: Optional[Callable[[str], None]] = None) -> str:
     """Evaluate job seeker's answer.
     
     Args:
@@ -168,182 +610,445 @@ def evaluate_answer(question: str, answer: str, job_data: tuple, config=None) ->
         answer: The job seeker's answer
         job_data: Tuple of job fields from database
         config: Optional config object
+        seeker_profile: Optional seeker tuple; pass the same one used for
+            question generation so the calls share a cached prompt prefix
+        context: Optional prebuilt system prompt (interview['ctx_system'])
+        on_token: Optional callback receiving streamed JSON text deltas of
+            the first scoring pass (a quality re-score is not streamed)
         
     Returns:
-        JSON string with evaluation results
+        JSON string with evaluation results (trivial answers are scored
+        locally with TRIVIAL_ANSWER_EVALUATION)
     """
+    screened = _screen_answer(question, answer)
+    if screened is not None:
+        return screened
+
     try:
-        if config is None:
-            from config import Config
-            config = Config
-        
-        # Check if API keys are configured
-        is_configured, error_msg = config.check_azure_credentials()
-        if not is_configured:
+        config, client, error_msg = _configured_client(config)
+        if error_msg is not None:
             return f'{{"error": "{error_msg}"}}'
+
+        fast_model = _interview_model(config, 'fast')
+        quality_model = _interview_model(config, 'quality')
+        request = _evaluation_request(question, answer, job_data, seeker_profile, context)
+        evaluation = _evaluation_completion(client, model=fast_model, on_token=on_token, **request)
+        threshold = getattr(config, 'INTERVIEW_ESCALATION_CONFIDENCE', 0.6)
+        if quality_model != fast_model and _evaluation_confidence(evaluation) < threshold:
+            print(f"ℹ️ Low-confidence evaluation from {fast_model}, re-scoring with {quality_model}")
+            evaluation = _evaluation_completion(client, model=quality_model, **request)
+        return evaluation
+
+    except Exception as e:
+        return f'{{"error": "Evaluation failed: {str(e)}"}}'
+
+
+def evaluate_answers(qa_pairs: Sequence[Tuple[str, str]], job_data: tuple,
+                     config=None, max_workers: int = 4,
+                     seeker_profile: tuple = None) -> List[str]:
+    """Evaluate several answers concurrently (e.g. rescoring a past interview).
+    
+    Each evaluation is an independent API call, so they run on a small
+    thread pool over the shared client; wall time is roughly the slowest
+    single call instead of the sum. Threads rather than an async client
+    keep every call going through the (synchronous) completion cache and
+    the same pooled connections as the rest of the interview.
+    
+    Args:
+        qa_pairs: Sequence of (question, answer) tuples
+        job_data: Tuple of job fields from database
+        config: Optional config object
+        max_workers: Maximum concurrent evaluation requests
+        seeker_profile: Optional seeker tuple (shares the cached prompt prefix)
         
-        from openai import AzureOpenAI
+    Returns:
+        List of evaluation JSON strings, in the same order as qa_pairs
+    """
+    if not qa_pairs:
+        return []
+    if len(qa_pairs) == 1:
+        question, answer = qa_pairs[0]
+        return [evaluate_answer(question, answer, job_data, config, seeker_profile)]
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(qa_pairs))) as pool:
+        return list(pool.map(
+            lambda qa: evaluate_answer(qa[0], qa[1], job_data, config, seeker_profile),
+            qa_pairs
+        ))
+
+
+def evaluate_answers_batch(qa_pairs: Sequence[Tuple[str, str]], job_data: tuple,
+                           config=None, seeker_profile: tuple = None) -> List[str]:
+    """Score several answers with one request (e.g. rescoring a past interview).
+    
+    Sends all Q&A pairs in a single JSON-mode completion instead of one
+    evaluate_answer call each: the shared context and rubric are uploaded
+    once. Trivial answers are scored locally and left out of the request.
+    Items the reply leaves out (or a reply that can't be parsed) are
+    scored individually with evaluate_answers, so the result always has one
+    entry per pair.
+    
+    Args:
+        qa_pairs: Sequence of (question, answer) tuples
+        job_data: Tuple of job fields from database
+        config: Optional config object
+        seeker_profile: Optional seeker tuple (shares the cached prompt prefix)
         
-        # Clean endpoint to prevent double /openai path issues
-        endpoint = config.AZURE_ENDPOINT
-        if endpoint:
-            endpoint = endpoint.rstrip('/')
-            if endpoint.endswith('/openai'):
-                endpoint = endpoint[:-7]
+    Returns:
+        List of evaluation JSON strings, in the same order as qa_pairs
+    """
+    screened = [_screen_answer(q, a) for q, a in qa_pairs]
+    pending = [i for i, evaluation in enumerate(screened) if evaluation is None]
+    if len(pending) < len(qa_pairs):
+        scored = evaluate_answers_batch([qa_pairs[i] for i in pending], job_data,
+                                        config, seeker_profile) if pending else []
+        for i, evaluation in zip(pending, scored):
+            screened[i] = evaluation
+        return screened
+    if len(qa_pairs) < 2:
+        return evaluate_answers(qa_pairs, job_data, config, seeker_profile=seeker_profile)
+    
+    try:
+        config, client, error_msg = _configured_client(config)
+        if error_msg is not None:
+            return [f'{{"error": "{error_msg}"}}'] * len(qa_pairs)
+
+        qa_json = json_dumps([{"q": q, "a": a} for q, a in qa_pairs], indent=True)
+        prompt = f"""{EVALUATION_ROLE}
+Evaluate each answer in the records below, in order, for the position above.
+{SCORE_CRITERIA}
+{FEEDBACK_LENGTH}
+Return JSON with one "scores" entry per record: {{"scores": [{SCORE_JSON}]}}
+
+【Interview Q&A Records】 ({len(qa_pairs)} records; "q" is the question, "a" is the answer)
+{qa_json}
+"""
+
+        result = _rescore_completion(
+            client,
+            model=_interview_model(config, 'fast'),
+            messages=_interview_messages(job_data, seeker_profile, prompt),
+            temperature=0,
+            json_mode=RESCORE_SCHEMA,
+            max_tokens=EVALUATION_MAX_TOKENS * len(qa_pairs)
+        )
+        scores = json_loads(result).get('scores') or []
+    except Exception as e:
+        print(f"⚠️ Batched evaluation failed, scoring answers individually: {e}")
+        scores = []
+
+    evaluations = [
+        json_dumps(score) if isinstance(score, dict) and 'score' in score else None
+        for score in scores[:len(qa_pairs)]
+    ]
+    evaluations += [None] * (len(qa_pairs) - len(evaluations))
+    missing = [i for i, evaluation in enumerate(evaluations) if evaluation is None]
+    if missing:
+        retried = evaluate_answers([qa_pairs[i] for i in missing], job_data, config,
+                                   seeker_profile=seeker_profile)
+        for i, evaluation in zip(missing, retried):
+            evaluations[i] = evaluation
+    return evaluations
+
+
+_prefetch_pool = None
+_prefetch_pool_lock = threading.Lock()
+
+
+def prefetch_interview_question(job_data: tuple, seeker_profile: tuple,
+                                asked_questions: Sequence[str], config=None,
+                                context: str = None) -> Future:
+    """Start generating the next question in the background.
+    
+    Meant to run while the candidate is still reading and answering the
+    current question, so the request is hidden under their think time. The
+    question does not depend on the pending answer; callers should fall
+    back to a regular follow-up when the answer warrants one.
+    
+    Args:
+        job_data: Tuple of job fields from database
+        seeker_profile: Tuple of seeker fields from database
+        asked_questions: Questions asked so far (the new one must differ)
+        config: Optional config object
+        context: Optional prebuilt system prompt (interview['ctx_system'])
         
-        client = AzureOpenAI(
-            azure_endpoint=endpoint,
-            api_key=config.AZURE_API_KEY,
-            api_version=config.AZURE_API_VERSION
+    Returns:
+        Future resolving to the generate_interview_question result
+    """
+    global _prefetch_pool
+    if _prefetch_pool is None:
+        with _prefetch_pool_lock:
+            if _prefetch_pool is None:
+                _prefetch_pool = ThreadPoolExecutor(
+                    max_workers=2, thread_name_prefix="interview-prefetch"
+                )
+    return _prefetch_pool.submit(
+        generate_interview_question, job_data, seeker_profile, None, config,
+        tuple(asked_questions), context
+    )
+
+
+def evaluate_and_generate_next(question: str, answer: str, job_data: tuple,
+                               seeker_profile: tuple, config=None,
+                               context: str = None,
+                               on_token: Optional[Callable[[str], None]] = None) -> Tuple[str, str]:
+    """Evaluate an answer and generate the follow-up question in one request.
+    
+    Both outputs depend on the same context and Q&A, so a single JSON-mode
+    completion returns them together: one prompt upload and one round-trip
+    per turn. A low-confidence evaluation is re-scored on the quality
+    deployment as in evaluate_answer; an unusable reply falls back to the
+    two separate calls.
+    
+    Args:
+        question: The interview question asked
+        answer: The job seeker's answer
+        job_data: Tuple of job fields from database
+        seeker_profile: Tuple of seeker fields from database
+        config: Optional config object
+        context: Optional prebuilt system prompt (interview['ctx_system'])
+        on_token: Optional callback receiving streamed JSON text deltas of
+            the fused call (fallback calls are not streamed)
+        
+    Returns:
+        Tuple of (evaluation JSON string, next question string)
+    """
+    screened = _screen_answer(question, answer)
+    if screened is not None:
+        # Nothing to score; only the follow-up question needs the API
+        return screened, generate_interview_question(
+            job_data, seeker_profile, {'question': question, 'answer': answer},
+            config=config, context=context
         )
 
-        prompt = f"""
-Please evaluate the following interview answer:
+    try:
+        config, client, error_msg = _configured_client(config)
+        if error_msg is not None:
+            return f'{{"error": "{error_msg}"}}', f"Error: {error_msg}"
 
-【Position Information】
-Position: {job_data[1]}
-Company: {job_data[5]}
-Requirements: {job_data[4]}
+        prompt = f"""{EVALUATION_ROLE} {QUESTION_ROLE}
+Evaluate the answer below for the position above, then ask one follow-up question that probes it, tests depth of thinking and ties to the position's requirements.
+{SCORE_CRITERIA}
+{FEEDBACK_LENGTH}
+Return JSON: {{"evaluation": {EVALUATION_JSON}, "next_question": str (the question only)}}
 
 【Interview Question】
 {question}
 
 【Job Seeker Answer】
 {answer}
+"""
 
-Please evaluate and provide scores (0-10 points) from the following dimensions:
-1. Relevance and accuracy of the answer
-2. Professional knowledge and skills demonstrated
-3. Communication expression and logic
-4. Match with position requirements
-
-Please return evaluation results in the following JSON format:
-{{
-    "score": score,
-    "feedback": "Specific feedback and suggestions",
-    "strengths": ["Strength1", "Strength2"],
-    "improvements": ["Improvement suggestion1", "Improvement suggestion2"]
-}}
-        """
-
-        response = client.chat.completions.create(
-            model=config.AZURE_OPENAI_DEPLOYMENT or "gpt-4o-mini",
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are a professional interview evaluation expert, capable of objectively assessing the quality of interview answers."
-                },
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            temperature=0.7,
-            max_tokens=800
+        fast_model = _interview_model(config, 'fast')
+        result = _turn_completion(
+            client,
+            model=fast_model,
+            messages=_interview_messages(job_data, seeker_profile, prompt, context),
+            temperature=0.3,
+            json_mode=TURN_SCHEMA,
+            max_tokens=EVALUATION_MAX_TOKENS + QUESTION_MAX_TOKENS,
+            on_token=on_token
         )
+        data = json_loads(result)
+        evaluation_data = data.get('evaluation')
+        next_question = str(data.get('next_question') or '').strip()
+        if not isinstance(evaluation_data, dict) or not next_question:
+            raise ValueError("missing evaluation or next_question")
+    except Exception as e:
+        print(f"⚠️ Combined evaluation/question call failed ({e}), using separate calls")
+        previous_qa = {'question': question, 'answer': answer}
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            evaluation = pool.submit(evaluate_answer, question, answer, job_data,
+                                     config, seeker_profile, context)
+            next_question = pool.submit(generate_interview_question, job_data,
+                                        seeker_profile, previous_qa, config,
+                                        None, context)
+            return evaluation.result(), next_question.result()
 
-        return response.choices[0].message.content.strip()
+    evaluation = json_dumps(evaluation_data)
+    quality_model = _interview_model(config, 'quality')
+    threshold = getattr(config, 'INTERVIEW_ESCALATION_CONFIDENCE', 0.6)
+    if quality_model != fast_model and _evaluation_confidence(evaluation) < threshold:
+        print(f"ℹ️ Low-confidence evaluation from {fast_model}, re-scoring with {quality_model}")
+        try:
+            evaluation = _evaluation_completion(
+                client, model=quality_model,
+                **_evaluation_request(question, answer, job_data, seeker_profile, context)
+            )
+        except Exception as e:
+            print(f"⚠️ Re-scoring failed, keeping the first evaluation: {e}")
+    return evaluation, next_question
 
-    except Exception as e:
-        return f'{{"error": "Evaluation failed: {str(e)}"}}'
+
+def _canonical_score(value) -> object:
+    """Normalize a score to one representation (8, 8.0 and "8" -> 8)."""
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return str(value).strip() if value not in (None, '') else 'N/A'
+    return int(number) if number.is_integer() else round(number, 1)
+
+
+def _summary_records(interview_data: Dict) -> List[Dict]:
+    """Q&A records for the summary prompt, reduced to stable fields.
+    
+    Only question, answer, score and feedback are kept (no timestamps,
+    confidence or other per-run metadata), strings are stripped and
+    scores share one type, so replaying an interview yields the same text.
+    """
+    return [
+        {
+            "n": i + 1,
+            "question": str(q).strip(),
+            "answer": str(a).strip(),
+            "score": _canonical_score((score_data or {}).get('score')),
+            "feedback": str((score_data or {}).get('feedback') or '').strip(),
+        }
+        for i, (q, a, score_data) in enumerate(zip(
+            interview_data['questions'],
+            interview_data['answers'],
+            interview_data['scores']
+        ))
+    ]
 
 
-def generate_final_summary(interview_data: Dict, job_data: tuple, config=None) -> str:
+def generate_final_summary(interview_data: Dict, job_data: tuple, config=None,
+                           seeker_profile: tuple = None,
+                           on_token: Optional[Callable[[str], None]] = None) -> str:
     """Generate final interview summary.
     
     Args:
         interview_data: Dictionary with 'questions', 'answers', 'scores' keys
         job_data: Tuple of job fields from database
         config: Optional config object
+        seeker_profile: Optional seeker tuple (shares the cached prompt prefix)
+        on_token: Optional callback receiving streamed JSON text deltas
         
     Returns:
         JSON string with summary results
     """
     try:
-        if config is None:
-            from config import Config
-            config = Config
-        
-        # Check if API keys are configured
-        is_configured, error_msg = config.check_azure_credentials()
-        if not is_configured:
+        config, client, error_msg = _configured_client(config)
+        if error_msg is not None:
             return f'{{"error": "{error_msg}"}}'
-        
-        from openai import AzureOpenAI
-        
-        # Clean endpoint to prevent double /openai path issues
-        endpoint = config.AZURE_ENDPOINT
-        if endpoint:
-            endpoint = endpoint.rstrip('/')
-            if endpoint.endswith('/openai'):
-                endpoint = endpoint[:-7]
-        
-        client = AzureOpenAI(
-            azure_endpoint=endpoint,
-            api_key=config.AZURE_API_KEY,
-            api_version=config.AZURE_API_VERSION
-        )
 
-        # Prepare all Q&A records
-        qa_history = ""
-        for i, (q, a, score_data) in enumerate(zip(
-            interview_data['questions'],
-            interview_data['answers'],
-            interview_data['scores']
-        )):
-            qa_history += f"""
-Question {i+1}: {q}
-Answer: {a}
-Score: {score_data.get('score', 'N/A')}
-Feedback: {score_data.get('feedback', '')}
-            """
-
-        prompt = f"""
-Please generate a comprehensive summary report for the following interview:
-
-【Position Information】
-Position: {job_data[1]}
-Company: {job_data[5]}
-Requirements: {job_data[4]}
+        # Byte-stable Q&A records keep the prompt (and its cache entry) identical on replay
+        qa_history = json_dumps(_summary_records(interview_data), indent=True)
+
+        prompt = f"""{SUMMARY_ROLE}
+Summarize the interview for the position above from the Q&A records below: {SUMMARY_POINTS}.
+Summary: 3-4 sentences; each list item: one short sentence.
+Return JSON: {SUMMARY_JSON}
 
 【Interview Q&A Records】
 {qa_history}
+"""
 
-Please provide:
-1. Overall performance score (0-100 points)
-2. Core strengths analysis
-3. Areas needing improvement
-4. Match assessment for this position
-5. Specific improvement suggestions
-
-Please return in the following JSON format:
-{{
-    "overall_score": overall_score,
-    "summary": "Overall evaluation summary",
-    "key_strengths": ["Strength1", "Strength2", "Strength3"],
-    "improvement_areas": ["Improvement area1", "Improvement area2", "Improvement area3"],
-    "job_fit": "High/Medium/Low",
-    "recommendations": ["Recommendation1", "Recommendation2", "Recommendation3"]
-}}
-        """
-
-        response = client.chat.completions.create(
-            model=config.AZURE_OPENAI_DEPLOYMENT or "gpt-4o-mini",
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are a professional career advisor, capable of providing comprehensive interview performance analysis and career development suggestions."
-                },
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            temperature=0.7,
-            max_tokens=1000
+        return _summary_completion(
+            client,
+            model=_interview_model(config, 'quality'),
+            messages=_interview_messages(job_data, seeker_profile, prompt,
+                                         interview_data.get('ctx_system')),
+            temperature=0,
+            json_mode=SUMMARY_SCHEMA,
+            max_tokens=SUMMARY_MAX_TOKENS,
+            on_token=on_token
         )
 
-        return response.choices[0].message.content.strip()
-
     except Exception as e:
         return f'{{"error": "Summary generation failed: {str(e)}"}}'
+
+
+def evaluate_and_summarize(interview_data: Dict, job_data: tuple, config=None,
+                           seeker_profile: tuple = None,
+                           on_token: Optional[Callable[[str], None]] = None) -> str:
+    """Score every answer and generate the final summary in one request.
+    
+    Replaces one evaluate_answer round-trip per question plus a separate
+    summary call with a single completion, so finishing an interview costs
+    one network round-trip regardless of the number of questions.
+    
+    Args:
+        interview_data: Dictionary with 'questions' and 'answers' keys
+        job_data: Tuple of job fields from database
+        config: Optional config object
+        seeker_profile: Optional seeker tuple (shares the cached prompt prefix)
+        on_token: Optional callback receiving streamed JSON text deltas
+        
+    Returns:
+        JSON string with 'scores' (one per answer, in order) and 'summary'
+    """
+    try:
+        config, client, error_msg = _configured_client(config)
+        if error_msg is not None:
+            return f'{{"error": "{error_msg}"}}'
+
+        items = [
+            {"q": q, "a": a}
+            for q, a in zip(interview_data['questions'], interview_data['answers'])
+        ]
+        qa_json = json_dumps(items, indent=True)
+
+        prompt = f"""{EVALUATION_ROLE}
+{SUMMARY_ROLE}
+
+Score each answer in the records at the end for the position above, then summarize the whole interview.
+Per answer: {SCORE_CRITERIA} {FEEDBACK_LENGTH}
+Summary: {SUMMARY_POINTS}; 3-4 sentences, each list item one short sentence.
+Return JSON, one "scores" entry per record: {{"scores": [{SCORE_JSON}], "summary": {SUMMARY_JSON}}}
+
+【Interview Q&A Records】 ({len(items)} records; JSON array, "q" is the question, "a" is the answer)
+{qa_json}
+"""
+
+        return _batch_completion(
+            client,
+            model=_interview_model(config, 'quality'),
+            messages=_interview_messages(job_data, seeker_profile, prompt,
+                                         interview_data.get('ctx_system')),
+            temperature=0,
+            json_mode=BATCH_SCHEMA,
+            max_tokens=min(4000, SUMMARY_MAX_TOKENS + EVALUATION_MAX_TOKENS * len(items)),
+            on_token=on_token
+        )
+
+    except Exception as e:
+        return f'{{"error": "Evaluation failed: {str(e)}"}}'
+
+
+def apply_batch_evaluation(interview_data: Dict, result: str) -> Optional[str]:
+    """Store an evaluate_and_summarize result on the interview state.
+    
+    Fills 'scores' (padded so there is one entry per answer) and 'summary',
+    clears 'pending' and marks the interview completed. An unparseable
+    result completes the interview with a summary error, as the per-answer
+    flow does; an API error leaves the state untouched so it can be retried.
+    
+    Args:
+        interview_data: Interview state dict from initialize_interview_session
+        result: JSON string returned by evaluate_and_summarize
+        
+    Returns:
+        The API error message, or None if the interview was completed
+    """
+    try:
+        data = json_loads(result)
+    except (json.JSONDecodeError, TypeError):
+        data = None
+
+    if isinstance(data, dict) and 'error' in data:
+        return str(data['error'])
+
+    summary = data.get('summary') if isinstance(data, dict) else None
+    if isinstance(summary, dict):
+        n_answers = len(interview_data['answers'])
+        scores = [s for s in data.get('scores') or [] if isinstance(s, dict)][:n_answers]
+        scores += [{'score': 'N/A', 'feedback': ''}] * (n_answers - len(scores))
+        interview_data['scores'] = scores
+        interview_data['summary'] = summary
+    else:
+        interview_data['summary'] = {"error": "Summary parsing failed"}
+
+    interview_data['pending'] = []
+    interview_data['completed'] = True
+    return None
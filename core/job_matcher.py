@@ -5,14 +5,52 @@ This module provides the JobMatcher class for semantic job matching using
 Pinecone vector database and SentenceTransformer embeddings.
 """
 
+import sys
 import time
+import hashlib
+import functools
+import itertools
+import sqlite3
+import threading
+from collections import OrderedDict
 import streamlit as st
+from pathlib import Path
 from typing import Dict, List, Optional
 
 # Lazy imports for heavy ML/embedding libraries
 _SentenceTransformer = None
 _Pinecone = None
 _ServerlessSpec = None
+_np = None
+_ahocorasick = None
+
+# Vectors per Pinecone upsert request
+UPSERT_BATCH_SIZE = 100
+# Threads the Pinecone index uses for async_req upserts
+PINECONE_POOL_THREADS = 4
+# Decimal places kept when sending vectors to Pinecone (see _to_wire)
+VECTOR_WIRE_DECIMALS = 4
+
+
+def _get_numpy():
+    """Lazy load numpy."""
+    global _np
+    if _np is None:
+        import numpy as np
+        _np = np
+    return _np
+
+
+def _get_ahocorasick():
+    """Lazy load pyahocorasick; returns None if it is not installed."""
+    global _ahocorasick
+    if _ahocorasick is None:
+        try:
+            import ahocorasick
+            _ahocorasick = ahocorasick
+        except ImportError:
+            _ahocorasick = False
+    return _ahocorasick or None
 
 
 def _get_sentence_transformer_class():
@@ -38,9 +76,93 @@ def _get_pinecone_classes():
 # CACHED MODEL LOADING - Prevents re-downloading on every page load
 # ============================================================================
 
+class OnnxSentenceEncoder:
+    """SentenceTransformer-compatible encoder running on ONNX Runtime (CPU).
+    
+    The Hugging Face model is exported to ONNX once and saved under
+    ``export_dir``; later loads reuse the exported graph. Token embeddings
+    are mean-pooled and optionally L2-normalized in numpy, matching the
+    all-MiniLM-L6-v2 sentence-transformers pipeline.
+    """
+    
+    def __init__(self, model_name: str, export_dir: str):
+        import onnxruntime as ort
+        from optimum.onnxruntime import ORTModelForFeatureExtraction
+        from transformers import AutoTokenizer
+        
+        hf_name = model_name if '/' in model_name else f"sentence-transformers/{model_name}"
+        local_dir = Path(export_dir) / hf_name.replace('/', '__')
+        
+        session_options = ort.SessionOptions()
+        session_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        
+        if (local_dir / 'model.onnx').exists():
+            self.model = ORTModelForFeatureExtraction.from_pretrained(
+                local_dir, provider="CPUExecutionProvider", session_options=session_options
+            )
+            self.tokenizer = AutoTokenizer.from_pretrained(local_dir)
+        else:
+            print(f"🔧 Exporting {hf_name} to ONNX (first run only)...")
+            self.model = ORTModelForFeatureExtraction.from_pretrained(
+                hf_name, export=True, provider="CPUExecutionProvider",
+                session_options=session_options
+            )
+            self.tokenizer = AutoTokenizer.from_pretrained(hf_name)
+            local_dir.mkdir(parents=True, exist_ok=True)
+            self.model.save_pretrained(local_dir)
+            self.tokenizer.save_pretrained(local_dir)
+    
+    def encode(self, sentences, batch_size: int = 32, normalize_embeddings: bool = False, **kwargs):
+        """Encode text(s) to float32 numpy embeddings (SentenceTransformer signature)."""
+        np = _get_numpy()
+        single = isinstance(sentences, str)
+        texts = [sentences] if single else list(sentences)
+        
+        chunks = []
+        for start in range(0, len(texts), batch_size):
+            inputs = self.tokenizer(
+                texts[start:start + batch_size], padding=True, truncation=True,
+                max_length=256, return_tensors="np"
+            )
+            hidden = self.model(**inputs).last_hidden_state
+            hidden = np.asarray(hidden, dtype=np.float32)
+            mask = inputs['attention_mask'][..., None].astype(np.float32)
+            pooled = (hidden * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+            if normalize_embeddings:
+                pooled /= np.clip(np.linalg.norm(pooled, axis=1, keepdims=True), 1e-12, None)
+            chunks.append(pooled)
+        
+        embeddings = np.vstack(chunks) if chunks else np.zeros((0, 0), dtype=np.float32)
+        return embeddings[0] if single else embeddings
+
+
 @st.cache_resource(show_spinner=False)
-def _get_sentence_transformer_model_cached(model_name: str):
-    """Load and cache SentenceTransformer model - only loaded once."""
+def _get_sentence_transformer_model_cached(model_name: str, backend: str = 'auto',
+                                           export_dir: str = 'models'):
+    """Load and cache the embedding model - only loaded once.
+    
+    ``backend`` is 'onnx', 'torch' or 'auto' (ONNX Runtime when optimum and
+    onnxruntime are installed and the model exports/loads, else
+    SentenceTransformer).
+    """
+    if backend in ('auto', 'onnx'):
+        try:
+            print("📦 Loading ONNX Runtime embedding model (first time only)...")
+            model = OnnxSentenceEncoder(model_name, export_dir)
+            print("✅ ONNX model loaded and cached!")
+            return model
+        except ImportError as e:
+            if backend == 'onnx':
+                raise
+            print(f"ℹ️ ONNX Runtime backend unavailable ({e}), using SentenceTransformer")
+        except Exception as e:
+            # Export/load failures (no network, read-only export_dir, ...)
+            # must not take down the default backend
+            if backend == 'onnx':
+                raise
+            print(f"⚠️ ONNX model failed to load ({type(e).__name__}: {e}), "
+                  f"using SentenceTransformer")
+    
     print("📦 Loading sentence transformer model (first time only)...")
     SentenceTransformer = _get_sentence_transformer_class()
     model = SentenceTransformer(model_name)
@@ -58,14 +180,55 @@ def _get_pinecone_client_cached(api_key: str):
     return pc
 
 
+def _pinecone_index_exists(pc, index_name: str) -> bool:
+    """Check for an index without listing all of them when the SDK allows."""
+    has_index = getattr(pc, 'has_index', None)
+    if callable(has_index):
+        return has_index(index_name)
+    # Older SDKs: fall back to scanning the listing
+    return any(idx['name'] == index_name for idx in pc.list_indexes())
+
+
+def _wait_for_pinecone_index(pc, index_name: str, timeout: float = 60.0):
+    """Poll until a newly created index reports ready (short backoff)."""
+    delay = 0.25
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            status = pc.describe_index(index_name).status
+            ready = status.get('ready') if isinstance(status, dict) else getattr(status, 'ready', False)
+            if ready:
+                return
+        except Exception:
+            pass
+        time.sleep(delay)
+        delay = min(delay * 2, 2.0)
+    print(f"⚠️ Pinecone index {index_name} not ready after {timeout:.0f}s, continuing")
+
+
+def _to_wire(vectors):
+    """Quantize embeddings for the Pinecone request body.
+    
+    The REST client serializes vectors as JSON decimals; a float32 value
+    printed via Python float takes ~20 characters. Rounding to
+    VECTOR_WIRE_DECIMALS (step 1e-4, finer than int8's ~1e-3 for unit
+    vectors) cuts that to ~7 with no measurable effect on cosine ranking.
+    Rounding is done in float64 so the short decimal repr survives
+    ``.tolist()``.
+    
+    Returns:
+        float64 ndarray of the same shape; call ``.tolist()`` per vector
+    """
+    np = _get_numpy()
+    return np.round(np.asarray(vectors, dtype=np.float64), VECTOR_WIRE_DECIMALS)
+
+
 @st.cache_resource(show_spinner=False)
 def _get_pinecone_index_cached(_pc, index_name: str, embedding_dimension: int, environment: str):
     """Get cached Pinecone index - only initialized once."""
     _, ServerlessSpec = _get_pinecone_classes()
-    existing_indexes = _pc.list_indexes()
-    index_names = [idx['name'] for idx in existing_indexes]
     
-    if index_name not in index_names:
+    if not _pinecone_index_exists(_pc, index_name):
         print(f"🔨 Creating new Pinecone index: {index_name}")
         _pc.create_index(
             name=index_name,
@@ -76,11 +239,163 @@ def _get_pinecone_index_cached(_pc, index_name: str, embedding_dimension: int, e
                 region=environment
             )
         )
-        time.sleep(2)
+        _wait_for_pinecone_index(_pc, index_name)
     else:
         print(f"✅ Using existing Pinecone index: {index_name}")
     
-    return _pc.Index(index_name)
+    return _pc.Index(index_name, pool_threads=PINECONE_POOL_THREADS)
+
+
+# ============================================================================
+# PERSISTENT EMBEDDING CACHE
+# ============================================================================
+
+class EmbeddingCache:
+    """SQLite-backed cache of float32 embeddings keyed by SHA-256(model + text).
+    
+    Job titles/descriptions recur across searches and sessions, so cached
+    vectors are served from disk instead of re-running the model. The
+    connection is opened lazily and shared across threads behind a lock.
+    Recently used vectors are also kept in a bounded in-memory LRU so hot
+    keys (the resume query, repeated jobs) skip SQLite entirely.
+    """
+    
+    def __init__(self, db_path: str, memory_size: int = 4096):
+        self.db_path = Path(db_path)
+        self._conn = None
+        self._lock = threading.Lock()
+        self._memory = OrderedDict()
+        self._memory_size = memory_size
+    
+    @staticmethod
+    def make_key(model_name: str, text: str) -> str:
+        """Build the cache key for a model/text pair."""
+        return hashlib.sha256((model_name + text).encode('utf-8')).hexdigest()
+    
+    def _get_conn(self):
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS emb_cache (
+                    hash TEXT PRIMARY KEY,
+                    model TEXT,
+                    dim INT,
+                    vec BLOB
+                )
+            """)
+            self._conn.commit()
+        return self._conn
+    
+    def _remember(self, key: str, vec):
+        """Add to the in-memory LRU (caller holds the lock)."""
+        self._memory[key] = vec
+        self._memory.move_to_end(key)
+        if len(self._memory) > self._memory_size:
+            self._memory.popitem(last=False)
+    
+    def get(self, key: str):
+        """Return the cached vector for ``key`` as read-only float32 ndarray, or None."""
+        np = _get_numpy()
+        with self._lock:
+            vec = self._memory.get(key)
+            if vec is not None:
+                self._memory.move_to_end(key)
+                return vec
+            row = self._get_conn().execute(
+                "SELECT vec FROM emb_cache WHERE hash = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            vec = np.frombuffer(row[0], dtype=np.float32)
+            self._remember(key, vec)
+        return vec
+    
+    def put(self, key: str, model_name: str, vector, commit: bool = True):
+        """Store a vector; set ``commit=False`` to defer until ``commit()``."""
+        np = _get_numpy()
+        vec = np.array(vector, dtype=np.float32)
+        # Shared between callers via the LRU, so never hand out a mutable view
+        vec.setflags(write=False)
+        with self._lock:
+            conn = self._get_conn()
+            conn.execute(
+                "INSERT OR IGNORE INTO emb_cache (hash, model, dim, vec) VALUES (?, ?, ?, ?)",
+                (key, model_name, int(vec.shape[-1]), vec.tobytes())
+            )
+            if commit:
+                conn.commit()
+            self._remember(key, vec)
+        return vec
+    
+    def commit(self):
+        """Flush deferred inserts."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.commit()
+
+
+class IndexedJobLog:
+    """Persistent set of content hashes for jobs already upserted to Pinecone.
+    
+    Hashes are loaded into memory on first use so membership checks are
+    O(1); new hashes are written through to SQLite after a successful upsert.
+    The log only mirrors the index, so it is cleared (``clear``) when the
+    index turns out to be empty, i.e. newly (re)created or wiped.
+    """
+    
+    def __init__(self, db_path: str):
+        self.db_path = Path(db_path)
+        self._conn = None
+        self._seen = None
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def make_hash(index_name: str, job_text: str) -> str:
+        """Content hash for a job's text within a given index."""
+        return hashlib.blake2b(
+            f"{index_name}\x00{job_text}".encode('utf-8'), digest_size=16
+        ).hexdigest()
+    
+    def _load(self):
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS indexed_jobs (
+                    hash TEXT PRIMARY KEY,
+                    job_id TEXT
+                )
+            """)
+            self._conn.commit()
+            self._seen = {
+                row[0] for row in self._conn.execute("SELECT hash FROM indexed_jobs")
+            }
+        return self._seen
+    
+    def __contains__(self, job_hash: str) -> bool:
+        with self._lock:
+            return job_hash in self._load()
+    
+    def add_many(self, entries: List[tuple]):
+        """Record ``(hash, job_id)`` pairs as indexed."""
+        if not entries:
+            return
+        with self._lock:
+            seen = self._load()
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO indexed_jobs (hash, job_id) VALUES (?, ?)", entries
+            )
+            self._conn.commit()
+            seen.update(h for h, _ in entries)
+    
+    def clear(self):
+        """Forget all recorded hashes."""
+        with self._lock:
+            seen = self._load()
+            self._conn.execute("DELETE FROM indexed_jobs")
+            self._conn.commit()
+            seen.clear()
 
 
 # ============================================================================
@@ -110,6 +425,13 @@ class JobMatcher:
         self._pc = None
         self._model = None
         self._index = None
+        self.embedding_cache = EmbeddingCache(
+            getattr(config, 'DB_PATH_EMBEDDING_CACHE', 'embedding_cache.db')
+        )
+        self.indexed_jobs = IndexedJobLog(
+            getattr(config, 'DB_PATH_EMBEDDING_CACHE', 'embedding_cache.db')
+        )
+        self._indexed_jobs_synced = False
     
     @property
     def pc(self):
@@ -122,7 +444,11 @@ class JobMatcher:
     def model(self):
         """Lazy-load SentenceTransformer model."""
         if self._model is None:
-            self._model = _get_sentence_transformer_model_cached(self._config.MODEL_NAME)
+            self._model = _get_sentence_transformer_model_cached(
+                self._config.MODEL_NAME,
+                getattr(self._config, 'EMBEDDING_BACKEND', 'auto'),
+                str(getattr(self._config, 'DIR_ONNX_MODELS', 'models'))
+            )
         return self._model
     
     @property
@@ -137,63 +463,221 @@ class JobMatcher:
             )
         return self._index
     
-    def generate_embedding(self, text: str) -> List[float]:
+    def generate_embedding(self, text: str):
         """Generate embedding vector for text.
         
+        Identical texts are served from the persistent embedding cache.
+        
         Args:
             text: Text to embed
             
         Returns:
-            List of embedding values
+            Normalized float32 numpy array (convert with .tolist() only at
+            API boundaries that need plain lists)
         """
+        np = _get_numpy()
         text = str(text).strip()
         if not text:
             text = "empty"
         
-        embedding = self.model.encode(text, convert_to_tensor=False)
-        return embedding.tolist()
+        model_name = self._config.MODEL_NAME
+        key = EmbeddingCache.make_key(model_name, text)
+        cached = self.embedding_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        embedding = self.model.encode(
+            text, convert_to_numpy=True, normalize_embeddings=True
+        )
+        return self.embedding_cache.put(key, model_name, embedding)
+    
+    def generate_embeddings_batch(self, texts: List[str], batch_size: int = 32):
+        """Generate embeddings for many texts with a single model.encode call.
+        
+        Cached texts are served from the embedding cache; only the misses are
+        sent to the model, in one batched call.
+        
+        Args:
+            texts: Texts to embed
+            batch_size: Encoder batch size
+            
+        Returns:
+            float32 ndarray of shape (len(texts), dim)
+        """
+        np = _get_numpy()
+        model_name = self._config.MODEL_NAME
+        texts = [str(t).strip() or "empty" for t in texts]
+        keys = [EmbeddingCache.make_key(model_name, t) for t in texts]
+        
+        vectors = [self.embedding_cache.get(k) for k in keys]
+        
+        # Encode each distinct missing text once, then fan out to duplicates
+        missing = {}
+        for i, v in enumerate(vectors):
+            if v is None:
+                missing.setdefault(keys[i], []).append(i)
+        
+        if missing:
+            first = [positions[0] for positions in missing.values()]
+            encoded = self.model.encode(
+                [texts[i] for i in first],
+                batch_size=batch_size,
+                convert_to_numpy=True,
+                normalize_embeddings=True,
+                show_progress_bar=False
+            )
+            put = self.embedding_cache.put
+            for (key, positions), emb in zip(missing.items(), encoded):
+                vec = put(key, model_name, emb, commit=False)
+                for i in positions:
+                    vectors[i] = vec
+            self.embedding_cache.commit()
+        
+        if not vectors:
+            return np.zeros((0, self._config.EMBEDDING_DIMENSION), dtype=np.float32)
+        return np.vstack(vectors).astype(np.float32, copy=False)
     
     def index_jobs(self, jobs: List[Dict]) -> int:
         """Index jobs in Pinecone vector database.
         
+        Jobs whose content was already indexed (in this call or a previous
+        one) are skipped without re-embedding or re-upserting.
+        
         Args:
             jobs: List of job dictionaries to index
             
         Returns:
-            Number of jobs successfully indexed
+            Number of jobs newly upserted
         """
         if not jobs:
             return 0
         
+        # Build all job texts up front so the model encodes them in one batch.
+        # The encoder truncates at ~256 tokens, so descriptions are cut at 1000 chars.
+        index_name = self._config.INDEX_NAME
+        make_hash = IndexedJobLog.make_hash
+        indexed = self.indexed_jobs
+        self._sync_indexed_jobs()
+        valid_jobs = []
+        job_texts = []
+        job_hashes = []
+        add_job, add_text, add_hash = valid_jobs.append, job_texts.append, job_hashes.append
+        batch_hashes = set()
+        skipped = 0
+        for job in jobs:
+            try:
+                job_text = f"{job['title']} {job['company']} {job['description'][:1000]}"
+            except Exception as e:
+                print(f"⚠️ Error indexing job {job.get('id', 'unknown')}: {e}")
+                continue
+            job_hash = make_hash(index_name, job_text)
+            if job_hash in batch_hashes or job_hash in indexed:
+                skipped += 1
+                continue
+            batch_hashes.add(job_hash)
+            add_job(job)
+            add_text(job_text)
+            add_hash(job_hash)
+        
+        if skipped:
+            print(f"♻️ Skipped {skipped} already-indexed jobs")
+        
+        if not valid_jobs:
+            return 0
+        
+        embeddings = self.generate_embeddings_batch(job_texts)
+        
         vectors_to_upsert = []
+        upserted_hashes = []
+        add_vector, add_upserted = vectors_to_upsert.append, upserted_hashes.append
         
-        for job in jobs:
+        for job, embedding, job_hash in zip(valid_jobs, _to_wire(embeddings), job_hashes):
             try:
-                job_text = f"{job['title']} {job['company']} {job['description']}"
-                embedding = self.generate_embedding(job_text)
-                
-                vectors_to_upsert.append({
+                job_get = job.get
+                add_vector({
                     'id': job['id'],
-                    'values': embedding,
+                    'values': embedding.tolist(),
                     'metadata': {
                         'title': job['title'][:512],
                         'company': job['company'][:512],
                         'location': job['location'][:512],
                         'description': job['description'][:1000],
-                        'url': job.get('url', '')[:512],
-                        'posted_date': str(job.get('posted_date', ''))[:100]
+                        'url': job_get('url', '')[:512],
+                        'posted_date': str(job_get('posted_date', ''))[:100]
                     }
                 })
+                add_upserted((job_hash, str(job['id'])))
                 
             except Exception as e:
                 print(f"⚠️ Error indexing job {job.get('id', 'unknown')}: {e}")
                 continue
         
-        if vectors_to_upsert:
-            self.index.upsert(vectors=vectors_to_upsert)
-            return len(vectors_to_upsert)
+        if not vectors_to_upsert:
+            return 0
+        
+        # Upsert in chunks on the client's thread pool so requests overlap
+        upsert = self.index.upsert
+        chunk_size = UPSERT_BATCH_SIZE
+        pending = [
+            upsert(vectors=vectors_to_upsert[i:i + chunk_size], async_req=True)
+            for i in range(0, len(vectors_to_upsert), chunk_size)
+        ]
+        for result in pending:
+            result.get()
+        
+        indexed.add_many(upserted_hashes)
+        return len(vectors_to_upsert)
+    
+    def _sync_indexed_jobs(self):
+        """Clear the indexed-job log once if the Pinecone index is empty.
         
-        return 0
+        A newly created, recreated or wiped index holds none of the logged
+        jobs; without this they would be skipped forever. Checked once per
+        matcher (retried if the stats call fails).
+        """
+        if self._indexed_jobs_synced:
+            return
+        count = self.vector_count()
+        if count is None:
+            return
+        if count == 0:
+            print("🧹 Pinecone index is empty, clearing the indexed-job log")
+            self.indexed_jobs.clear()
+        self._indexed_jobs_synced = True
+    
+    def vector_count(self) -> Optional[int]:
+        """Return the index's total vector count, or None if stats are unavailable."""
+        try:
+            stats = self.index.describe_index_stats()
+        except Exception as e:
+            print(f"⚠️ Could not read Pinecone index stats: {e}")
+            return None
+        if isinstance(stats, dict):
+            return stats.get('total_vector_count')
+        return getattr(stats, 'total_vector_count', None)
+    
+    def wait_for_vectors(self, expected_count: int, timeout: float = 1.0,
+                         interval: float = 0.1) -> bool:
+        """Poll index stats until ``expected_count`` vectors are visible.
+        
+        Pinecone usually reflects upserts within a few hundred ms, so this
+        returns as soon as they show up instead of sleeping a fixed time.
+        Upserts that overwrite existing ids never raise the count; the
+        timeout bounds the wait in that case.
+        
+        Returns:
+            True if the count was reached before the timeout
+        """
+        deadline = time.time() + timeout
+        while True:
+            count = self.vector_count()
+            if count is None:
+                return False
+            if count >= expected_count:
+                return True
+            if time.time() >= deadline:
+                return False
+            time.sleep(interval)
     
     def search_similar_jobs(self, resume_data: Dict, ai_analysis: Dict, top_k: int = 20) -> List[Dict]:
         """Search for similar jobs using semantic similarity.
@@ -219,7 +703,7 @@ class JobMatcher:
             
             print(f"🔍 Searching Pinecone for top {top_k} matches...")
             results = self.index.query(
-                vector=query_embedding,
+                vector=_to_wire(query_embedding).tolist(),
                 top_k=top_k,
                 include_metadata=True
             )
@@ -231,6 +715,8 @@ class JobMatcher:
                     'similarity_score': float(match['score']) * 100,
                     **match['metadata']
                 }
+                # Normalize once at ingest; scoring reads the cached text
+                _job_search_text(job)
                 matched_jobs.append(job)
             
             print(f"✅ Found {len(matched_jobs)} semantic matches")
@@ -255,13 +741,66 @@ class JobMatcher:
         return analyze_match_simple(job_data, seeker_data)
 
 
+@st.cache_resource(show_spinner=False)
+def get_job_matcher() -> JobMatcher:
+    """Get the process-wide JobMatcher - survives Streamlit reruns."""
+    return JobMatcher()
+
+
 # ============================================================================
 # MATCH SCORING FUNCTIONS
 # ============================================================================
 
+@functools.lru_cache(maxsize=32)
+def _build_skill_automaton(skills: frozenset):
+    """Aho-Corasick automaton over lowercased skills (None without pyahocorasick)."""
+    ahocorasick = _get_ahocorasick()
+    if ahocorasick is None or not skills:
+        return None
+    automaton = ahocorasick.Automaton()
+    for skill in skills:
+        automaton.add_word(skill, skill)
+    automaton.make_automaton()
+    return automaton
+
+
+def _find_skills(skills: frozenset, text: str) -> set:
+    """Return the subset of ``skills`` occurring as substrings of ``text``.
+    
+    Uses the cached Aho-Corasick automaton when available (one pass over
+    ``text``), otherwise one ``in`` check per skill against the same string.
+    """
+    automaton = _build_skill_automaton(skills)
+    if automaton is not None:
+        return {skill for _, skill in automaton.iter(text)}
+    return {skill for skill in skills if skill in text}
+
+
+def _job_search_text(job: Dict) -> str:
+    """Return the lowercased skill-search text for a job, computing it once.
+    
+    The text is ``title\\0description`` ("\\0" keeps matches from spanning
+    the two fields) and is stored on the dict as ``_text_lc`` so rescoring
+    the same jobs (e.g. with another skill list) skips the lowercasing.
+    The lowercased title is kept as ``_title_lc`` and interned, since
+    titles repeat across searches.
+    """
+    text = job.get('_text_lc')
+    if text is None:
+        title_lc = job.get('_title_lc')
+        if title_lc is None:
+            title_lc = job['_title_lc'] = sys.intern((job.get('title') or '').lower())
+        text = job['_text_lc'] = f"{title_lc}\0{(job.get('description') or '').lower()}"
+    return text
+
+
 def calculate_match_scores(jobs: List[Dict], ai_analysis: Dict) -> List[Dict]:
     """Calculate detailed match scores - 60% semantic + 40% skill match.
     
+    Jobs are read once into columns (search text, semantic scores), the
+    skill search runs over the text column, the scores are combined
+    column-wise, and results are written back to the dicts at the end.
+    
     Args:
         jobs: List of job dictionaries with 'similarity_score' from semantic search
         ai_analysis: AI analysis with 'skills' key
@@ -269,39 +808,61 @@ def calculate_match_scores(jobs: List[Dict], ai_analysis: Dict) -> List[Dict]:
     Returns:
         Jobs with added score fields
     """
-    candidate_skills = set([s.lower() for s in ai_analysis.get('skills', [])])
+    # Interned so the automaton cache key and match lookups reuse the same
+    # string objects across calls
+    candidate_skills = frozenset(sys.intern(s.lower()) for s in ai_analysis.get('skills', ()) if s)
     
     print(f"📊 Calculating match scores using {len(candidate_skills)} candidate skills...")
     
-    for job in jobs:
-        description = job.get('description', '').lower()
-        title = job.get('title', '').lower()
-        
-        # Count skill matches
-        matched_skills = []
-        for skill in candidate_skills:
-            if skill in description or skill in title:
-                matched_skills.append(skill)
-        
-        # Calculate skill match percentage
-        skill_match_pct = (len(matched_skills) / len(candidate_skills) * 100) if candidate_skills else 0
-        
-        # Semantic similarity (from Pinecone)
-        semantic_score = job.get('similarity_score', 0)
-        
-        # Combined score: 60% semantic + 40% skill match
-        combined_score = (0.6 * semantic_score) + (0.4 * skill_match_pct)
-        
-        # Add to job
-        job['skill_match_percentage'] = round(skill_match_pct, 1)
-        job['matched_skills'] = list(matched_skills)[:10]
-        job['matched_skills_count'] = len(matched_skills)
-        job['combined_score'] = round(combined_score, 1)
-        job['semantic_score'] = round(semantic_score, 1)
+    if not jobs:
+        return jobs
+    
+    np = _get_numpy()
+    
+    # Columns: one search text per job (normalized once per job dict) and
+    # the semantic scores from Pinecone
+    texts = [_job_search_text(job) for job in jobs]
+    semantic = np.fromiter((job.get('similarity_score', 0) for job in jobs),
+                           dtype=np.float64, count=len(jobs))
+    
+    if candidate_skills:
+        matched = [_find_skills(candidate_skills, text) for text in texts]
+    else:
+        matched = [frozenset()] * len(jobs)
+    counts = np.fromiter((len(m) for m in matched), dtype=np.float64, count=len(jobs))
+    
+    # Percentage and 60/40 blend in place on one buffer (same operation
+    # order as the scalar formula, so rounding is unchanged)
+    skill_pct = counts
+    if candidate_skills:
+        skill_pct /= len(candidate_skills)
+        skill_pct *= 100
+    combined = np.multiply(skill_pct, 0.4)
+    combined += 0.6 * semantic
+    
+    for job, found, pct, score, sem in zip(
+        jobs, matched, skill_pct.tolist(), combined.tolist(), semantic.tolist()
+    ):
+        job['skill_match_percentage'] = round(pct, 1)
+        # Only the first 10 are shown; don't materialize the rest
+        job['matched_skills'] = list(itertools.islice(found, 10))
+        job['matched_skills_count'] = len(found)
+        job['combined_score'] = round(score, 1)
+        job['semantic_score'] = round(sem, 1)
     
     return jobs
 
 
+# Experience ordinals used by analyze_match_simple
+_EXPERIENCE_LEVELS = {"fresh graduate": 0, "1-3 years": 1, "3-5 years": 2, "5-10 years": 3, "10+ years": 4}
+
+
+@functools.lru_cache(maxsize=4096)
+def _tokset(text: str) -> frozenset:
+    """Lowercased whitespace tokens of ``text``, memoized across match calls."""
+    return frozenset(text.lower().split())
+
+
 def analyze_match_simple(job_data: tuple, seeker_data: tuple) -> Dict:
     """Simple match analysis between job and seeker.
     
@@ -314,10 +875,10 @@ def analyze_match_simple(job_data: tuple, seeker_data: tuple) -> Dict:
     """
     match_score = 50  # Basic Score
 
-    # Skills matching
-    job_skills = str(job_data[4]).lower()
-    seeker_skills = str(seeker_data[2]).lower()
-    skill_match = len(set(job_skills.split()) & set(seeker_skills.split())) / max(len(job_skills.split()), 1)
+    # Skills matching (token sets are cached, so a job is tokenized once per run)
+    job_tokens = _tokset(str(job_data[4]))
+    seeker_tokens = _tokset(str(seeker_data[2]))
+    skill_match = len(job_tokens & seeker_tokens) / max(len(job_tokens), 1)
     match_score += skill_match * 20
 
     # Language matching
@@ -377,13 +938,13 @@ def analyze_match_simple(job_data: tuple, seeker_data: tuple) -> Dict:
 
 
     # Experience matching
-    experience_map = {"fresh graduate": 0, "1-3 years": 1, "3-5 years": 2, "5-10 years": 3, "10+ years": 4}
     job_exp = job_data[11]
     seeker_exp = seeker_data[3]
 
-    if job_exp in experience_map and seeker_exp in experience_map:
-        exp_diff = abs(experience_map[job_exp] - experience_map[seeker_exp])
-        match_score -= exp_diff * 5
+    job_level = _EXPERIENCE_LEVELS.get(job_exp, -1)
+    seeker_level = _EXPERIENCE_LEVELS.get(seeker_exp, -1)
+    if job_level >= 0 and seeker_level >= 0:
+        match_score -= abs(job_level - seeker_level) * 5
 
     # Industry matching
     job_industry = str(job_data[6]).lower()
@@ -399,6 +960,11 @@ def analyze_match_simple(job_data: tuple, seeker_data: tuple) -> Dict:
 
     match_score = max(0, min(100, match_score))
 
+    return _build_match_analysis(match_score)
+
+
+def _build_match_analysis(match_score: float) -> Dict:
+    """Turn a 0-100 simple match score into the analysis dictionary."""
     # Analyze based on score
     if match_score >= 80:
         strengths = ["High skill match", "Experience meets requirements", "Strong industry relevance"]
@@ -423,6 +989,103 @@ def analyze_match_simple(job_data: tuple, seeker_data: tuple) -> Dict:
     }
 
 
+def _language_points(job: tuple, seeker: tuple) -> float:
+    """Language component of analyze_match_simple (0-10 points)."""
+    if len(job) > 17 and len(seeker) > 10:
+        job_langs = str(job[17]).lower()
+        if job_langs:
+            job_lang_list = job_langs.replace(',', ' ').split()
+            if job_lang_list:
+                seeker_langs = str(seeker[10]).lower()
+                matches = sum(1 for lang in job_lang_list if lang in seeker_langs)
+                return (matches / len(job_lang_list)) * 10
+    return 10
+
+
+def match_score_matrix(jobs: List[tuple], seekers: List[tuple]):
+    """Vectorized analyze_match_simple scores for every job x seeker pair.
+    
+    Skill overlap for all pairs comes from one matrix product of binary
+    job/seeker token-presence matrices over a shared vocabulary, and the
+    experience penalty from broadcasting ordinal arrays. The remaining
+    substring checks (languages, industry, location) stay per pair.
+    
+    Args:
+        jobs: Job tuples (get_all_jobs_for_matching_tuples layout)
+        seekers: Seeker tuples (get_all_job_seekers_formatted layout)
+        
+    Returns:
+        float64 ndarray of shape (len(jobs), len(seekers)), clipped to 0-100;
+        entry [i, j] equals analyze_match_simple(jobs[i], seekers[j])['match_score']
+        before int truncation
+    """
+    np = _get_numpy()
+    if not jobs or not seekers:
+        return np.zeros((len(jobs), len(seekers)))
+    
+    job_tokens = [_tokset(str(job[4])) for job in jobs]
+    seeker_tokens = [_tokset(str(seeker[2])) for seeker in seekers]
+    vocab = {}
+    for tokens in job_tokens + seeker_tokens:
+        for token in tokens:
+            vocab.setdefault(token, len(vocab))
+    
+    J = np.zeros((len(jobs), max(len(vocab), 1)), dtype=np.float32)
+    S = np.zeros((len(seekers), max(len(vocab), 1)), dtype=np.float32)
+    for i, tokens in enumerate(job_tokens):
+        J[i, [vocab[t] for t in tokens]] = 1
+    for j, tokens in enumerate(seeker_tokens):
+        S[j, [vocab[t] for t in tokens]] = 1
+    
+    overlap = (J @ S.T).astype(np.float64)
+    job_sizes = np.maximum(J.sum(axis=1, dtype=np.float64), 1)[:, None]
+    
+    scores = np.full((len(jobs), len(seekers)), 50.0)
+    scores += (overlap / job_sizes) * 20
+    
+    scores += np.array([[_language_points(job, seeker) for seeker in seekers] for job in jobs])
+    
+    # One dict lookup per job/seeker, not per pair; int8 codes (-1 = unknown)
+    exp_code = _EXPERIENCE_LEVELS.get
+    job_exp = np.fromiter((exp_code(job[11], -1) for job in jobs), dtype=np.int8, count=len(jobs))
+    seeker_exp = np.fromiter((exp_code(seeker[3], -1) for seeker in seekers), dtype=np.int8, count=len(seekers))
+    known = (job_exp[:, None] >= 0) & (seeker_exp[None, :] >= 0)
+    scores -= np.where(known, np.abs(job_exp[:, None] - seeker_exp[None, :]) * 5, 0)
+    
+    job_industry = [str(job[6]).lower() for job in jobs]
+    seeker_industry = [str(seeker[6]).lower() for seeker in seekers]
+    job_location = [str(job[8]).lower() for job in jobs]
+    seeker_location = [str(seeker[7]).lower() for seeker in seekers]
+    scores += np.array([
+        [10 if (ji in si or si in ji) else 0 for si in seeker_industry] for ji in job_industry
+    ])
+    scores += np.array([
+        [5 if (jl in sl or sl in jl) else 0 for sl in seeker_location] for jl in job_location
+    ])
+    
+    return np.clip(scores, 0, 100)
+
+
+def top_matches_for_job(job: tuple, seekers: List[tuple], k: int, min_score: float = 0) -> List[tuple]:
+    """Best ``k`` seekers for a job as ``(seeker, analysis)`` pairs, highest first.
+    
+    Scores every seeker in one vectorized pass and selects the top ``k``
+    with ``np.argpartition`` instead of a full sort.
+    """
+    np = _get_numpy()
+    if not seekers or k <= 0:
+        return []
+    scores = match_score_matrix([job], seekers)[0]
+    k = min(k, len(scores))
+    top = np.argpartition(-scores, k - 1)[:k]
+    top = top[np.argsort(-scores[top], kind='stable')]
+    return [
+        (seekers[idx], _build_match_analysis(scores[idx]))
+        for idx in top
+        if scores[idx] >= min_score
+    ]
+
+
 def calculate_job_match_score(job_seeker_data: Dict, job_data: Dict) -> Dict:
     """Calculate job match score between job seeker and job data.
     
@@ -442,9 +1105,10 @@ def calculate_job_match_score(job_seeker_data: Dict, job_data: Dict) -> Dict:
         job_description = job_data.get('job_description', '').lower()
         
         if job_seeker_skills:
-            skills_list = [skill.strip().lower() for skill in job_seeker_skills.split(',')]
+            skills_list = [sys.intern(skill.strip().lower()) for skill in job_seeker_skills.split(',')]
+            found = _find_skills(frozenset(s for s in skills_list if s), job_description)
             for skill in skills_list:
-                if skill and skill in job_description:
+                if skill and skill in found:
                     score += 5  # Each match adds 5 points
                     matched_skills.append(skill)
                     if score >= 40:  # Max skill points at 40
@@ -7,13 +7,38 @@ This module contains the main orchestrator classes for:
 - Semantic matching and scoring
 """
 
-import time
+import heapq
+import threading
 from typing import Dict, List, Tuple
 
 from config import Config
-from core.resume_parser import ResumeParser, GPT4JobRoleDetector
-from core.job_matcher import JobMatcher, calculate_match_scores, calculate_job_match_score
-from services.linkedin_api import LinkedInJobSearcher
+from core.resume_parser import ResumeParser, get_gpt4_detector, analyze_resume_cached
+from core.job_matcher import get_job_matcher, calculate_match_scores, calculate_job_match_score
+from core.azure_client import get_azure_openai_client, http2_available
+from core.completion_cache import semantic_cache
+from services.linkedin_api import get_linkedin_job_searcher
+from utils.json_utils import json_loads, response_json
+
+JSEARCH_BASE_URL = "https://jsearch.p.rapidapi.com/search"
+# Upper bound on concurrent JSearch page requests (RapidAPI rate limits)
+JSEARCH_MAX_CONCURRENCY = 4
+# Transient statuses retried with exponential backoff (sync and async paths)
+JSEARCH_RETRY_STATUSES = (429, 500, 502, 503, 504)
+JSEARCH_MAX_RETRIES = 3
+JSEARCH_BACKOFF_FACTOR = 0.3
+
+
+# Exact prompt matches only: the embedding model truncates long text, so two
+# CVs sharing a header (or one edited further down) would look identical
+@semantic_cache(namespace='parse_cv', exact=True)
+def _cv_parse_completion(client, *, model: str, messages: list, temperature: float) -> str:
+    """Structured CV extraction call; a repeated identical CV reuses the cached JSON."""
+    response = client.chat.completions.create(
+        model=model,
+        messages=messages,
+        temperature=temperature
+    )
+    return response.choices[0].message.content
 
 
 class JobSeekerBackend:
@@ -32,11 +57,13 @@ class JobSeekerBackend:
         
         # Lightweight components - instant init
         self.resume_parser = ResumeParser()
-        self.gpt4_detector = GPT4JobRoleDetector()
+        self.gpt4_detector = get_gpt4_detector()
         
         # Lazy-load heavy components - deferred until first use
         self._job_searcher = None
         self._matcher = None
+        # (is_working, message) from the last API check, None until it finishes
+        self.api_status = None
         
         print("✅ Backend initialized (fast mode)!\n")
     
@@ -45,7 +72,7 @@ class JobSeekerBackend:
         """Lazy-load JobMatcher only when needed."""
         if self._matcher is None:
             print("📦 Loading JobMatcher (first use)...")
-            self._matcher = JobMatcher()
+            self._matcher = get_job_matcher()
         return self._matcher
     
     @property
@@ -59,22 +86,33 @@ class JobSeekerBackend:
                 print("⚠️ WARNING: RAPIDAPI_KEY is not configured!")
                 print("   Job search functionality will not work.")
                 print("   Please configure RAPIDAPI_KEY in your Streamlit secrets.")
-                self._job_searcher = LinkedInJobSearcher("")
+                self._job_searcher = get_linkedin_job_searcher("")
                 return self._job_searcher
             
-            self._job_searcher = LinkedInJobSearcher(Config.RAPIDAPI_KEY)
-            # Test API connection only once
-            is_working, message = self._job_searcher.test_api_connection()
-            if is_working:
-                print(f"✅ {message}")
-            else:
-                print(f"⚠️ WARNING: {message}")
-                print("   Job search may not work properly!")
+            self._job_searcher = get_linkedin_job_searcher(Config.RAPIDAPI_KEY)
+            # Test API connection once, off the request path: the first
+            # search shouldn't wait an extra round-trip for a diagnostic
+            threading.Thread(
+                target=self._check_api_connection,
+                args=(self._job_searcher,),
+                daemon=True
+            ).start()
         return self._job_searcher
     
+    def _check_api_connection(self, searcher):
+        """Background API check; result is logged and kept in api_status."""
+        is_working, message = searcher.test_api_connection()
+        self.api_status = (is_working, message)
+        if is_working:
+            print(f"✅ {message}")
+        else:
+            print(f"⚠️ WARNING: {message}")
+            print("   Job search may not work properly!")
+    
     def test_api_connection(self):
         """Test API connection on demand (not at startup)."""
-        return self.job_searcher.test_api_connection()
+        self.api_status = self.job_searcher.test_api_connection()
+        return self.api_status
     
     def process_resume(self, file_obj, filename: str) -> Tuple[Dict, Dict]:
         """Process resume and get AI analysis.
@@ -93,7 +131,7 @@ class JobSeekerBackend:
         print(f"✅ Extracted {resume_data['word_count']} words from resume")
         
         # Get GPT-4 analysis
-        ai_analysis = self.gpt4_detector.analyze_resume_for_job_roles(resume_data)
+        ai_analysis = analyze_resume_cached(resume_data)
         
         # Add skills to resume_data
         resume_data['skills'] = ai_analysis.get('skills', [])
@@ -152,20 +190,24 @@ class JobSeekerBackend:
         print(f"📊 Indexing jobs in Pinecone...")
         
         # Index jobs
+        prev_count = self.matcher.vector_count()
         indexed = self.matcher.index_jobs(jobs)
         print(f"✅ Indexed {indexed} jobs in vector database")
         
-        # Wait for indexing
-        print("⏳ Waiting for indexing to complete...")
-        time.sleep(1)
+        # Wait only until the new vectors are visible to queries
+        if indexed and prev_count is not None:
+            print("⏳ Waiting for indexing to complete...")
+            if not self.matcher.wait_for_vectors(prev_count + indexed):
+                print("⚠️ Index stats not caught up yet, searching anyway")
         
         # Match resume to jobs
         print(f"\n🎯 MATCHING & RANKING JOBS")
         print(f"{'='*60}")
+        top_k = min(20, len(jobs))
         matched_jobs = self.matcher.search_similar_jobs(
             resume_data, 
             ai_analysis, 
-            top_k=min(20, len(jobs))
+            top_k=top_k
         )
         
         if not matched_jobs:
@@ -175,8 +217,8 @@ class JobSeekerBackend:
         # Calculate match scores
         matched_jobs = calculate_match_scores(matched_jobs, ai_analysis)
         
-        # Sort by combined score
-        matched_jobs.sort(key=lambda x: x.get('combined_score', 0), reverse=True)
+        # Keep the top_k by combined score (O(n log k), same order as a stable sort)
+        matched_jobs = heapq.nlargest(top_k, matched_jobs, key=lambda x: x.get('combined_score', 0))
         
         print(f"✅ Ranked {len(matched_jobs)} jobs by match quality")
         print(f"{'='*60}\n")
@@ -193,26 +235,12 @@ class JobSeekerBackend:
         Returns:
             Dictionary with extracted fields
         """
-        from openai import AzureOpenAI
-        import json
-        import httpx
-        
-        # Clean endpoint to prevent double /openai path issues
-        endpoint = Config.AZURE_OPENAI_ENDPOINT
-        if endpoint:
-            endpoint = endpoint.rstrip('/')
-            if endpoint.endswith('/openai'):
-                endpoint = endpoint[:-7]
-        
-        # Create a custom http client that ignores SSL errors
-        http_client = httpx.Client(verify=False)
-
-        # Use Azure OpenAI client
-        client = AzureOpenAI(
-            azure_endpoint=endpoint,
-            api_key=Config.AZURE_OPENAI_API_KEY,
-            api_version=Config.AZURE_OPENAI_API_VERSION,
-            http_client=http_client
+        # Shared client (TLS verification off, as some cloud hosts need it)
+        client = get_azure_openai_client(
+            Config.AZURE_OPENAI_ENDPOINT,
+            Config.AZURE_OPENAI_API_KEY,
+            Config.AZURE_OPENAI_API_VERSION,
+            verify=False
         )
         
         prompt = f"""
@@ -239,14 +267,15 @@ Please output JSON, fields including:
 Please return the result in the JSON format only, no extra explanation.
 """
 
-        response = client.chat.completions.create(
+        content = _cv_parse_completion(
+            client,
             model=Config.AZURE_OPENAI_DEPLOYMENT or "gpt-4o-mini",
             messages=[{"role": "user", "content": prompt}],
             temperature=0
         )
 
         try:
-            return json.loads(response.choices[0].message.content)
+            return json_loads(content)
         except Exception:
             return {}
 
@@ -254,6 +283,36 @@ Please return the result in the JSON format only, no extra explanation.
 class JobMatcherBackend:
     """Backend implementation using JSearch API for job fetching."""
     
+    def __init__(self):
+        self._session = None
+    
+    @property
+    def session(self):
+        """Pooled requests session, reused across pages and calls.
+        
+        Keeps TCP/TLS connections alive between requests and retries
+        transient 429/5xx responses with backoff.
+        """
+        if self._session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+            
+            self._session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=JSEARCH_MAX_CONCURRENCY,
+                pool_maxsize=8,
+                max_retries=Retry(
+                    total=JSEARCH_MAX_RETRIES,
+                    backoff_factor=JSEARCH_BACKOFF_FACTOR,
+                    status_forcelist=list(JSEARCH_RETRY_STATUSES),
+                    allowed_methods=["GET"],
+                    raise_on_status=False
+                )
+            )
+            self._session.mount("https://", adapter)
+        return self._session
+    
     def fetch_real_jobs(self, search_query, location="", country="us", num_pages=1):
         """Get actual job data from JSearch API.
         
@@ -266,36 +325,28 @@ class JobMatcherBackend:
         Returns:
             List of job dictionaries
         """
-        import requests
-        
         try:
             # JSearch API configuration
             API_KEY = Config.RAPIDAPI_KEY or "your_jsearch_api_key_here"
-            BASE_URL = "https://jsearch.p.rapidapi.com/search"
             
             headers = {
                 "X-RapidAPI-Key": API_KEY,
                 "X-RapidAPI-Host": "jsearch.p.rapidapi.com"
             }
             
+            query = f"{search_query} {location}"
+            pages = list(range(1, num_pages + 1))
+            results = self._run_page_fetches(headers, query, pages)
+            
             all_jobs = []
             
-            for page in range(1, num_pages + 1):
-                querystring = {
-                    "query": f"{search_query} {location}",
-                    "page": str(page),
-                    "num_pages": "1"
-                }
-                
-                response = requests.get(BASE_URL, headers=headers, params=querystring)
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    jobs = data.get('data', [])
+            # Pages arrive together; keep the old stop-at-first-failure semantics
+            for page, (status, jobs) in zip(pages, results):
+                if status == 200:
                     all_jobs.extend(jobs)
                     print(f"✅ Page {page} fetched {len(jobs)} jobs")
                 else:
-                    print(f"❌ API request failed: {response.status_code}")
+                    print(f"❌ API request failed: {status}")
                     break
             
             print(f"🎯 Found total of {len(all_jobs)} positions")
@@ -305,6 +356,89 @@ class JobMatcherBackend:
             print(f"❌ Failed to fetch jobs: {e}")
             return self.get_mock_jobs(search_query, location)
 
+    @staticmethod
+    def _page_querystring(query: str, page: int) -> Dict:
+        """Build the JSearch querystring for a single results page."""
+        return {"query": query, "page": str(page), "num_pages": "1"}
+
+    def _fetch_page(self, headers: Dict, query: str, page: int) -> Tuple[int, List[Dict]]:
+        """Fetch one results page synchronously.
+        
+        Returns:
+            (status_code, jobs) - jobs is empty unless status_code is 200
+        """
+        response = self.session.get(JSEARCH_BASE_URL, headers=headers,
+                                    params=self._page_querystring(query, page),
+                                    timeout=30)
+        if response.status_code != 200:
+            return response.status_code, []
+        return 200, response_json(response).get('data', [])
+
+    async def _fetch_pages_async(self, headers: Dict, query: str,
+                                 pages: List[int]) -> List[Tuple[int, List[Dict]]]:
+        """Fetch all pages concurrently over one pooled client.
+        
+        A semaphore caps in-flight requests at JSEARCH_MAX_CONCURRENCY so
+        large page counts don't trip RapidAPI rate limits. Transient
+        429/5xx responses are retried with the same backoff policy the
+        sync session mounts, so one throttled page isn't silently dropped.
+        """
+        import asyncio
+        import httpx
+        
+        semaphore = asyncio.Semaphore(JSEARCH_MAX_CONCURRENCY)
+        
+        async def fetch(client, page):
+            for attempt in range(JSEARCH_MAX_RETRIES + 1):
+                async with semaphore:
+                    response = await client.get(JSEARCH_BASE_URL,
+                                                params=self._page_querystring(query, page))
+                if (response.status_code not in JSEARCH_RETRY_STATUSES
+                        or attempt == JSEARCH_MAX_RETRIES):
+                    break
+                # Back off outside the semaphore so other pages keep flowing
+                await asyncio.sleep(JSEARCH_BACKOFF_FACTOR * (2 ** attempt))
+            if response.status_code != 200:
+                return response.status_code, []
+            return 200, response_json(response).get('data', [])
+        
+        async with httpx.AsyncClient(
+            headers=headers,
+            http2=http2_available(),
+            timeout=30,
+            limits=httpx.Limits(max_connections=JSEARCH_MAX_CONCURRENCY)
+        ) as client:
+            return await asyncio.gather(*[fetch(client, page) for page in pages])
+
+    def _run_page_fetches(self, headers: Dict, query: str,
+                          pages: List[int]) -> List[Tuple[int, List[Dict]]]:
+        """Sync entry point for page fetching.
+        
+        A single page, a missing httpx, or an already running event loop
+        (asyncio.run cannot nest) all fall back to sequential requests.
+        
+        Returns:
+            One (status_code, jobs) tuple per page, in page order
+        """
+        import asyncio
+        
+        if len(pages) > 1:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                try:
+                    return asyncio.run(self._fetch_pages_async(headers, query, pages))
+                except ImportError:
+                    pass
+        
+        results = []
+        for page in pages:
+            status, jobs = self._fetch_page(headers, query, page)
+            results.append((status, jobs))
+            if status != 200:
+                break
+        return results
+
     def get_mock_jobs(self, search_query, location):
         """Return mock job data (used when API is unavailable)."""
         print("🔄 Using simulated data...")
@@ -83,7 +83,7 @@ def process_resume_and_create_profile(
         - resume_data: Extracted raw resume data
         - ai_analysis: AI analysis results for auto-filling form
     """
-    from core.resume_parser import ResumeParser, GPT4JobRoleDetector
+    from core.resume_parser import ResumeParser, GPT4JobRoleDetector, analyze_resume_cached
     from database.models import JobSeekerDB
     
     parser = ResumeParser()
@@ -96,8 +96,11 @@ def process_resume_and_create_profile(
             return None, None, None
         
         # Analyze with GPT-4
-        detector = GPT4JobRoleDetector(config)
-        ai_analysis = detector.analyze_resume_for_job_roles(resume_data)
+        if config is None:
+            ai_analysis = analyze_resume_cached(resume_data)
+        else:
+            detector = GPT4JobRoleDetector(config)
+            ai_analysis = detector.analyze_resume_for_job_roles(resume_data)
         
         # Generate job_seeker_id
         job_seeker_id = JobSeekerDB.generate_job_seeker_id()
@@ -576,25 +579,9 @@ def get_jobs_for_interview_from_matches(job_seeker_id: str) -> List[Dict]:
     Returns:
         List of job dictionaries available for interviews
     """
-    jobs = get_matched_jobs_for_seeker(job_seeker_id, min_score=0.0, limit=50)
-    
-    # Format for interview page display
-    formatted_jobs = []
-    for job in jobs:
-        formatted_jobs.append({
-            'id': job.get('id'),
-            'job_id': job.get('job_id'),
-            'job_title': job.get('job_title', ''),
-            'company_name': job.get('company_name', ''),
-            'job_description': job.get('job_description', ''),
-            'required_skills': job.get('required_skills', ''),
-            'industry': job.get('industry', ''),
-            'experience_required': job.get('experience_required', ''),
-            'match_percentage': job.get('match_percentage', 0),
-            'location': job.get('location', '')
-        })
-    
-    return formatted_jobs
+    # Memoized read; reruns of the interview page reuse it until matches change
+    from database.queries import get_interview_jobs_for_seeker
+    return get_interview_jobs_for_seeker(job_seeker_id, limit=50)
 
 
 def convert_matched_job_to_interview_tuple(job: Dict) -> tuple:
@@ -612,7 +599,7 @@ def convert_matched_job_to_interview_tuple(job: Dict) -> tuple:
         Tuple in the format expected by interview functions
     """
     return (
-        job.get('id', 0),
+        job.get('job_id', 0),
         job.get('job_title', ''),
         job.get('job_description', ''),
         '',  # main_responsibilities - not stored in matched jobs
@@ -7,20 +7,71 @@ This module provides thread-safe implementations of:
 """
 
 import time
-from datetime import datetime, timedelta
-from collections import defaultdict
+import weakref
+import functools
+from collections import defaultdict, deque
 import threading
 
 
+@functools.lru_cache(maxsize=64)
+def _is_embedding_model(model: str) -> bool:
+    return "embedding" in model.lower()
+
+
+class _UsageShard:
+    """Token counters written by a single thread."""
+    
+    __slots__ = ('usage', 'total_tokens', 'prompt_tokens', 'completion_tokens',
+                 'embedding_tokens', 'cost_usd')
+    
+    def __init__(self):
+        self.clear()
+    
+    def clear(self):
+        self.usage = defaultdict(lambda: {"prompt": 0, "completion": 0})
+        self.total_tokens = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.embedding_tokens = 0
+        self.cost_usd = 0.0
+    
+    def merge(self, other: '_UsageShard'):
+        """Add another shard's counts to this one."""
+        for model, counts in other.usage.items():
+            mine = self.usage[model]
+            mine["prompt"] += counts["prompt"]
+            mine["completion"] += counts["completion"]
+        self.total_tokens += other.total_tokens
+        self.prompt_tokens += other.prompt_tokens
+        self.completion_tokens += other.completion_tokens
+        self.embedding_tokens += other.embedding_tokens
+        self.cost_usd += other.cost_usd
+
+
+class _ShardHolder:
+    """Thread-local owner of a shard; collected when its thread exits."""
+    
+    __slots__ = ('shard', '__weakref__')
+    
+    def __init__(self, shard: _UsageShard):
+        self.shard = shard
+
+
 class TokenUsageTracker:
     """Track API token usage across the application.
     
     Thread-safe tracker for monitoring token consumption and calculating
     costs across different API services (embeddings, completions).
     
+    Each thread adds to its own counter shard without taking a lock, so
+    concurrent API calls don't serialize on tracking; readers sum all
+    shards. When a thread exits, its shard is folded into a base shard and
+    dropped, so short-lived threads (Streamlit runs, per-call executors)
+    don't grow the shard list while their usage still counts.
+    
     Attributes:
         usage: Dictionary tracking prompt and completion tokens per model
-        embedding_tokens: Total embedding tokens used
+        total_embedding_tokens: Total embedding tokens used
         cost_usd: Running total of estimated costs in USD
     """
     
@@ -28,17 +79,37 @@ class TokenUsageTracker:
     EMBEDDING_COST_PER_1K = 0.00002  # text-embedding-3-small
     GPT4_MINI_PROMPT_COST_PER_1K = 0.00015
     GPT4_MINI_COMPLETION_COST_PER_1K = 0.0006
+    # Per-token rates, so adding usage is a multiply instead of a divide
+    _EMB_PER_TOK = EMBEDDING_COST_PER_1K / 1000.0
+    _PROMPT_PER_TOK = GPT4_MINI_PROMPT_COST_PER_1K / 1000.0
+    _COMP_PER_TOK = GPT4_MINI_COMPLETION_COST_PER_1K / 1000.0
     
     def __init__(self):
-        self.usage = defaultdict(lambda: {"prompt": 0, "completion": 0})
-        self.lock = threading.Lock()
-        
-        # Detailed tracking
-        self.total_tokens = 0
-        self.total_prompt_tokens = 0
-        self.total_completion_tokens = 0
-        self.total_embedding_tokens = 0
-        self.cost_usd = 0.0
+        self.lock = threading.Lock()  # guards the shard list and base only
+        self._base = _UsageShard()  # usage of threads that have exited
+        self._shards = []
+        self._local = threading.local()
+    
+    def _shard(self) -> _UsageShard:
+        """Return the calling thread's shard, registering it on first use."""
+        holder = getattr(self._local, 'holder', None)
+        if holder is None:
+            holder = self._local.holder = _ShardHolder(_UsageShard())
+            with self.lock:
+                self._shards.append(holder.shard)
+            # Thread-local values are released when their thread exits
+            weakref.finalize(holder, TokenUsageTracker._retire_shard,
+                             weakref.ref(self), holder.shard)
+        return holder.shard
+    
+    @staticmethod
+    def _retire_shard(tracker_ref, shard: _UsageShard):
+        tracker = tracker_ref()
+        if tracker is None:
+            return
+        with tracker.lock:
+            tracker._base.merge(shard)
+            tracker._shards.remove(shard)
     
     def add_usage(self, model: str, prompt_tokens: int, completion_tokens: int):
         """Add token usage for a specific model.
@@ -48,19 +119,19 @@ class TokenUsageTracker:
             prompt_tokens: Number of prompt tokens used
             completion_tokens: Number of completion tokens used
         """
-        with self.lock:
-            self.usage[model]["prompt"] += prompt_tokens
-            self.usage[model]["completion"] += completion_tokens
-            self.total_prompt_tokens += prompt_tokens
-            self.total_completion_tokens += completion_tokens
-            self.total_tokens += prompt_tokens + completion_tokens
-            
-            # Calculate cost based on model
-            if "embedding" in model.lower():
-                self.cost_usd += ((prompt_tokens + completion_tokens) / 1000) * self.EMBEDDING_COST_PER_1K
-            else:
-                self.cost_usd += (prompt_tokens / 1000) * self.GPT4_MINI_PROMPT_COST_PER_1K
-                self.cost_usd += (completion_tokens / 1000) * self.GPT4_MINI_COMPLETION_COST_PER_1K
+        shard = self._shard()
+        counts = shard.usage[model]
+        counts["prompt"] += prompt_tokens
+        counts["completion"] += completion_tokens
+        shard.prompt_tokens += prompt_tokens
+        shard.completion_tokens += completion_tokens
+        shard.total_tokens += prompt_tokens + completion_tokens
+        
+        # Calculate cost based on model
+        if _is_embedding_model(model):
+            shard.cost_usd += (prompt_tokens + completion_tokens) * self._EMB_PER_TOK
+        else:
+            shard.cost_usd += prompt_tokens * self._PROMPT_PER_TOK + completion_tokens * self._COMP_PER_TOK
     
     def add_embedding_tokens(self, tokens: int):
         """Track embedding token usage.
@@ -68,10 +139,10 @@ class TokenUsageTracker:
         Args:
             tokens: Number of embedding tokens used
         """
-        with self.lock:
-            self.total_embedding_tokens += tokens
-            self.total_tokens += tokens
-            self.cost_usd += (tokens / 1000) * self.EMBEDDING_COST_PER_1K
+        shard = self._shard()
+        shard.embedding_tokens += tokens
+        shard.total_tokens += tokens
+        shard.cost_usd += tokens * self._EMB_PER_TOK
     
     def add_completion_tokens(self, prompt_tokens: int, completion_tokens: int):
         """Track completion token usage.
@@ -80,12 +151,51 @@ class TokenUsageTracker:
             prompt_tokens: Number of prompt tokens used
             completion_tokens: Number of completion tokens used
         """
+        shard = self._shard()
+        shard.prompt_tokens += prompt_tokens
+        shard.completion_tokens += completion_tokens
+        shard.total_tokens += prompt_tokens + completion_tokens
+        shard.cost_usd += prompt_tokens * self._PROMPT_PER_TOK + completion_tokens * self._COMP_PER_TOK
+    
+    def _sum(self, field: str):
+        with self.lock:
+            return getattr(self._base, field) + sum(
+                getattr(shard, field) for shard in self._shards
+            )
+    
+    @property
+    def total_tokens(self) -> int:
+        return self._sum('total_tokens')
+    
+    @property
+    def total_prompt_tokens(self) -> int:
+        return self._sum('prompt_tokens')
+    
+    @property
+    def total_completion_tokens(self) -> int:
+        return self._sum('completion_tokens')
+    
+    @property
+    def total_embedding_tokens(self) -> int:
+        return self._sum('embedding_tokens')
+    
+    @property
+    def cost_usd(self) -> float:
+        return self._sum('cost_usd')
+    
+    @property
+    def usage(self) -> dict:
+        """Prompt/completion tokens per model, summed over all threads."""
+        merged = _UsageShard()
         with self.lock:
-            self.total_prompt_tokens += prompt_tokens
-            self.total_completion_tokens += completion_tokens
-            self.total_tokens += prompt_tokens + completion_tokens
-            self.cost_usd += (prompt_tokens / 1000) * self.GPT4_MINI_PROMPT_COST_PER_1K
-            self.cost_usd += (completion_tokens / 1000) * self.GPT4_MINI_COMPLETION_COST_PER_1K
+            merged.merge(self._base)  # written by exiting threads, under the lock
+            shards = list(self._shards)
+        merged = merged.usage
+        for shard in shards:
+            for model, counts in list(shard.usage.items()):
+                merged[model]["prompt"] += counts["prompt"]
+                merged[model]["completion"] += counts["completion"]
+        return merged
     
     def get_total_cost(self) -> float:
         """Calculate total cost across all tracked usage.
@@ -93,8 +203,7 @@ class TokenUsageTracker:
         Returns:
             Total estimated cost in USD
         """
-        with self.lock:
-            return round(self.cost_usd, 6)
+        return round(self.cost_usd, 6)
     
     def get_summary(self) -> dict:
         """Get comprehensive usage summary.
@@ -102,25 +211,21 @@ class TokenUsageTracker:
         Returns:
             Dictionary containing token counts and estimated costs
         """
-        with self.lock:
-            return {
-                'total_tokens': self.total_tokens,
-                'embedding_tokens': self.total_embedding_tokens,
-                'prompt_tokens': self.total_prompt_tokens,
-                'completion_tokens': self.total_completion_tokens,
-                'estimated_cost_usd': round(self.cost_usd, 4),
-                'usage_by_model': dict(self.usage)
-            }
+        return {
+            'total_tokens': self.total_tokens,
+            'embedding_tokens': self.total_embedding_tokens,
+            'prompt_tokens': self.total_prompt_tokens,
+            'completion_tokens': self.total_completion_tokens,
+            'estimated_cost_usd': round(self.cost_usd, 4),
+            'usage_by_model': dict(self.usage)
+        }
     
     def reset(self):
         """Reset all counters to zero."""
         with self.lock:
-            self.usage.clear()
-            self.total_tokens = 0
-            self.total_prompt_tokens = 0
-            self.total_completion_tokens = 0
-            self.total_embedding_tokens = 0
-            self.cost_usd = 0.0
+            self._base.clear()
+            for shard in self._shards:
+                shard.clear()
 
 
 class RateLimiter:
@@ -161,14 +266,23 @@ class RateLimiter:
         else:
             raise ValueError("Either max_calls or max_requests_per_minute must be provided")
         
-        self.time_window = timedelta(seconds=time_window)
-        self.calls = []
+        # Integer monotonic_ns timestamps, oldest first (expired calls pop
+        # off the left); window checks are plain int comparisons
+        self.window_ns = int(time_window * 1_000_000_000)
+        self.calls = deque()
         self.lock = threading.Lock()
         # Allow custom sleep function for Streamlit WebSocket keepalive
         self._sleep_func = sleep_func if sleep_func is not None else time.sleep
         # Store original time_window seconds for display messages
         self._time_window_seconds = time_window
     
+    def _expire(self, now: int):
+        """Drop calls outside the window (caller holds the lock)."""
+        cutoff = now - self.window_ns
+        calls = self.calls
+        while calls and calls[0] <= cutoff:
+            calls.popleft()
+    
     def allow_request(self) -> bool:
         """Check if a request is allowed under the rate limit.
         
@@ -176,9 +290,8 @@ class RateLimiter:
             True if request is allowed, False if rate limit exceeded
         """
         with self.lock:
-            now = datetime.now()
-            # Remove old calls outside the time window
-            self.calls = [t for t in self.calls if now - t < self.time_window]
+            now = time.monotonic_ns()
+            self._expire(now)
             
             if len(self.calls) < self.max_calls:
                 self.calls.append(now)
@@ -191,33 +304,27 @@ class RateLimiter:
         This method blocks until a request slot is available.
         Compatible with the existing RateLimiter interface used in api_clients.py.
         Uses the custom sleep function if provided (e.g., for Streamlit WebSocket keepalive).
+        
+        Slots only free up as calls age out of the window, so each waiter
+        sleeps (without the lock) until the oldest call expires and then
+        re-checks; when several threads wake for one slot, the losers wait
+        for the next expiry instead of all recording a call.
         """
         if self.max_calls <= 0:
             return
         
-        with self.lock:
-            now = datetime.now()
-            # Remove old calls outside the time window
-            self.calls = [t for t in self.calls if now - t < self.time_window]
-            
-            if len(self.calls) >= self.max_calls:
-                # Calculate wait time until oldest call expires
-                oldest_call = min(self.calls)
-                wait_seconds = (self.time_window - (now - oldest_call)).total_seconds() + 0.1
+        while True:
+            with self.lock:
+                now = time.monotonic_ns()
+                self._expire(now)
                 
-                if wait_seconds > 0:
-                    # Release lock during sleep
-                    self.lock.release()
-                    try:
-                        self._sleep_func(wait_seconds)
-                    finally:
-                        self.lock.acquire()
-                    
-                    # Refresh the calls list after waiting
-                    now = datetime.now()
-                    self.calls = [t for t in self.calls if now - t < self.time_window]
+                if len(self.calls) < self.max_calls:
+                    self.calls.append(now)
+                    return
+                # Time until the oldest call leaves the window
+                wait_seconds = (self.calls[0] + self.window_ns - now) / 1e9
             
-            self.calls.append(datetime.now())
+            self._sleep_func(wait_seconds)
     
     def get_remaining_calls(self) -> int:
         """Get the number of remaining calls allowed in current window.
@@ -226,8 +333,7 @@ class RateLimiter:
             Number of calls remaining before rate limit is hit
         """
         with self.lock:
-            now = datetime.now()
-            self.calls = [t for t in self.calls if now - t < self.time_window]
+            self._expire(time.monotonic_ns())
             return max(0, self.max_calls - len(self.calls))
     
     def get_reset_time(self) -> float:
@@ -238,12 +344,10 @@ class RateLimiter:
             or 0 if no calls are tracked
         """
         with self.lock:
-            now = datetime.now()
-            self.calls = [t for t in self.calls if now - t < self.time_window]
+            now = time.monotonic_ns()
+            self._expire(now)
             
             if not self.calls:
                 return 0.0
             
-            oldest_call = min(self.calls)
-            reset_time = (self.time_window - (now - oldest_call)).total_seconds()
-            return max(0.0, reset_time)
+            return max(0.0, (self.calls[0] + self.window_ns - now) / 1e9)
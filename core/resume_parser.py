@@ -15,21 +15,58 @@ Consolidated from:
 
 import re
 import json
+import time
+import random
+import sqlite3
+import hashlib
+import threading
+import openai
 import requests
+import streamlit as st
+from pathlib import Path
 from typing import Dict, Optional, Tuple
 
+from core.azure_client import get_azure_openai_client
+
+# Transient Azure OpenAI errors retried by GPT4JobRoleDetector._create_completion
+# (APITimeoutError is an APIConnectionError; InternalServerError covers 5xx)
+_RETRYABLE_ERRORS = (openai.RateLimitError, openai.APIConnectionError,
+                     openai.InternalServerError)
+
 # Lazy imports for document processing
-_PyPDF2 = None
+_fitz = None
 _Document = None
+_tiktoken_encoding = None
+
+
+def _get_fitz():
+    """Lazy load PyMuPDF (fitz)."""
+    global _fitz
+    if _fitz is None:
+        import fitz
+        _fitz = fitz
+    return _fitz
 
 
-def _get_pypdf2():
-    """Lazy load PyPDF2."""
-    global _PyPDF2
-    if _PyPDF2 is None:
-        import PyPDF2
-        _PyPDF2 = PyPDF2
-    return _PyPDF2
+def _get_tiktoken_encoding():
+    """Lazy load tiktoken cl100k_base encoding."""
+    global _tiktoken_encoding
+    if _tiktoken_encoding is None:
+        import tiktoken
+        _tiktoken_encoding = tiktoken.get_encoding("cl100k_base")
+    return _tiktoken_encoding
+
+
+def _truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Truncate text to at most ``max_tokens`` tokens (chars fallback ~4/token)."""
+    try:
+        encoding = _get_tiktoken_encoding()
+    except Exception:
+        return text[:max_tokens * 4]
+    tokens = encoding.encode(text)
+    if len(tokens) <= max_tokens:
+        return text
+    return encoding.decode(tokens[:max_tokens])
 
 
 def _get_docx_document():
@@ -41,6 +78,67 @@ def _get_docx_document():
     return _Document
 
 
+def _extract_pdf_text(pdf_file) -> str:
+    """Extract text from a PDF using PyMuPDF's C-level text extraction.
+    
+    Pages are extracted sequentially: PyMuPDF is not thread-safe and keeps
+    the GIL during extraction, so a thread pool would add overhead without
+    parallelism on resume-sized documents.
+    
+    Args:
+        pdf_file: File-like object containing PDF data
+        
+    Returns:
+        Extracted text content (one block per page)
+    """
+    fitz = _get_fitz()
+    # Reset file position to beginning
+    pdf_file.seek(0)
+    doc = fitz.open(stream=pdf_file.read(), filetype="pdf")
+    try:
+        pages = (page.get_text("text") for page in doc)
+        return "".join(f"{text}\n" for text in pages if text)
+    finally:
+        doc.close()
+
+
+def _iter_container_text(container):
+    """Yield paragraph texts of a body/header/footer, including table cells."""
+    for paragraph in container.paragraphs:
+        yield paragraph.text
+    for table in container.tables:
+        for row in table.rows:
+            for cell in row.cells:
+                for paragraph in cell.paragraphs:
+                    yield paragraph.text
+
+
+def _iter_docx_text(doc, qn):
+    """Lazily yield every text fragment of a DOCX document in reading order."""
+    # 1-2. Paragraphs and tables (Main Body)
+    yield from _iter_container_text(doc)
+    
+    # 3. Headers and Footers
+    for section in doc.sections:
+        for part in (section.header, section.first_page_header, section.even_page_header,
+                     section.footer, section.first_page_footer, section.even_page_footer):
+            if part:
+                yield from _iter_container_text(part)
+    
+    # 4. Text Boxes (XML iteration)
+    # Resumes often use text boxes for sidebars or contact info
+    try:
+        for element in doc.element.body.iter():
+            if element.tag.endswith('txbxContent'):
+                for p in element.iter(qn('w:p')):
+                    text = "".join(t.text for t in p.iter(qn('w:t')) if t.text)
+                    if text:
+                        yield text
+    except Exception:
+        # Gracefully fail on advanced XML extraction if structure is unexpected
+        pass
+
+
 def _extract_docx_text_robust(docx_file) -> str:
     """Robust extraction of text from DOCX including headers, footers, and text boxes.
     
@@ -58,60 +156,8 @@ def _extract_docx_text_robust(docx_file) -> str:
         docx_file.seek(0)
         doc = Document(docx_file)
         
-        full_text = []
-        
-        # 1. Extract text from paragraphs (Main Body)
-        for paragraph in doc.paragraphs:
-            full_text.append(paragraph.text)
-            
-        # 2. Extract text from tables (Main Body)
-        for table in doc.tables:
-            for row in table.rows:
-                for cell in row.cells:
-                    for paragraph in cell.paragraphs:
-                        full_text.append(paragraph.text)
-        
-        # 3. Extract text from Headers and Footers
-        for section in doc.sections:
-            # Headers
-            for header in [section.header, section.first_page_header, section.even_page_header]:
-                if header:
-                    for paragraph in header.paragraphs:
-                        full_text.append(paragraph.text)
-                    for table in header.tables:
-                        for row in table.rows:
-                            for cell in row.cells:
-                                for paragraph in cell.paragraphs:
-                                    full_text.append(paragraph.text)
-            
-            # Footers
-            for footer in [section.footer, section.first_page_footer, section.even_page_footer]:
-                if footer:
-                    for paragraph in footer.paragraphs:
-                        full_text.append(paragraph.text)
-                    for table in footer.tables:
-                        for row in table.rows:
-                            for cell in row.cells:
-                                for paragraph in cell.paragraphs:
-                                    full_text.append(paragraph.text)
-        
-        # 4. Extract text from Text Boxes (XML iteration)
-        # Resumes often use text boxes for sidebars or contact info
-        try:
-            for element in doc.element.body.iter():
-                if element.tag.endswith('txbxContent'):
-                    for p in element.iter(qn('w:p')):
-                        text_content = []
-                        for t in p.iter(qn('w:t')):
-                            if t.text:
-                                text_content.append(t.text)
-                        if text_content:
-                            full_text.append("".join(text_content))
-        except Exception:
-            # Gracefully fail on advanced XML extraction if structure is unexpected
-            pass
-        
-        return "\n".join([t for t in full_text if t.strip()])
+        # Single pass: join consumes the generator, no intermediate list
+        return "\n".join(t for t in _iter_docx_text(doc, qn) if t.strip())
     except Exception as e:
         raise Exception(f"Error reading DOCX: {str(e)}")
 
@@ -143,16 +189,7 @@ class ResumeParser:
             Exception: If PDF cannot be read
         """
         try:
-            PyPDF2 = _get_pypdf2()
-            # Reset file position to beginning
-            pdf_file.seek(0)
-            text = ""
-            pdf_reader = PyPDF2.PdfReader(pdf_file)
-            for page in pdf_reader.pages:
-                extracted = page.extract_text()
-                if extracted:
-                    text += extracted + "\n"
-            return text
+            return _extract_pdf_text(pdf_file)
         except Exception as e:
             raise Exception(f"Error reading PDF: {str(e)}")
     
@@ -266,10 +303,263 @@ class ResumeParser:
         return extract_structured_profile(resume_text, enable_verification, config)
 
 
+# ============================================================================
+# LOCAL SKILL/ROLE EXTRACTION (GPT-4 FAST-PATH)
+# ============================================================================
+
+SKILL_SET = frozenset({
+    # Programming languages
+    "Python", "Java", "JavaScript", "TypeScript", "C++", "C#", "Go", "Rust",
+    "Scala", "Kotlin", "Swift", "PHP", "Ruby", "SQL", "MATLAB", "VBA",
+    # Data & analytics
+    "Excel", "Tableau", "Power BI", "Looker", "SAS", "SPSS", "Pandas", "NumPy",
+    "Spark", "Hadoop", "Airflow", "dbt", "Snowflake", "Databricks", "ETL",
+    "Data Analysis", "Data Visualization", "Statistics", "Machine Learning",
+    "Deep Learning", "NLP", "Computer Vision", "TensorFlow", "PyTorch",
+    "scikit-learn", "A/B Testing",
+    # Engineering & cloud
+    "AWS", "Azure", "GCP", "Docker", "Kubernetes", "Terraform", "Linux", "Git",
+    "CI/CD", "REST", "GraphQL", "Microservices", "React", "Angular", "Vue",
+    "Node.js", "Django", "Flask", "Spring", "PostgreSQL", "MySQL", "MongoDB",
+    "Redis", "Kafka",
+    # Business & delivery
+    "Salesforce", "SAP", "Jira", "Confluence", "Agile", "Scrum", "Kanban",
+    "Project Management", "Program Management", "Product Management",
+    "Stakeholder Management", "Risk Management", "Financial Modeling",
+    "Budgeting", "Forecasting", "Business Analysis", "Digital Marketing", "SEO",
+    # Soft skills
+    "Leadership", "Communication", "Negotiation", "Problem Solving",
+    "Team Management", "Mentoring",
+})
+
+# Listed in the analysis but not counted towards min_skills: almost every
+# resume mentions them, so they say nothing about the role
+SOFT_SKILLS = frozenset({
+    "Leadership", "Communication", "Negotiation", "Problem Solving",
+    "Team Management", "Mentoring",
+})
+
+# Skills that are also everyday words ("go hiking in spring") are matched
+# with their exact capitalization, as are acronyms ("SQL", "REST", "SAS")
+_COMMON_WORD_SKILLS = frozenset({
+    "Go", "Rust", "Swift", "Ruby", "Java", "Excel", "Spark", "Spring",
+    "Azure", "React", "Angular", "Flask", "Airflow", "Snowflake", "Looker",
+    "Confluence", "Agile", "Scrum", "Kanban", "Statistics", "Budgeting",
+    "Forecasting", "Leadership", "Communication", "Negotiation", "Mentoring",
+})
+_CASE_SENSITIVE_SKILLS = frozenset(
+    skill for skill in SKILL_SET
+    if skill in _COMMON_WORD_SKILLS or (skill.isupper() and " " not in skill)
+)
+
+_SKILL_CANONICAL = {skill.lower(): skill for skill in SKILL_SET}
+
+
+def _skill_pattern(skills, flags: int = 0):
+    # Longest alternatives first so "Power BI" wins over shorter overlaps;
+    # lookarounds instead of \b so "C++"/"C#" match at their symbol boundaries.
+    return re.compile(
+        r"(?<![\w+#])("
+        + "|".join(re.escape(s) for s in sorted(skills, key=len, reverse=True))
+        + r")(?![\w+#])",
+        flags
+    )
+
+
+_SKILL_PATTERN = _skill_pattern(SKILL_SET - _CASE_SENSITIVE_SKILLS, re.IGNORECASE)
+_EXACT_SKILL_PATTERN = _skill_pattern(_CASE_SENSITIVE_SKILLS)
+
+_TITLE_PATTERN = re.compile(
+    r"\b(?:(Junior|Senior|Lead|Principal|Staff|Head of|Chief)[ \t]+)?"
+    r"((?:[A-Z][A-Za-z/&]+[ \t]+){0,3}"
+    r"(?:Engineer|Developer|Analyst|Scientist|Manager|Designer|Consultant|Architect|Accountant))\b"
+)
+
+_SENIORITY_MAP = {
+    "junior": "Junior",
+    "senior": "Senior",
+    "lead": "Lead",
+    "principal": "Lead",
+    "staff": "Lead",
+    "head of": "Executive",
+    "chief": "Executive",
+}
+
+
+def local_resume_analysis(resume_text: str, min_skills: int = 8) -> Optional[Dict]:
+    """Build a resume analysis locally when the resume is unambiguous.
+    
+    Matches skills against SKILL_SET and looks for a clear job title in the
+    first 200 characters. Returns None when fewer than ``min_skills`` skills
+    (not counting SOFT_SKILLS) are found or no title is detected, so the
+    caller can fall back to GPT-4.
+    
+    Args:
+        resume_text: Resume text
+        min_skills: Minimum distinct skills required to trust the result
+        
+    Returns:
+        Analysis dict in the GPT-4 output shape, or None
+    """
+    if not resume_text:
+        return None
+    
+    title_match = _TITLE_PATTERN.search(resume_text[:200])
+    if not title_match:
+        return None
+    
+    matches = sorted(
+        [*_SKILL_PATTERN.finditer(resume_text), *_EXACT_SKILL_PATTERN.finditer(resume_text)],
+        key=lambda match: match.start()
+    )
+    hard_skills, soft_skills = [], []
+    seen = set()
+    for match in matches:
+        key = match.group(1).lower()
+        if key not in seen:
+            seen.add(key)
+            skill = _SKILL_CANONICAL[key]
+            (soft_skills if skill in SOFT_SKILLS else hard_skills).append(skill)
+    
+    if len(hard_skills) < min_skills:
+        return None
+    # Hard skills first: the leading ones become search terms
+    skills = hard_skills + soft_skills
+    
+    level_word = (title_match.group(1) or "").lower()
+    role = title_match.group(2).strip()
+    seniority = _SENIORITY_MAP.get(level_word, "Mid-Level")
+    
+    return {
+        "primary_role": role,
+        "simple_search_terms": [role] + skills[:2],
+        "confidence": 0.75,
+        "seniority_level": seniority,
+        "skills": skills,
+        "core_strengths": skills[:3],
+        "job_search_keywords": [role] + skills[:3],
+        "optimal_search_query": role,
+        "location_preference": "",
+        "industries": [],
+        "alternative_roles": [],
+        "_local_analysis": True
+    }
+
+
 # ============================================================================
 # GPT-4 JOB ROLE DETECTOR
 # ============================================================================
 
+# Words per embedded resume chunk: the embedding model truncates at 256 word
+# pieces, so longer text is embedded piecewise instead of by its head only
+RESUME_EMBED_CHUNK_WORDS = 150
+
+
+class ResumeAnalysisCache:
+    """SQLite-backed semantic cache of GPT-4 resume analyses.
+    
+    Each entry stores the SHA-256 of the (truncated) resume text and one
+    normalized embedding per RESUME_EMBED_CHUNK_WORDS chunk of it, with the
+    analysis JSON. ``get_exact`` serves re-uploads of the same text;
+    ``lookup`` serves near-identical resumes, only when every chunk reaches
+    the similarity threshold against a resume with the same chunk count,
+    so an edit anywhere in the text (not just the header) misses.
+    """
+    
+    def __init__(self, db_path: str, threshold: float = 0.97,
+                 ttl_hours: float = 168, max_candidates: int = 200):
+        self.db_path = Path(db_path)
+        self.threshold = threshold
+        self.ttl_seconds = ttl_hours * 3600
+        self.max_candidates = max_candidates
+        self._conn = None
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def make_hash(resume_text: str) -> str:
+        """SHA-256 of the resume text an analysis was produced from."""
+        return hashlib.sha256(resume_text.encode('utf-8')).hexdigest()
+    
+    def _get_conn(self):
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS analysis_cache (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    embedding BLOB NOT NULL,
+                    analysis_json TEXT NOT NULL,
+                    ts REAL NOT NULL,
+                    text_hash TEXT
+                )
+            """)
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(analysis_cache)")}
+            if 'text_hash' not in columns:
+                self._conn.execute("ALTER TABLE analysis_cache ADD COLUMN text_hash TEXT")
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_analysis_cache_ts ON analysis_cache(ts)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_analysis_cache_hash ON analysis_cache(text_hash)"
+            )
+            self._conn.commit()
+        return self._conn
+    
+    def get_exact(self, text_hash: str) -> Optional[Dict]:
+        """Return the newest recent analysis of exactly this resume text, or None."""
+        cutoff = time.time() - self.ttl_seconds
+        with self._lock:
+            row = self._get_conn().execute(
+                "SELECT analysis_json FROM analysis_cache "
+                "WHERE text_hash = ? AND ts >= ? ORDER BY ts DESC LIMIT 1",
+                (text_hash, cutoff)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+    
+    def lookup(self, embedding) -> Optional[Dict]:
+        """Return the cached analysis for the closest recent resume, or None.
+        
+        Args:
+            embedding: One normalized vector, or a (chunks, dim) array with
+                one vector per resume chunk
+        """
+        import numpy as np
+        query = np.atleast_2d(np.asarray(embedding, dtype=np.float32))
+        cutoff = time.time() - self.ttl_seconds
+        with self._lock:
+            rows = self._get_conn().execute(
+                "SELECT embedding, analysis_json FROM analysis_cache "
+                "WHERE ts >= ? ORDER BY ts DESC LIMIT ?",
+                (cutoff, self.max_candidates)
+            ).fetchall()
+        
+        best_score, best_payload = -1.0, None
+        for blob, payload in rows:
+            vec = np.frombuffer(blob, dtype=np.float32)
+            if vec.size != query.size:
+                continue
+            # The least similar chunk decides: every part must match
+            score = float((vec.reshape(query.shape) * query).sum(axis=1).min())
+            if score > best_score:
+                best_score, best_payload = score, payload
+        if best_payload is None or best_score < self.threshold:
+            return None
+        return json.loads(best_payload)
+    
+    def store(self, embedding, analysis: Dict, text_hash: Optional[str] = None):
+        """Insert an analysis keyed by its resume embedding(s) and text hash."""
+        import numpy as np
+        blob = b"" if embedding is None else np.asarray(embedding, dtype=np.float32).tobytes()
+        with self._lock:
+            conn = self._get_conn()
+            conn.execute(
+                "INSERT INTO analysis_cache (embedding, analysis_json, ts, text_hash) "
+                "VALUES (?, ?, ?, ?)",
+                (blob, json.dumps(analysis), time.time(), text_hash)
+            )
+            conn.commit()
+
+
 class GPT4JobRoleDetector:
     """Use GPT-4 to detect job roles and extract skills dynamically.
     
@@ -288,96 +578,146 @@ class GPT4JobRoleDetector:
         """
         self._client = None
         self._config = config
+        self._matcher = None
         
         if config is None:
             from config import Config
             self._config = Config
         
-        self.model = self._config.AZURE_MODEL
+        self.model = getattr(self._config, 'RESUME_ANALYSIS_MODEL', None) or self._config.AZURE_MODEL
+        self.max_input_tokens = getattr(self._config, 'RESUME_ANALYSIS_MAX_INPUT_TOKENS', 750)
+        self.analysis_cache = ResumeAnalysisCache(
+            getattr(self._config, 'DB_PATH_ANALYSIS_CACHE', 'analysis_cache.db'),
+            threshold=getattr(self._config, 'ANALYSIS_CACHE_THRESHOLD', 0.97),
+            ttl_hours=getattr(self._config, 'ANALYSIS_CACHE_TTL_HOURS', 168),
+            max_candidates=getattr(self._config, 'ANALYSIS_CACHE_MAX_CANDIDATES', 200)
+        )
     
     @property
     def client(self):
         """Lazy-load AzureOpenAI client only when needed."""
         if self._client is None:
-            from openai import AzureOpenAI
-            import httpx
-            
-            # Clean endpoint
-            endpoint = self._config.AZURE_ENDPOINT
-            if endpoint:
-                endpoint = endpoint.rstrip('/')
-                if endpoint.endswith('/openai'):
-                    endpoint = endpoint[:-7]
-            
-            # Create a custom http client that ignores SSL errors
-            http_client = httpx.Client(verify=False)
-
-            self._client = AzureOpenAI(
-                azure_endpoint=endpoint,
-                api_key=self._config.AZURE_API_KEY,
-                api_version=self._config.AZURE_API_VERSION,
-                http_client=http_client
+            # Retries are handled in _create_completion (with model fallback)
+            self._client = get_azure_openai_client(
+                self._config.AZURE_ENDPOINT,
+                self._config.AZURE_API_KEY,
+                self._config.AZURE_API_VERSION,
+                verify=False,
+                max_retries=0
             )
         return self._client
     
-    def analyze_resume_for_job_roles(self, resume_data: Dict) -> Dict:
+    def _create_completion(self, max_attempts: int = 3, max_wait: float = 20.0, **kwargs):
+        """Create a chat completion with backoff and a fallback deployment.
+        
+        Rate-limit, timeout, connection and 5xx errors are retried with
+        randomized exponential backoff. If the primary deployment still
+        fails, the configured AZURE_FALLBACK_MODEL (when set) gets the same
+        treatment; if that deployment doesn't exist, the primary
+        deployment's error is raised.
+        
+        Args:
+            max_attempts: Attempts per deployment
+            max_wait: Upper bound on a single backoff sleep (seconds)
+            **kwargs: Passed to chat.completions.create (except model)
+        """
+        models = [self.model]
+        fallback = getattr(self._config, 'AZURE_FALLBACK_MODEL', None)
+        if fallback and fallback != self.model:
+            models.append(fallback)
+        
+        last_error = None
+        for model in models:
+            if model != self.model:
+                print(f"🔁 Falling back to deployment '{model}'...")
+            for attempt in range(max_attempts):
+                try:
+                    return self.client.chat.completions.create(model=model, **kwargs)
+                except openai.NotFoundError:
+                    if last_error is None:
+                        raise
+                    print(f"⚠️ Fallback deployment '{model}' not found")
+                    raise last_error
+                except _RETRYABLE_ERRORS as e:
+                    last_error = e
+                    if attempt < max_attempts - 1:
+                        delay = random.uniform(0, min(max_wait, 2 ** (attempt + 1)))
+                        print(f"⏳ {type(e).__name__}, retrying in {delay:.1f}s "
+                              f"(attempt {attempt + 1}/{max_attempts})...")
+                        time.sleep(delay)
+        raise last_error
+    
+    def _embed_resume(self, resume_text: str):
+        """Embed resume text per RESUME_EMBED_CHUNK_WORDS chunk, or None if unavailable.
+        
+        Returns:
+            float32 ndarray of shape (chunks, dim)
+        """
+        try:
+            if self._matcher is None:
+                from core.job_matcher import JobMatcher
+                self._matcher = JobMatcher(self._config)
+            words = resume_text.split()
+            chunks = [" ".join(words[i:i + RESUME_EMBED_CHUNK_WORDS])
+                      for i in range(0, len(words), RESUME_EMBED_CHUNK_WORDS)]
+            return self._matcher.generate_embeddings_batch(chunks)
+        except Exception as e:
+            print(f"⚠️ Resume embedding unavailable, skipping analysis cache: {e}")
+            return None
+    
+    def analyze_resume_for_job_roles(self, resume_data: Dict, no_cache: bool = False,
+                                     use_local: bool = True) -> Dict:
         """Analyze resume with GPT-4 - Extract ALL skills dynamically.
         
+        Unambiguous resumes (clear title line and enough known skills) are
+        analyzed locally without an API call. Results are cached by resume
+        text hash and per-chunk embeddings; the same text, or a resume whose
+        every chunk is near-identical (cosine similarity above the
+        configured threshold), returns the cached analysis.
+        
         Args:
             resume_data: Dictionary with 'raw_text' key containing resume text
+            no_cache: Bypass the semantic analysis cache
+            use_local: Try the local regex fast-path before GPT-4
             
         Returns:
             Dictionary with extracted skills, role, and analysis
         """
-        resume_text = resume_data.get('raw_text', '')[:3000]
-        
-        system_prompt = """You are an expert career advisor and resume analyst.
-
-Analyze the resume and extract:
-1. ALL skills (technical, soft skills, tools, languages, frameworks, methodologies, domain knowledge)
-2. Job role recommendations
-3. Seniority level
-4. SIMPLE job search keywords (for job board APIs)
-
-IMPORTANT for job search:
-- Provide a SIMPLE primary role (e.g., "Program Manager" not complex OR/AND queries)
-- Keep search keywords SHORT and COMMON
-- Avoid complex boolean logic in search queries
-
-Return JSON with this EXACT structure:
-{
-    "primary_role": "Simple job title (e.g., Program Manager)",
-    "simple_search_terms": ["term1", "term2", "term3"],
-    "confidence": 0.95,
-    "seniority_level": "Junior/Mid-Level/Senior/Lead/Executive",
-    "skills": ["skill1", "skill2", "skill3", ...],
-    "core_strengths": ["strength1", "strength2", "strength3"],
-    "job_search_keywords": ["keyword1", "keyword2"],
-    "optimal_search_query": "Simple search string (just the job title)",
-    "location_preference": "Detected or 'United States'",
-    "industries": ["industry1", "industry2"],
-    "alternative_roles": ["role1", "role2", "role3"]
-}"""
-
-        user_prompt = f"""Analyze this resume and extract ALL information:
-
-RESUME:
-{resume_text}
-
-IMPORTANT - Extract ALL skills including:
-- Programming languages (Python, R, SQL, etc.)
-- Tools and software (Tableau, Salesforce, Excel, etc.)
-- Methodologies (Agile, Scrum, Kanban, etc.)
-- Soft skills (Leadership, Communication, etc.)
-- Domain expertise (Banking, Finance, Analytics, etc.)
-- Technical skills (Data Analysis, Machine Learning, etc.)
-- Languages (English, Cantonese, Mandarin, etc.)
-
-For job search, provide SIMPLE terms that would work on LinkedIn/Indeed (not complex boolean queries).
-
-Be thorough and creative!"""
+        if use_local:
+            local = local_resume_analysis(resume_data.get('raw_text', ''))
+            if local is not None:
+                print(f"⚡ Local resume analysis: {local['primary_role']} ({len(local['skills'])} skills)")
+                return local
+        
+        resume_text = _truncate_to_tokens(resume_data.get('raw_text', ''), self.max_input_tokens)
+        
+        resume_hash = ResumeAnalysisCache.make_hash(resume_text)
+        resume_embedding = None
+        if not no_cache and resume_text.strip():
+            # Same text first (no embedding needed), then near-duplicates
+            try:
+                cached = self.analysis_cache.get_exact(resume_hash)
+                if cached is None:
+                    resume_embedding = self._embed_resume(resume_text)
+                    if resume_embedding is not None:
+                        cached = self.analysis_cache.lookup(resume_embedding)
+            except Exception as e:
+                print(f"⚠️ Analysis cache lookup failed: {e}")
+                cached = None
+            if cached is not None:
+                print("⚡ Using cached GPT-4 resume analysis")
+                return cached
+        
+        system_prompt = """You are a resume analyst. Return JSON with keys:
+primary_role (simple job title), simple_search_terms (list), confidence (0-1),
+seniority_level (Junior/Mid-Level/Senior/Lead/Executive), skills (all technical,
+soft, tool, methodology, domain and language skills), core_strengths (3),
+job_search_keywords (list), optimal_search_query (job title only),
+location_preference, industries (list), alternative_roles (list).
+Use short, common job-board terms; no boolean queries."""
+
+        user_prompt = f"RESUME:\n{resume_text}"
 
-        import openai
         try:
             # Check if API keys are configured before attempting API call
             is_configured, error_msg = self._config.check_azure_credentials()
@@ -397,14 +737,13 @@ Be thorough and creative!"""
                 return fallback
             
             print("🤖 Calling GPT-4 for resume analysis...")
-            response = self.client.chat.completions.create(
-                model=self.model,
+            response = self._create_completion(
                 messages=[
                     {"role": "system", "content": system_prompt},
                     {"role": "user", "content": user_prompt}
                 ],
-                temperature=0.7,
-                max_tokens=2000,
+                temperature=0.2,
+                max_tokens=900,
                 response_format={"type": "json_object"}
             )
             
@@ -428,6 +767,13 @@ Be thorough and creative!"""
             # Validate that we got meaningful data
             if not ai_analysis.get('primary_role') or ai_analysis.get('primary_role') == 'Professional':
                 ai_analysis['_analysis_incomplete'] = True
+            elif resume_text.strip():
+                try:
+                    if resume_embedding is None:
+                        resume_embedding = self._embed_resume(resume_text)
+                    self.analysis_cache.store(resume_embedding, ai_analysis, resume_hash)
+                except Exception as e:
+                    print(f"⚠️ Could not cache resume analysis: {e}")
             
             return ai_analysis
             
@@ -473,6 +819,47 @@ Be thorough and creative!"""
         }
 
 
+@st.cache_resource(show_spinner=False)
+def get_gpt4_detector() -> GPT4JobRoleDetector:
+    """Get the process-wide GPT4JobRoleDetector (keeps its Azure client alive)."""
+    return GPT4JobRoleDetector()
+
+
+class _UncacheableAnalysis(Exception):
+    """Carries a failed analysis out of the st.cache_data wrapper uncached."""
+    
+    def __init__(self, analysis: Dict):
+        super().__init__(analysis.get('_error', 'analysis failed'))
+        self.analysis = analysis
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _analyze_resume_cached(resume_hash: str, _resume_data: Dict) -> Dict:
+    analysis = get_gpt4_detector().analyze_resume_for_job_roles(_resume_data)
+    if analysis.get('_analysis_failed'):
+        raise _UncacheableAnalysis(analysis)
+    return analysis
+
+
+def analyze_resume_cached(resume_data: Dict) -> Dict:
+    """Analyze a resume, memoized in-process for an hour by resume text hash.
+    
+    Failed analyses are returned but not cached, so a fixed configuration
+    or transient API error is retried on the next call.
+    
+    Args:
+        resume_data: Dictionary with 'raw_text' key containing resume text
+        
+    Returns:
+        Analysis dictionary (a copy, safe to mutate)
+    """
+    resume_hash = hashlib.sha256(resume_data.get('raw_text', '').encode('utf-8')).hexdigest()
+    try:
+        return _analyze_resume_cached(resume_hash, resume_data)
+    except _UncacheableAnalysis as e:
+        return e.analysis
+
+
 # ============================================================================
 # PROFILE EXTRACTION FUNCTIONS
 # ============================================================================
@@ -599,25 +986,10 @@ def extract_structured_profile(resume_text: str, enable_verification: bool = Fal
             print(f"❌ Configuration Error: {error_msg}")
             return None
         
-        from openai import AzureOpenAI
-        import openai
-        import httpx
-        
-        # Clean endpoint to prevent double /openai path issues
-        endpoint = config.AZURE_ENDPOINT
-        if endpoint:
-            endpoint = endpoint.rstrip('/')
-            if endpoint.endswith('/openai'):
-                endpoint = endpoint[:-7]
-        
-        # Create a custom http client that ignores SSL errors
-        http_client = httpx.Client(verify=False)
-
-        client = AzureOpenAI(
-            azure_endpoint=endpoint,
-            api_key=config.AZURE_API_KEY,
-            api_version=config.AZURE_API_VERSION,
-            http_client=http_client
+        # Shared client (TLS verification off, as some cloud hosts need it)
+        client = get_azure_openai_client(
+            config.AZURE_ENDPOINT, config.AZURE_API_KEY, config.AZURE_API_VERSION,
+            verify=False
         )
         
         # FIRST PASS: Initial extraction
@@ -767,25 +1139,10 @@ def generate_tailored_resume(user_profile: Dict, job_posting: Dict,
             print(f"❌ Configuration Error: {error_msg}")
             return None
         
-        from openai import AzureOpenAI
-        import openai
-        import httpx
-        
-        # Clean endpoint
-        endpoint = config.AZURE_ENDPOINT
-        if endpoint:
-            endpoint = endpoint.rstrip('/')
-            if endpoint.endswith('/openai'):
-                endpoint = endpoint[:-7]
-        
-        # Create a custom http client that ignores SSL errors
-        http_client = httpx.Client(verify=False)
-
-        client = AzureOpenAI(
-            azure_endpoint=endpoint,
-            api_key=config.AZURE_API_KEY,
-            api_version=config.AZURE_API_VERSION,
-            http_client=http_client
+        # Shared client (TLS verification off, as some cloud hosts need it)
+        client = get_azure_openai_client(
+            config.AZURE_ENDPOINT, config.AZURE_API_KEY, config.AZURE_API_VERSION,
+            verify=False
         )
         
         system_instructions = """You are an expert resume writer with expertise in ATS optimization and career coaching.
@@ -911,14 +1268,7 @@ def extract_text_from_resume(uploaded_file) -> Optional[str]:
         file_type = uploaded_file.name.split('.')[-1].lower()
         
         if file_type == 'pdf':
-            PyPDF2 = _get_pypdf2()
-            uploaded_file.seek(0)
-            pdf_reader = PyPDF2.PdfReader(uploaded_file)
-            text = ""
-            for page in pdf_reader.pages:
-                extracted = page.extract_text()
-                if extracted:
-                    text += extracted + "\n"
+            text = _extract_pdf_text(uploaded_file)
             
             # Check if we got any text
             if not text or len(text.strip()) < 20:
@@ -1311,24 +1661,10 @@ def extract_job_posting_from_text(job_text: str, config=None) -> Optional[Dict]:
             print(f"❌ Configuration Error: {error_msg}")
             return None
         
-        from openai import AzureOpenAI
-        import httpx
-        
-        # Clean endpoint
-        endpoint = config.AZURE_ENDPOINT
-        if endpoint:
-            endpoint = endpoint.rstrip('/')
-            if endpoint.endswith('/openai'):
-                endpoint = endpoint[:-7]
-        
-        # Create a custom http client
-        http_client = httpx.Client(verify=False)
-
-        client = AzureOpenAI(
-            azure_endpoint=endpoint,
-            api_key=config.AZURE_API_KEY,
-            api_version=config.AZURE_API_VERSION,
-            http_client=http_client
+        # Shared client (TLS verification off, as some cloud hosts need it)
+        client = get_azure_openai_client(
+            config.AZURE_ENDPOINT, config.AZURE_API_KEY, config.AZURE_API_VERSION,
+            verify=False
         )
         
         prompt = f"""You are a job posting parser. Extract structured information from the following job description text.
@@ -11,6 +11,8 @@ import re
 import json
 from typing import List, Dict, Optional, Tuple
 
+from core.azure_client import get_azure_openai_client
+
 
 class SalaryAnalyzer:
     """Handles salary filtering and analysis"""
@@ -81,11 +83,8 @@ class SalaryAnalyzer:
             if not is_configured:
                 return SalaryAnalyzer.extract_salary_from_text_regex(text)
             
-            from openai import AzureOpenAI
-            client = AzureOpenAI(
-                azure_endpoint=config.AZURE_ENDPOINT,
-                api_key=config.AZURE_API_KEY,
-                api_version=config.AZURE_API_VERSION
+            client = get_azure_openai_client(
+                config.AZURE_ENDPOINT, config.AZURE_API_KEY, config.AZURE_API_VERSION
             )
             
             prompt = f"""Extract salary information from this job description text. 
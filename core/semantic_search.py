@@ -391,15 +391,21 @@ class SemanticJobSearch:
                     if token_tracker:
                         token_tracker.add_embedding_tokens(tokens_used)
                     
+                    # One upsert for the whole batch instead of one per job;
+                    # Chroma rejects duplicate ids within a single call
+                    seen_hashes = set()
+                    new_pairs = []
                     for idx, emb in zip(indices_to_embed, new_embeddings):
-                        if emb:
-                            job_hash = job_hashes[idx]
-                            self.collection.upsert(
-                                ids=[job_hash],
-                                embeddings=[emb],
-                                documents=[job_texts[idx]],
-                                metadatas=[{"job_index": idx}]
-                            )
+                        if emb and job_hashes[idx] not in seen_hashes:
+                            seen_hashes.add(job_hashes[idx])
+                            new_pairs.append((idx, emb))
+                    if new_pairs:
+                        self.collection.upsert(
+                            ids=[job_hashes[idx] for idx, _ in new_pairs],
+                            embeddings=[emb for _, emb in new_pairs],
+                            documents=[job_texts[idx] for idx, _ in new_pairs],
+                            metadatas=[{"job_index": idx} for idx, _ in new_pairs]
+                        )
                 
                 retrieved = self.collection.get(ids=job_hashes, include=['embeddings'])
                 if retrieved and 'embeddings' in retrieved and retrieved['embeddings'] is not None and len(retrieved['embeddings']) > 0:
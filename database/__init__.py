@@ -6,6 +6,7 @@ Database Structure:
     ├── job_seeker_db.py      # JobSeekerDB - job_seeker.db
     ├── head_hunter_db.py     # HeadhunterDB - head_hunter_jobs.db  
     ├── job_post_api_db.py    # MatchedJobsDB - job_post_API.db (NEW)
+    ├── connection.py         # Pooled SQLite connections with tuned PRAGMAs
     ├── models.py             # Shared definitions & re-exports
     └── queries.py            # Query functions
 
@@ -51,6 +52,7 @@ from database.queries import (
     delete_matches_for_seeker,
     get_match_statistics,
     get_all_matched_jobs,
+    iter_all_matched_jobs,
     # Step 0: Cache check functions
     has_recent_matches,
     get_recent_match_info,
@@ -98,6 +100,7 @@ __all__ = [
     'delete_matches_for_seeker',
     'get_match_statistics',
     'get_all_matched_jobs',
+    'iter_all_matched_jobs',
     # Step 0: Cache check functions
     'has_recent_matches',
     'get_recent_match_info',
@@ -0,0 +1,180 @@
+# database/connection.py
+"""
+Shared SQLite connection setup.
+
+Every connection opened by the database modules gets the same tuned
+PRAGMAs: WAL journaling (readers don't block the writer and a commit
+appends to the log instead of rewriting pages), synchronous=NORMAL (no
+fsync per commit in WAL mode), a larger page cache, in-memory temp tables,
+memory-mapped reads and a busy timeout instead of immediate "database is
+locked" errors.
+
+Connections for the database classes are pooled per file (pooled_connection):
+a checkout reuses an open connection, with its warm page cache, instead of
+connecting and re-applying PRAGMAs on every call. Writers can take the
+write lock up front (BEGIN IMMEDIATE) and readers can use
+pooled_read_connection, which never commits.
+"""
+
+import os
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional, Union
+
+# Idle connections kept open per database file
+POOL_SIZE = 8
+# Compiled statements sqlite3 keeps per connection, keyed by SQL text; a
+# pooled connection re-executing the same constant SQL skips parse/plan
+STATEMENT_CACHE_SIZE = 256
+
+# Applied on every connect (these settings are per-connection)
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",      # ~64 MB page cache
+    "PRAGMA mmap_size=2147483648",   # map up to 2 GB of the file
+    "PRAGMA busy_timeout=5000",
+)
+
+# journal_mode=WAL is stored in the database file, so it is set once per
+# file per process rather than on every connect
+_wal_paths = set()
+_wal_lock = threading.Lock()
+
+
+def apply_pragmas(conn: sqlite3.Connection, db_path: Union[str, Path]) -> None:
+    """Apply WAL mode (once per file) and the per-connection PRAGMAs."""
+    try:
+        key = str(db_path)
+        if key not in _wal_paths:
+            conn.execute("PRAGMA journal_mode=WAL")
+            with _wal_lock:
+                _wal_paths.add(key)
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+    except sqlite3.DatabaseError as e:
+        print(f"⚠️ Could not set SQLite pragmas for {db_path}: {e}")
+
+
+def connect(db_path: Union[str, Path], **kwargs) -> sqlite3.Connection:
+    """Open a SQLite connection with the shared PRAGMAs applied.
+
+    Args:
+        db_path: Database file path
+        **kwargs: Passed through to sqlite3.connect (e.g. check_same_thread)
+
+    Returns:
+        Configured sqlite3 connection
+    """
+    conn = sqlite3.connect(str(db_path), **kwargs)
+    apply_pragmas(conn, db_path)
+    return conn
+
+
+class _ConnectionPool:
+    """LIFO pool of open connections to one database file.
+
+    The most recently returned connection is handed out first, so its page
+    cache is the warmest. Connections are created on demand when the pool
+    is empty and closed when it is full.
+    """
+
+    def __init__(self, db_path: str, size: int = POOL_SIZE):
+        self.db_path = db_path
+        self._idle = queue.LifoQueue(maxsize=size)
+
+    def get(self) -> sqlite3.Connection:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            return connect(self.db_path, check_same_thread=False,
+                           cached_statements=STATEMENT_CACHE_SIZE)
+
+    def put(self, conn: sqlite3.Connection) -> None:
+        try:
+            self._idle.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def _get_pool(db_path: Union[str, Path]) -> _ConnectionPool:
+    # Keyed on the absolute path: relative DB paths depend on the cwd
+    key = os.path.abspath(db_path)
+    pool = _pools.get(key)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.setdefault(key, _ConnectionPool(key))
+    return pool
+
+
+def _checkout(pool: _ConnectionPool) -> sqlite3.Connection:
+    conn = pool.get()
+    # Reset per checkout: some queries switch a connection to plain tuples
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+@contextmanager
+def pooled_connection(db_path: Union[str, Path], begin: Optional[str] = None):
+    """Check out a pooled connection (sqlite3.Row rows) for one unit of work.
+    
+    Commits when the block succeeds and rolls back on an exception, then
+    returns the connection to the pool; a connection that can't be rolled
+    back is closed instead.
+    
+    Args:
+        db_path: Database file path
+        begin: Open the transaction up front with this mode (e.g.
+            "IMMEDIATE"). A writer then takes the write lock (waiting up to
+            busy_timeout) before its first statement, instead of starting a
+            deferred read and failing with SQLITE_BUSY when it upgrades
+            while another connection writes.
+    """
+    pool = _get_pool(db_path)
+    conn = _checkout(pool)
+    try:
+        if begin:
+            conn.execute(f"BEGIN {begin}")
+        yield conn
+        conn.commit()
+    except BaseException:
+        try:
+            conn.rollback()
+        except sqlite3.Error:
+            # Don't pool a connection in an unknown state; the caller's
+            # exception (re-raised below) matters more than this one
+            conn.close()
+        else:
+            pool.put(conn)
+        raise
+    else:
+        pool.put(conn)
+
+
+@contextmanager
+def pooled_read_connection(db_path: Union[str, Path]):
+    """Check out a pooled connection for reads only.
+    
+    Nothing is committed: SELECTs run in autocommit mode (each statement
+    its own WAL snapshot), and a transaction left open by a stray write is
+    rolled back before the connection returns to the pool.
+    """
+    pool = _get_pool(db_path)
+    conn = _checkout(pool)
+    try:
+        yield conn
+    finally:
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+        except sqlite3.Error:
+            conn.close()
+        else:
+            pool.put(conn)
@@ -14,32 +14,26 @@ from contextlib import contextmanager
 from typing import Optional, Dict, List
 from datetime import datetime
 
+from database.connection import pooled_connection
+
 
 # Database path constant
-DB_PATH_HEAD_HUNTER = "database/head_hunter_jobs.db"
+DB_PATH_HEAD_HUNTER = Path("database/head_hunter_jobs.db")
 
 
 class HeadhunterDB:
     """Headhunter job postings database for head_hunter_jobs.db."""
     
     def __init__(self, db_path: str = None):
-        self.db_path = Path(db_path or DB_PATH_HEAD_HUNTER)
+        self.db_path = Path(db_path) if db_path else DB_PATH_HEAD_HUNTER
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self._init_schema()
     
     @contextmanager
     def get_connection(self):
-        """Context manager for database connections."""
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
-        try:
+        """Context manager for (pooled) database connections."""
+        with pooled_connection(self.db_path) as conn:
             yield conn
-            conn.commit()
-        except Exception:
-            conn.rollback()
-            raise
-        finally:
-            conn.close()
     
     def _init_schema(self):
         """Initialize database schema."""
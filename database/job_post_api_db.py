@@ -7,6 +7,9 @@ This module handles all database operations for job_post_API.db:
 - Retrieving matched jobs by job_seeker_id
 - Match statistics and analytics
 
+Large text fields (description, skills) are kept in matched_jobs_text;
+the matched_jobs_full view joins them back for full-record reads.
+
 Data Flow Step 2:
     Job Search → Indeed API → Semantic Search → Cosine Similarity → Store in job_post_API.db
     (All matched jobs are saved)
@@ -19,12 +22,203 @@ Data Flow Step 3:
 import sqlite3
 from pathlib import Path
 from contextlib import contextmanager
-from typing import Optional, Dict, List
+from typing import Optional, Dict, Iterator, List
 from datetime import datetime
 
+from database.connection import pooled_connection, pooled_read_connection
+
 
 # Database path constant
-DB_PATH_JOB_POST_API = "database/job_post_API.db"
+DB_PATH_JOB_POST_API = Path("database/job_post_API.db")
+
+
+# Large TEXT fields, only read when a full record is needed (resume and
+# interview generation). They live in matched_jobs_text so the hot
+# matched_jobs rows that every ranking/listing query touches stay narrow.
+_TEXT_COLUMNS = (
+    'job_description', 'required_skills', 'preferred_skills',
+    'matched_skills', 'missing_skills',
+)
+
+# Column order of _UPSERT_SQL's parameters
+_MATCHED_JOB_COLUMNS = (
+    'job_seeker_id', 'job_id', 'job_title', 'company_name', 'location',
+    'experience_required', 'salary_min', 'salary_max', 'employment_type',
+    'industry', 'posted_date', 'application_url', 'cosine_similarity_score',
+    'match_percentage', 'skill_match_score', 'experience_match_score',
+)
+
+_UPSERT_SQL = """
+    INSERT INTO matched_jobs (
+        job_seeker_id, job_id, job_title, company_name, location,
+        experience_required, salary_min, salary_max, employment_type,
+        industry, posted_date, application_url, cosine_similarity_score,
+        match_percentage, skill_match_score, experience_match_score
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(job_id) DO UPDATE SET
+        job_seeker_id = excluded.job_seeker_id,
+        job_title = excluded.job_title,
+        company_name = excluded.company_name,
+        location = excluded.location,
+        experience_required = excluded.experience_required,
+        salary_min = excluded.salary_min,
+        salary_max = excluded.salary_max,
+        employment_type = excluded.employment_type,
+        industry = excluded.industry,
+        posted_date = excluded.posted_date,
+        application_url = excluded.application_url,
+        cosine_similarity_score = excluded.cosine_similarity_score,
+        match_percentage = excluded.match_percentage,
+        skill_match_score = excluded.skill_match_score,
+        experience_match_score = excluded.experience_match_score,
+        last_updated = CURRENT_TIMESTAMP
+"""
+
+# Keyed on the natural job_id (WITHOUT ROWID): a lookup by job_id is one
+# b-tree seek instead of the unique index and then the rowid table. The
+# ranking indexes below lead with job_seeker_id for per-seeker queries.
+_MATCHED_JOBS_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS {table} (
+        job_seeker_id TEXT NOT NULL,
+        
+        -- Job Details from API
+        job_id TEXT PRIMARY KEY NOT NULL,
+        job_title TEXT NOT NULL,
+        company_name TEXT,
+        location TEXT,
+        experience_required TEXT,
+        salary_min REAL,
+        salary_max REAL,
+        employment_type TEXT,
+        industry TEXT,
+        posted_date TEXT,
+        application_url TEXT,
+        
+        -- Matching Metadata
+        cosine_similarity_score REAL,
+        match_percentage INTEGER,
+        skill_match_score REAL,
+        experience_match_score REAL,
+        
+        -- Timestamps
+        matched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        
+        FOREIGN KEY (job_seeker_id) REFERENCES job_seeker(job_seeker_id)
+    ) WITHOUT ROWID
+"""
+
+# Parameters: job_id followed by _TEXT_COLUMNS
+_UPSERT_TEXT_SQL = f"""
+    INSERT OR REPLACE INTO matched_jobs_text (job_id, {', '.join(_TEXT_COLUMNS)})
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+
+# Columns returned by the ranked listing queries (get_top_matches,
+# get_recent_matches): enough to render a list without pulling the
+# multi-KB description and skills text of every row
+_LISTING_COLUMNS = (
+    "job_id, job_title, company_name, location, "
+    "match_percentage, cosine_similarity_score, matched_at"
+)
+
+
+# Rows fetched per batch by the streaming (iter_*) queries
+STREAM_BATCH_SIZE = 512
+
+# Hot queries as constant SQL text: each pooled connection compiles them once
+# and reuses the prepared statement from its statement cache
+_SQL_GET_BY_JOB_ID = "SELECT * FROM matched_jobs_full WHERE job_id = ?"
+_SQL_TOP_MATCHES = f"""
+    SELECT {_LISTING_COLUMNS} FROM matched_jobs
+    WHERE job_seeker_id = ?
+    ORDER BY match_percentage DESC, cosine_similarity_score DESC
+    LIMIT ?
+"""
+_SQL_RECENT_MATCHES = f"""
+    SELECT {_LISTING_COLUMNS} FROM matched_jobs
+    WHERE job_seeker_id = ?
+    ORDER BY matched_at DESC
+    LIMIT ?
+"""
+_SQL_BY_SEEKER = """
+    SELECT * FROM matched_jobs_full
+    WHERE job_seeker_id = ?
+    AND (cosine_similarity_score >= ? OR cosine_similarity_score IS NULL)
+    ORDER BY match_percentage DESC, cosine_similarity_score DESC
+    LIMIT ?
+"""
+
+# get_matched_jobs column sets by purpose
+_PURPOSE_FIELDS = {
+    'interview': (
+        "job_id, job_title, job_description, required_skills, "
+        "company_name, industry, experience_required, match_percentage, "
+        "location, matched_skills, missing_skills"
+    ),
+    'resume': (
+        "job_id, job_title, job_description, required_skills, "
+        "preferred_skills, company_name, location, employment_type, "
+        "match_percentage, matched_skills, missing_skills, application_url"
+    ),
+    'general': "*",
+}
+# purpose -> (scored matches at/above a threshold, unscored matches); both
+# are range seeks on idx_seeker_rank (plus a text lookup per returned row)
+_SQL_MATCHED_JOBS = {
+    purpose: (
+        f"""
+    SELECT {fields} FROM matched_jobs_full
+    WHERE job_seeker_id = ? AND match_percentage >= ?
+    ORDER BY match_percentage DESC, cosine_similarity_score DESC
+    LIMIT ?
+""",
+        f"""
+    SELECT {fields} FROM matched_jobs_full
+    WHERE job_seeker_id = ? AND match_percentage IS NULL
+    ORDER BY cosine_similarity_score DESC
+    LIMIT ?
+""",
+    )
+    for purpose, fields in _PURPOSE_FIELDS.items()
+}
+
+
+def _fetch_dicts(conn: sqlite3.Connection, sql: str, params=()) -> List[Dict]:
+    """Run a query and return its rows as dictionaries.
+    
+    Rows are fetched as plain tuples (no sqlite3.Row per row) and zipped
+    with the column names, read once from the cursor description.
+    """
+    cursor = conn.cursor()
+    cursor.row_factory = None
+    cursor.execute(sql, params)
+    keys = [column[0] for column in cursor.description]
+    return [dict(zip(keys, row)) for row in cursor.fetchall()]
+
+
+def _iter_dicts(conn: sqlite3.Connection, sql: str, params=(),
+                batch_size: int = None) -> Iterator[Dict]:
+    """Like _fetch_dicts, but yields rows fetched ``batch_size`` at a time."""
+    cursor = conn.cursor()
+    cursor.row_factory = None
+    cursor.execute(sql, params)
+    keys = [column[0] for column in cursor.description]
+    while True:
+        rows = cursor.fetchmany(batch_size or STREAM_BATCH_SIZE)
+        if not rows:
+            return
+        for row in rows:
+            yield dict(zip(keys, row))
+
+
+def _matched_job_rows(job_data: Dict) -> tuple:
+    """Parameters for _UPSERT_SQL and _UPSERT_TEXT_SQL from a matched job."""
+    return (
+        tuple(job_data.get(column) for column in _MATCHED_JOB_COLUMNS),
+        (job_data.get('job_id'),) + tuple(job_data.get(column) for column in _TEXT_COLUMNS),
+    )
 
 
 class MatchedJobsDB:
@@ -35,91 +229,111 @@ class MatchedJobsDB:
     """
     
     def __init__(self, db_path: str = None):
-        self.db_path = Path(db_path or DB_PATH_JOB_POST_API)
+        self.db_path = Path(db_path) if db_path else DB_PATH_JOB_POST_API
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self._init_schema()
     
     @contextmanager
     def get_connection(self):
-        """Context manager for database connections."""
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
-        try:
+        """Context manager for (pooled) database connections."""
+        with pooled_connection(self.db_path) as conn:
+            yield conn
+    
+    @contextmanager
+    def get_read_connection(self):
+        """Pooled connection for queries; never commits."""
+        with pooled_read_connection(self.db_path) as conn:
+            yield conn
+    
+    @contextmanager
+    def get_write_connection(self):
+        """Pooled connection holding the write lock (BEGIN IMMEDIATE) until commit."""
+        with pooled_connection(self.db_path, begin="IMMEDIATE") as conn:
             yield conn
-            conn.commit()
-        except Exception:
-            conn.rollback()
-            raise
-        finally:
-            conn.close()
     
     def _init_schema(self):
         """Initialize database schema for matched jobs."""
-        with self.get_connection() as conn:
+        with self.get_write_connection() as conn:
+            conn.execute(_MATCHED_JOBS_TABLE_SQL.format(table="matched_jobs"))
             conn.execute("""
-                CREATE TABLE IF NOT EXISTS matched_jobs (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    job_seeker_id TEXT NOT NULL,
-                    
-                    -- Job Details from API
-                    job_id TEXT UNIQUE NOT NULL,
-                    job_title TEXT NOT NULL,
-                    company_name TEXT,
-                    location TEXT,
+                CREATE TABLE IF NOT EXISTS matched_jobs_text (
+                    job_id TEXT PRIMARY KEY,
                     job_description TEXT,
                     required_skills TEXT,
                     preferred_skills TEXT,
-                    experience_required TEXT,
-                    salary_min REAL,
-                    salary_max REAL,
-                    employment_type TEXT,
-                    industry TEXT,
-                    posted_date TEXT,
-                    application_url TEXT,
-                    
-                    -- Matching Metadata
-                    cosine_similarity_score REAL,
-                    match_percentage INTEGER,
-                    skill_match_score REAL,
-                    experience_match_score REAL,
                     matched_skills TEXT,
-                    missing_skills TEXT,
-                    
-                    -- Timestamps
-                    matched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    
-                    FOREIGN KEY (job_seeker_id) REFERENCES job_seeker(job_seeker_id)
-                )
+                    missing_skills TEXT
+                ) WITHOUT ROWID
             """)
-            # Add indexes for efficient querying
+            self._migrate_legacy_layout(conn)
+            # Text rows go with their match, however it is deleted
             conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_job_seeker 
-                ON matched_jobs(job_seeker_id)
+                CREATE TRIGGER IF NOT EXISTS matched_jobs_text_delete
+                AFTER DELETE ON matched_jobs
+                BEGIN
+                    DELETE FROM matched_jobs_text WHERE job_id = OLD.job_id;
+                END
             """)
-            conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_similarity 
-                ON matched_jobs(cosine_similarity_score DESC)
+            # Full records (hot columns + text) for the queries that need them
+            conn.execute(f"""
+                CREATE VIEW IF NOT EXISTS matched_jobs_full AS
+                SELECT m.*, {', '.join('t.' + column for column in _TEXT_COLUMNS)}
+                FROM matched_jobs m
+                LEFT JOIN matched_jobs_text t ON t.job_id = m.job_id
             """)
+            # Every per-seeker query leads with job_seeker_id, so the
+            # composite indexes below serve them all. Global single-column
+            # indexes on the scores were never chosen for these queries
+            # (only maintained on every insert); drop them from older files.
+            for stale in ('idx_job_seeker', 'idx_similarity', 'idx_match_percentage',
+                          'idx_job_seeker_match'):
+                conn.execute(f"DROP INDEX IF EXISTS {stale}")
+            # Cleanup of old matches by age
             conn.execute("""
                 CREATE INDEX IF NOT EXISTS idx_match_date 
                 ON matched_jobs(matched_at DESC)
             """)
             conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_match_percentage
-                ON matched_jobs(match_percentage DESC)
+                CREATE INDEX IF NOT EXISTS idx_job_seeker_date 
+                ON matched_jobs(job_seeker_id, matched_at DESC)
             """)
-            # Composite indexes for common query patterns (Step 2 improvement)
+            # Ranking order of the per-seeker queries (no temp b-tree sort),
+            # plus the listing columns so get_top_matches is index-only
             conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_job_seeker_match 
-                ON matched_jobs(job_seeker_id, match_percentage DESC)
+                CREATE INDEX IF NOT EXISTS idx_seeker_rank
+                ON matched_jobs(job_seeker_id, match_percentage DESC, cosine_similarity_score DESC,
+                                job_id, job_title, company_name, location, matched_at)
             """)
-            conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_job_seeker_date 
-                ON matched_jobs(job_seeker_id, matched_at DESC)
+    
+    @staticmethod
+    def _migrate_legacy_layout(conn: sqlite3.Connection) -> None:
+        """Rebuild an older matched_jobs table (rowid + id, inline text).
+        
+        Text columns are copied into matched_jobs_text, then the scalar
+        columns are copied into a new WITHOUT ROWID table that replaces
+        the old one.
+        """
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(matched_jobs)")}
+        if 'id' not in columns:
+            return
+        text_columns = [column for column in _TEXT_COLUMNS if column in columns]
+        if text_columns:
+            conn.execute(f"""
+                INSERT OR IGNORE INTO matched_jobs_text (job_id, {', '.join(text_columns)})
+                SELECT job_id, {', '.join(text_columns)} FROM matched_jobs
             """)
+        kept = ', '.join(column for column in _MATCHED_JOB_COLUMNS + ('matched_at', 'last_updated')
+                         if column in columns)
+        # The view and trigger reference matched_jobs; they are recreated
+        conn.execute("DROP VIEW IF EXISTS matched_jobs_full")
+        conn.execute("DROP TRIGGER IF EXISTS matched_jobs_text_delete")
+        conn.execute(_MATCHED_JOBS_TABLE_SQL.format(table="matched_jobs_rebuild"))
+        conn.execute(f"INSERT INTO matched_jobs_rebuild ({kept}) SELECT {kept} FROM matched_jobs")
+        conn.execute("DROP TABLE matched_jobs")
+        conn.execute("ALTER TABLE matched_jobs_rebuild RENAME TO matched_jobs")
+        print("✅ Rebuilt matched_jobs keyed on job_id with text in matched_jobs_text")
     
-    def save_matched_job(self, job_data: Dict) -> int:
+    def save_matched_job(self, job_data: Dict) -> str:
         """Save a matched job to the database.
         
         Uses UPSERT (INSERT OR UPDATE) to handle duplicate job_ids.
@@ -128,81 +342,57 @@ class MatchedJobsDB:
             job_data: Dictionary containing job and matching data
             
         Returns:
-            The ID of the inserted/updated record
+            The job_id (primary key) of the inserted/updated record
         """
-        with self.get_connection() as conn:
-            cursor = conn.execute("""
-                INSERT INTO matched_jobs (
-                    job_seeker_id, job_id, job_title, company_name, location,
-                    job_description, required_skills, preferred_skills, experience_required,
-                    salary_min, salary_max, employment_type, industry, posted_date,
-                    application_url, cosine_similarity_score, match_percentage,
-                    skill_match_score, experience_match_score, matched_skills, missing_skills
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(job_id) DO UPDATE SET
-                    job_seeker_id = excluded.job_seeker_id,
-                    job_title = excluded.job_title,
-                    company_name = excluded.company_name,
-                    location = excluded.location,
-                    job_description = excluded.job_description,
-                    required_skills = excluded.required_skills,
-                    preferred_skills = excluded.preferred_skills,
-                    experience_required = excluded.experience_required,
-                    salary_min = excluded.salary_min,
-                    salary_max = excluded.salary_max,
-                    employment_type = excluded.employment_type,
-                    industry = excluded.industry,
-                    posted_date = excluded.posted_date,
-                    application_url = excluded.application_url,
-                    cosine_similarity_score = excluded.cosine_similarity_score,
-                    match_percentage = excluded.match_percentage,
-                    skill_match_score = excluded.skill_match_score,
-                    experience_match_score = excluded.experience_match_score,
-                    matched_skills = excluded.matched_skills,
-                    missing_skills = excluded.missing_skills,
-                    last_updated = CURRENT_TIMESTAMP
-            """, (
-                job_data.get('job_seeker_id'),
-                job_data.get('job_id'),
-                job_data.get('job_title'),
-                job_data.get('company_name'),
-                job_data.get('location'),
-                job_data.get('job_description'),
-                job_data.get('required_skills'),
-                job_data.get('preferred_skills'),
-                job_data.get('experience_required'),
-                job_data.get('salary_min'),
-                job_data.get('salary_max'),
-                job_data.get('employment_type'),
-                job_data.get('industry'),
-                job_data.get('posted_date'),
-                job_data.get('application_url'),
-                job_data.get('cosine_similarity_score'),
-                job_data.get('match_percentage'),
-                job_data.get('skill_match_score'),
-                job_data.get('experience_match_score'),
-                job_data.get('matched_skills'),
-                job_data.get('missing_skills'),
-            ))
-            return cursor.lastrowid
+        row, text_row = _matched_job_rows(job_data)
+        with self.get_write_connection() as conn:
+            conn.execute(_UPSERT_SQL, row)
+            conn.execute(_UPSERT_TEXT_SQL, text_row)
+            return job_data['job_id']
     
     def save_matched_jobs_batch(self, jobs: List[Dict]) -> int:
         """Save multiple matched jobs in a batch.
         
+        All rows are upserted with executemany in one transaction (one
+        commit instead of one per job). A batch that fails is split in half
+        until the bad rows are isolated, so one invalid job doesn't drop the
+        rest.
+        
         Args:
             jobs: List of job dictionaries
             
         Returns:
             Number of jobs saved
         """
-        count = 0
+        valid_jobs, rows = [], []
         for job in jobs:
             try:
-                self.save_matched_job(job)
-                count += 1
+                rows.append(_matched_job_rows(job))
+                valid_jobs.append(job)
             except Exception as e:
-                print(f"Error saving job {job.get('job_id')}: {e}")
-        return count
+                print(f"Error saving job {job.get('job_id') if isinstance(job, dict) else job}: {e}")
+        if not rows:
+            return 0
+        with self.get_write_connection() as conn:
+            return self._upsert_rows(conn, valid_jobs, rows)
+    
+    def _upsert_rows(self, conn: sqlite3.Connection, jobs: List[Dict], rows: List[tuple]) -> int:
+        """Upsert rows under a savepoint, bisecting a failing batch."""
+        conn.execute("SAVEPOINT upsert_batch")
+        try:
+            conn.executemany(_UPSERT_SQL, [row for row, _ in rows])
+            conn.executemany(_UPSERT_TEXT_SQL, [text_row for _, text_row in rows])
+        except sqlite3.Error as e:
+            conn.execute("ROLLBACK TO upsert_batch")
+            conn.execute("RELEASE upsert_batch")
+            if len(rows) == 1:
+                print(f"Error saving job {jobs[0].get('job_id')}: {e}")
+                return 0
+            mid = len(rows) // 2
+            return (self._upsert_rows(conn, jobs[:mid], rows[:mid]) +
+                    self._upsert_rows(conn, jobs[mid:], rows[mid:]))
+        conn.execute("RELEASE upsert_batch")
+        return len(rows)
     
     def get_matched_job(self, job_id: str) -> Optional[Dict]:
         """Get a matched job by its external job ID.
@@ -213,10 +403,8 @@ class MatchedJobsDB:
         Returns:
             Job dictionary or None
         """
-        with self.get_connection() as conn:
-            cursor = conn.execute("""
-                SELECT * FROM matched_jobs WHERE job_id = ?
-            """, (job_id,))
+        with self.get_read_connection() as conn:
+            cursor = conn.execute(_SQL_GET_BY_JOB_ID, (job_id,))
             row = cursor.fetchone()
             return dict(row) if row else None
     
@@ -240,15 +428,11 @@ class MatchedJobsDB:
         Returns:
             List of matched job dictionaries, ordered by match_percentage
         """
-        with self.get_connection() as conn:
-            cursor = conn.execute("""
-                SELECT * FROM matched_jobs 
-                WHERE job_seeker_id = ? 
-                AND (cosine_similarity_score >= ? OR cosine_similarity_score IS NULL)
-                ORDER BY match_percentage DESC, cosine_similarity_score DESC
-                LIMIT ?
-            """, (job_seeker_id, min_score, limit))
-            return [dict(row) for row in cursor.fetchall()]
+        with self.get_read_connection() as conn:
+            # The cosine filter can't narrow an index seek (rows are ranked
+            # by match_percentage first), so one walk of idx_seeker_rank in
+            # rank order, stopping at the limit, is already the best plan
+            return _fetch_dicts(conn, _SQL_BY_SEEKER, (job_seeker_id, min_score, limit))
     
     def get_top_matches(
         self, 
@@ -262,16 +446,11 @@ class MatchedJobsDB:
             limit: Maximum number of results
             
         Returns:
-            List of top matched job dictionaries
+            List of top matched job dictionaries (listing columns only; use
+            get_matched_job for the full record)
         """
-        with self.get_connection() as conn:
-            cursor = conn.execute("""
-                SELECT * FROM matched_jobs 
-                WHERE job_seeker_id = ?
-                ORDER BY match_percentage DESC, cosine_similarity_score DESC
-                LIMIT ?
-            """, (job_seeker_id, limit))
-            return [dict(row) for row in cursor.fetchall()]
+        with self.get_read_connection() as conn:
+            return _fetch_dicts(conn, _SQL_TOP_MATCHES, (job_seeker_id, limit))
     
     def get_recent_matches(
         self, 
@@ -285,16 +464,11 @@ class MatchedJobsDB:
             limit: Maximum number of results
             
         Returns:
-            List of recently matched job dictionaries
+            List of recently matched job dictionaries (listing columns only;
+            use get_matched_job for the full record)
         """
-        with self.get_connection() as conn:
-            cursor = conn.execute("""
-                SELECT * FROM matched_jobs 
-                WHERE job_seeker_id = ?
-                ORDER BY matched_at DESC
-                LIMIT ?
-            """, (job_seeker_id, limit))
-            return [dict(row) for row in cursor.fetchall()]
+        with self.get_read_connection() as conn:
+            return _fetch_dicts(conn, _SQL_RECENT_MATCHES, (job_seeker_id, limit))
     
     def get_jobs_for_interview(self, job_seeker_id: str) -> List[Dict]:
         """Get matched jobs formatted for interview module.
@@ -310,17 +484,16 @@ class MatchedJobsDB:
         Returns:
             List of job dictionaries with interview-relevant fields
         """
-        with self.get_connection() as conn:
-            cursor = conn.execute("""
+        with self.get_read_connection() as conn:
+            return _fetch_dicts(conn, """
                 SELECT 
-                    id, job_id, job_title, job_description, required_skills,
+                    job_id, job_title, job_description, required_skills,
                     company_name, industry, experience_required, match_percentage,
                     location
-                FROM matched_jobs 
+                FROM matched_jobs_full
                 WHERE job_seeker_id = ?
                 ORDER BY match_percentage DESC
             """, (job_seeker_id,))
-            return [dict(row) for row in cursor.fetchall()]
     
     def get_job_for_resume(self, job_seeker_id: str, job_id: str) -> Optional[Dict]:
         """Get a specific job for resume tailoring.
@@ -336,9 +509,9 @@ class MatchedJobsDB:
         Returns:
             Job dictionary or None if not found/not owned
         """
-        with self.get_connection() as conn:
+        with self.get_read_connection() as conn:
             cursor = conn.execute("""
-                SELECT * FROM matched_jobs 
+                SELECT * FROM matched_jobs_full
                 WHERE job_id = ? AND job_seeker_id = ?
             """, (job_id, job_seeker_id))
             row = cursor.fetchone()
@@ -353,7 +526,7 @@ class MatchedJobsDB:
         Returns:
             True if deleted, False if not found
         """
-        with self.get_connection() as conn:
+        with self.get_write_connection() as conn:
             cursor = conn.execute("""
                 DELETE FROM matched_jobs WHERE job_id = ?
             """, (job_id,))
@@ -370,7 +543,7 @@ class MatchedJobsDB:
         Returns:
             Number of records deleted
         """
-        with self.get_connection() as conn:
+        with self.get_write_connection() as conn:
             cursor = conn.execute("""
                 DELETE FROM matched_jobs WHERE job_seeker_id = ?
             """, (job_seeker_id,))
@@ -385,7 +558,7 @@ class MatchedJobsDB:
         Returns:
             Dictionary with statistics
         """
-        with self.get_connection() as conn:
+        with self.get_read_connection() as conn:
             cursor = conn.execute("""
                 SELECT 
                     COUNT(*) as total_matches,
@@ -408,12 +581,23 @@ class MatchedJobsDB:
         Returns:
             List of all matched job dictionaries
         """
-        with self.get_connection() as conn:
-            cursor = conn.execute("""
-                SELECT * FROM matched_jobs 
+        return list(self.iter_all_matched_jobs())
+    
+    def iter_all_matched_jobs(self) -> Iterator[Dict]:
+        """Stream all matched jobs, newest first.
+        
+        Rows are fetched STREAM_BATCH_SIZE at a time, so only one batch
+        (not the whole table with its descriptions) is in memory at once.
+        The connection is held until the iterator is exhausted or closed.
+        
+        Yields:
+            Matched job dictionaries
+        """
+        with self.get_read_connection() as conn:
+            yield from _iter_dicts(conn, """
+                SELECT * FROM matched_jobs_full
                 ORDER BY matched_at DESC
             """)
-            return [dict(row) for row in cursor.fetchall()]
     
     def get_unique_job_seekers(self) -> List[str]:
         """Get list of all unique job_seeker_ids with matches.
@@ -421,7 +605,7 @@ class MatchedJobsDB:
         Returns:
             List of job_seeker_ids
         """
-        with self.get_connection() as conn:
+        with self.get_read_connection() as conn:
             cursor = conn.execute("""
                 SELECT DISTINCT job_seeker_id FROM matched_jobs
             """)
@@ -448,7 +632,7 @@ class MatchedJobsDB:
         Returns:
             True if recent matches exist, False otherwise
         """
-        with self.get_connection() as conn:
+        with self.get_read_connection() as conn:
             cursor = conn.execute("""
                 SELECT COUNT(*) as count FROM matched_jobs 
                 WHERE job_seeker_id = ? 
@@ -475,7 +659,7 @@ class MatchedJobsDB:
         Returns:
             Dict with count and newest_match_time, or None
         """
-        with self.get_connection() as conn:
+        with self.get_read_connection() as conn:
             cursor = conn.execute("""
                 SELECT 
                     COUNT(*) as count,
@@ -522,31 +706,16 @@ class MatchedJobsDB:
         Returns:
             List of matched job dictionaries
         """
-        # Define field selections based on purpose
-        if purpose == 'interview':
-            fields = """
-                id, job_id, job_title, job_description, required_skills,
-                company_name, industry, experience_required, match_percentage,
-                location, matched_skills, missing_skills
-            """
-        elif purpose == 'resume':
-            fields = """
-                id, job_id, job_title, job_description, required_skills,
-                preferred_skills, company_name, location, employment_type,
-                match_percentage, matched_skills, missing_skills, application_url
-            """
-        else:  # general
-            fields = "*"
-        
-        with self.get_connection() as conn:
-            cursor = conn.execute(f"""
-                SELECT {fields} FROM matched_jobs 
-                WHERE job_seeker_id = ? 
-                AND (match_percentage >= ? OR match_percentage IS NULL)
-                ORDER BY match_percentage DESC, cosine_similarity_score DESC
-                LIMIT ?
-            """, (job_seeker_id, min_match, limit))
-            return [dict(row) for row in cursor.fetchall()]
+        scored_sql, unscored_sql = _SQL_MATCHED_JOBS.get(purpose, _SQL_MATCHED_JOBS['general'])
+        with self.get_read_connection() as conn:
+            # Two index range seeks instead of one OR predicate, which made
+            # SQLite walk every row of the seeker: scored matches above the
+            # threshold first, then (if the limit isn't reached) unscored
+            # ones, which the single query also ordered last
+            jobs = _fetch_dicts(conn, scored_sql, (job_seeker_id, min_match, limit))
+            if len(jobs) < limit:
+                jobs += _fetch_dicts(conn, unscored_sql, (job_seeker_id, limit - len(jobs)))
+            return jobs
     
     # =========================================================================
     # CLEANUP FUNCTIONS (Improvement #5)
@@ -566,7 +735,7 @@ class MatchedJobsDB:
         Returns:
             Number of records deleted
         """
-        with self.get_connection() as conn:
+        with self.get_write_connection() as conn:
             cursor = conn.execute("""
                 DELETE FROM matched_jobs 
                 WHERE job_seeker_id = ? 
@@ -583,7 +752,7 @@ class MatchedJobsDB:
         Returns:
             Number of records deleted
         """
-        with self.get_connection() as conn:
+        with self.get_write_connection() as conn:
             cursor = conn.execute("""
                 DELETE FROM matched_jobs 
                 WHERE matched_at < datetime('now', ?)
@@ -608,15 +777,15 @@ class MatchedJobsDB:
         Returns:
             Number of records deleted
         """
-        with self.get_connection() as conn:
+        with self.get_write_connection() as conn:
             # First, get IDs of top matches to keep
             cursor = conn.execute("""
-                SELECT id FROM matched_jobs 
+                SELECT job_id FROM matched_jobs 
                 WHERE job_seeker_id = ?
                 ORDER BY match_percentage DESC
                 LIMIT ?
             """, (job_seeker_id, keep_count))
-            keep_ids = [row['id'] for row in cursor.fetchall()]
+            keep_ids = [row['job_id'] for row in cursor.fetchall()]
             
             if not keep_ids:
                 return 0
@@ -629,7 +798,7 @@ class MatchedJobsDB:
                 DELETE FROM matched_jobs 
                 WHERE job_seeker_id = ? 
                 AND match_percentage < ?
-                AND id NOT IN ({placeholders})
+                AND job_id NOT IN ({placeholders})
             """, [job_seeker_id, min_match] + keep_ids)
             return cursor.rowcount
     
@@ -639,7 +808,7 @@ class MatchedJobsDB:
         Returns:
             Dictionary with database statistics
         """
-        with self.get_connection() as conn:
+        with self.get_read_connection() as conn:
             cursor = conn.execute("""
                 SELECT 
                     COUNT(*) as total_records,
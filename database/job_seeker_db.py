@@ -19,9 +19,11 @@ from datetime import datetime
 import uuid
 import re
 
+from database.connection import pooled_connection
+
 
 # Database path constant
-DB_PATH_JOB_SEEKER = "database/job_seeker.db"
+DB_PATH_JOB_SEEKER = Path("database/job_seeker.db")
 
 
 def normalize_education_level(raw: object) -> str:
@@ -75,23 +77,15 @@ class JobSeekerDB:
     """Job seeker database operations for job_seeker.db."""
     
     def __init__(self, db_path: str = ""):
-        self.db_path = Path(db_path or DB_PATH_JOB_SEEKER)
+        self.db_path = Path(db_path) if db_path else DB_PATH_JOB_SEEKER
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self._init_schema()
     
     @contextmanager
     def get_connection(self):
-        """Context manager for database connections."""
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
-        try:
+        """Context manager for (pooled) database connections."""
+        with pooled_connection(self.db_path) as conn:
             yield conn
-            conn.commit()
-        except Exception:
-            conn.rollback()
-            raise
-        finally:
-            conn.close()
     
     def _init_schema(self):
         """Initialize database schema."""
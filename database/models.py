@@ -12,15 +12,14 @@ Database Structure:
     ├── job_seeker_db.py      # JobSeekerDB - job_seeker.db
     ├── head_hunter_db.py     # HeadhunterDB - head_hunter_jobs.db
     ├── job_post_api_db.py    # MatchedJobsDB - job_post_API.db
+    ├── connection.py         # Pooled connections with WAL and tuned PRAGMAs
     └── models.py             # This file - shared definitions
 """
 
-import sqlite3
 from pathlib import Path
 from contextlib import contextmanager
-from typing import Optional, Dict, List
-from datetime import datetime
-import uuid
+
+from database.connection import pooled_connection
 
 # Import from individual database modules
 from database.job_seeker_db import (
@@ -50,17 +49,9 @@ class DatabaseConnection:
     
     @contextmanager
     def get_connection(self):
-        """Context manager for database connections."""
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
-        try:
+        """Context manager for (pooled) database connections."""
+        with pooled_connection(self.db_path) as conn:
             yield conn
-            conn.commit()
-        except Exception:
-            conn.rollback()
-            raise
-        finally:
-            conn.close()
 
 
 # Re-export for backward compatibility
@@ -2,8 +2,12 @@
 Database query functions.
 Consolidates all DB access from backend.py
 """
+import time
 import sqlite3
+import threading
+from pathlib import Path
 from typing import List, Dict, Optional, Tuple
+from .connection import connect
 from .models import JobSeekerDB, HeadhunterDB, MatchedJobsDB, DB_PATH_JOB_SEEKER, DB_PATH_HEAD_HUNTER
 
 # Initialize singletons
@@ -11,6 +15,15 @@ _job_seeker_db = None
 _headhunter_db = None
 _matched_jobs_db = None
 
+# Shared read-only connections for the tuple queries below, one per DB file
+_read_connections = {}
+_read_lock = threading.Lock()
+# (db_path, sql) -> (data_version, fetched_at, rows)
+_query_cache = {}
+QUERY_CACHE_TTL = 60
+# Rows pulled per fetchmany() call when materializing a query
+FETCH_BATCH_SIZE = 1000
+
 
 def get_job_seeker_db() -> JobSeekerDB:
     """Get job seeker database instance (singleton)."""
@@ -36,6 +49,73 @@ def get_matched_jobs_db() -> MatchedJobsDB:
     return _matched_jobs_db
 
 
+def _get_read_connection(db_path: Path) -> sqlite3.Connection:
+    """Get the shared read connection for a DB file (caller holds _read_lock)."""
+    conn = _read_connections.get(db_path)
+    if conn is None:
+        conn = connect(db_path, check_same_thread=False)
+        _read_connections[db_path] = conn
+    return conn
+
+
+def _cached_query(db_path: Path, sql: str, one: bool = False, transform=None,
+                  params: tuple = ()):
+    """Run a read query on the shared connection, memoizing the result.
+    
+    Results are reused until another connection commits to the file
+    (``PRAGMA data_version`` changes) or QUERY_CACHE_TTL seconds pass,
+    so Streamlit reruns skip SQLite while saved profiles/jobs still
+    show up immediately.
+    
+    Rows are streamed with ``fetchmany`` and passed through ``transform``
+    as they arrive, so only the transformed rows are kept (no full raw
+    result list next to the formatted one).
+    
+    ``params`` are bound to the SQL placeholders and are part of the
+    memo key, so per-seeker lookups are cached separately.
+    """
+    key = (db_path, sql, one, transform, params)
+    with _read_lock:
+        conn = _get_read_connection(db_path)
+        version = conn.execute("PRAGMA data_version").fetchone()[0]
+        now = time.time()
+        hit = _query_cache.get(key)
+        if hit is not None and hit[0] == version and now - hit[1] < QUERY_CACHE_TTL:
+            rows = hit[2]
+        else:
+            cursor = conn.execute(sql, params)
+            if one:
+                rows = cursor.fetchone()
+                if rows is not None and transform is not None:
+                    rows = transform(rows)
+            else:
+                rows = []
+                batch = cursor.fetchmany(FETCH_BATCH_SIZE)
+                while batch:
+                    rows.extend(map(transform, batch) if transform is not None else batch)
+                    batch = cursor.fetchmany(FETCH_BATCH_SIZE)
+            _query_cache[key] = (version, now, rows)
+    return rows if one else list(rows)
+
+
+def _format_seeker_row(seeker: Tuple) -> Tuple:
+    """Map a job_seekers row to the tuple layout the matching UI expects."""
+    return (
+        seeker[0],  # id
+        # Virtual name field (using education background)
+        f"Seeker#{seeker[0]} - {seeker[1]}",
+        seeker[3] or "",  # skills (hard_skills)
+        seeker[2] or "",  # experience (work_experience)
+        seeker[1] or "",  # education (education_level)
+        seeker[8] or "",  # target_position (major)
+        seeker[4] or "",  # target_industry (industry_preference)
+        seeker[5] or "",  # target_location (location_preference)
+        seeker[6] or "",  # expected_salary (salary_expectation)
+        seeker[7] or "",  # current_title (university_background)
+        seeker[9] or ""   # languages
+    )
+
+
 # ============================================================================
 # QUERY FUNCTIONS (from backend.py)
 # ============================================================================
@@ -52,9 +132,8 @@ def get_all_job_seekers_formatted() -> List[Tuple]:
         List of tuples with formatted seeker data for matching
     """
     try:
-        conn = sqlite3.connect(DB_PATH_JOB_SEEKER)
-        c = conn.cursor()
-        c.execute("""
+        # Only the columns the formatted tuple uses
+        return _cached_query(DB_PATH_JOB_SEEKER, """
             SELECT
                 id,
                 education_level as education,
@@ -65,37 +144,9 @@ def get_all_job_seekers_formatted() -> List[Tuple]:
                 salary_expectation as expected_salary,
                 university_background as current_title,
                 major,
-                languages,
-                certificates,
-                soft_skills,
-                project_experience,
-                benefits_expectation
+                languages
             FROM job_seekers
-        """)
-        seekers = c.fetchall()
-        conn.close()
-
-        # Change the structure to match the expected output
-        formatted_seekers = []
-        for seeker in seekers:
-            # Create a virtual name field (using education background + major)
-            virtual_name = f"Seeker#{seeker[0]} - {seeker[1]}"
-
-            formatted_seekers.append((
-                seeker[0],  # id
-                virtual_name,  # name (constructed)
-                seeker[3] or "",  # skills (hard_skills)
-                seeker[2] or "",  # experience (work_experience)
-                seeker[1] or "",  # education (education_level)
-                seeker[8] or "",  # target_position (major)
-                seeker[4] or "",  # target_industry (industry_preference)
-                seeker[5] or "",  # target_location (location_preference)
-                seeker[6] or "",  # expected_salary (salary_expectation)
-                seeker[7] or "",  # current_title (university_background)
-                seeker[9] or ""   # languages
-            ))
-
-        return formatted_seekers
+        """, transform=_format_seeker_row)
     except Exception as e:
         print(f"Failed to get job seekers: {e}")
         return []
@@ -113,18 +164,32 @@ def get_job_seeker_profile_tuple() -> Optional[Tuple]:
         Tuple of (education_level, work_experience, hard_skills, soft_skills, project_experience)
     """
     try:
-        conn = sqlite3.connect(DB_PATH_JOB_SEEKER)
-        c = conn.cursor()
-        c.execute("""
+        return _cached_query(DB_PATH_JOB_SEEKER, """
             SELECT education_level, work_experience, hard_skills, soft_skills,
                    project_experience
             FROM job_seekers
             ORDER BY id DESC
             LIMIT 1
-        """)
-        profile = c.fetchone()
-        conn.close()
-        return profile
+        """, one=True)
+    except Exception as e:
+        print(f"Failed to get job seeker information: {e}")
+        return None
+
+
+def get_job_seeker_profile_tuple_by_id(job_seeker_id: str) -> Optional[Tuple]:
+    """Get a specific job seeker's interview fields as a tuple (memoized).
+    
+    Returns:
+        Tuple of (education_level, work_experience, hard_skills, soft_skills, project_experience)
+    """
+    try:
+        db_path = get_job_seeker_db().db_path
+        return _cached_query(db_path, """
+            SELECT education_level, work_experience, hard_skills, soft_skills,
+                   project_experience
+            FROM job_seekers
+            WHERE job_seeker_id = ?
+        """, one=True, params=(job_seeker_id,))
     except Exception as e:
         print(f"Failed to get job seeker information: {e}")
         return None
@@ -142,9 +207,7 @@ def get_all_jobs_for_matching_tuples() -> List[Tuple]:
         List of job tuples from database
     """
     try:
-        conn = sqlite3.connect(DB_PATH_HEAD_HUNTER)
-        c = conn.cursor()
-        c.execute("""
+        return _cached_query(DB_PATH_HEAD_HUNTER, """
             SELECT id, job_title, job_description, main_responsibilities, required_skills,
                    client_company, industry, work_location, work_type, company_size,
                    employment_type, experience_level, visa_support,
@@ -152,9 +215,6 @@ def get_all_jobs_for_matching_tuples() -> List[Tuple]:
             FROM head_hunter_jobs
             WHERE job_valid_until >= date('now')
         """)
-        jobs = c.fetchall()
-        conn.close()
-        return jobs
     except Exception as e:
         print(f"Failed to get job positions: {e}")
         return []
@@ -167,17 +227,12 @@ def get_jobs_for_interview() -> List[Tuple]:
         List of job tuples with fields needed for interviews
     """
     try:
-        conn = sqlite3.connect(DB_PATH_HEAD_HUNTER)
-        c = conn.cursor()
-        c.execute("""
+        return _cached_query(DB_PATH_HEAD_HUNTER, """
             SELECT id, job_title, job_description, main_responsibilities, required_skills,
                    client_company, industry, experience_level
             FROM head_hunter_jobs
             WHERE job_valid_until >= date('now')
         """)
-        jobs = c.fetchall()
-        conn.close()
-        return jobs
     except Exception as e:
         print(f"Failed to get positions: {e}")
         return []
@@ -227,14 +282,14 @@ def get_job_seeker_search_fields(job_seeker_id: str) -> Optional[Dict]:
 # MATCHED JOBS QUERY FUNCTIONS (job_post_API.db)
 # ============================================================================
 
-def save_matched_job(job_data: Dict) -> int:
+def save_matched_job(job_data: Dict) -> str:
     """Save a matched job to the database.
     
     Args:
         job_data: Dictionary containing job and matching metadata
         
     Returns:
-        The ID of the inserted record
+        The job_id of the saved record
     """
     return get_matched_jobs_db().save_matched_job(job_data)
 
@@ -281,6 +336,37 @@ def get_matched_jobs_for_seeker(
     return get_matched_jobs_db().get_matched_jobs_by_seeker(job_seeker_id, min_score, limit)
 
 
+_INTERVIEW_MATCH_COLUMNS = (
+    'job_id', 'job_title', 'company_name', 'job_description', 'required_skills',
+    'industry', 'experience_required', 'match_percentage', 'location'
+)
+
+
+def get_interview_jobs_for_seeker(job_seeker_id: str, limit: int = 50) -> List[Dict]:
+    """Get a job seeker's matched jobs with the fields the interview page needs.
+    
+    Memoized through _cached_query, so Streamlit reruns of the interview
+    page don't re-read job_post_API.db until new matches are saved.
+    
+    Args:
+        job_seeker_id: The job seeker's ID
+        limit: Maximum number of results
+        
+    Returns:
+        List of job dictionaries, ordered by match percentage
+    """
+    db_path = get_matched_jobs_db().db_path
+    rows = _cached_query(db_path, f"""
+        SELECT {', '.join(_INTERVIEW_MATCH_COLUMNS)}
+        FROM matched_jobs_full
+        WHERE job_seeker_id = ?
+        AND (cosine_similarity_score >= 0 OR cosine_similarity_score IS NULL)
+        ORDER BY match_percentage DESC, cosine_similarity_score DESC
+        LIMIT ?
+    """, params=(job_seeker_id, limit))
+    return [dict(zip(_INTERVIEW_MATCH_COLUMNS, row)) for row in rows]
+
+
 def get_top_job_matches(job_seeker_id: str, limit: int = 10) -> List[Dict]:
     """Get top matched jobs for a job seeker by similarity score.
     
@@ -352,6 +438,15 @@ def get_all_matched_jobs() -> List[Dict]:
     return get_matched_jobs_db().get_all_matched_jobs()
 
 
+def iter_all_matched_jobs():
+    """Stream all matched jobs in batches instead of building one list.
+    
+    Yields:
+        Matched job dictionaries, newest first
+    """
+    return get_matched_jobs_db().iter_all_matched_jobs()
+
+
 def init_matched_jobs_database() -> None:
     """Initialize matched jobs database.
     
@@ -9,17 +9,11 @@ This module provides:
 """
 from io import BytesIO
 import openai
-from openai import AzureOpenAI
 from config import Config
+from core.azure_client import get_azure_openai_client
 from core.rate_limiting import TokenUsageTracker, RateLimiter
-    
-# Check for optional dependencies
-try:
-    import httpx
-    HTTPX_AVAILABLE = True
-except ImportError:
-    HTTPX_AVAILABLE = False
 
+# Check for optional dependencies
 try:
     from reportlab.lib.pagesizes import letter
     from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
@@ -35,25 +29,14 @@ except ImportError:
 class AzureOpenAIClient:
     """Base Azure OpenAI client."""
     def __init__(self):
-        # Clean endpoint to prevent double /openai path issues
-        endpoint = Config.AZURE_OPENAI_ENDPOINT
-        if endpoint:
-            endpoint = endpoint.rstrip('/')
-            if endpoint.endswith('/openai'):
-                endpoint = endpoint[:-7]
-        
-        client_args = {
-            "api_key": Config.AZURE_OPENAI_API_KEY,
-            "api_version": Config.AZURE_OPENAI_API_VERSION,
-            "azure_endpoint": endpoint
-        }
-        
-        if HTTPX_AVAILABLE:
-            # Create a custom http client that ignores SSL errors (sometimes needed in cloud envs)
-            http_client = httpx.Client(verify=False)
-            client_args["http_client"] = http_client
-            
-        self.client = AzureOpenAI(**client_args)
+        # Shared pooled (HTTP/2 when h2 is installed) client; TLS verification
+        # is off because some cloud environments need it
+        self.client = get_azure_openai_client(
+            Config.AZURE_OPENAI_ENDPOINT,
+            Config.AZURE_OPENAI_API_KEY,
+            Config.AZURE_OPENAI_API_VERSION,
+            verify=False
+        )
         self.token_tracker = TokenUsageTracker()
         self.rate_limiter = RateLimiter(max_calls=60, time_window=60)
 
@@ -5,9 +5,69 @@ This module provides the LinkedInJobSearcher class for searching jobs
 using the RapidAPI LinkedIn Job Search API.
 """
 
+import re
+import asyncio
+import functools
 import requests
+import streamlit as st
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Dict, List, Tuple
 
+from core.azure_client import http2_available
+from utils.json_utils import response_json
+
+
+def _extract_jobs(data) -> List[Dict]:
+    """Pull the job list out of the different response shapes the API returns."""
+    if isinstance(data, list):
+        return data
+    if isinstance(data, dict):
+        return data.get('data', data.get('jobs', data.get('results', [])))
+    return []
+
+
+# Boolean operators, parentheses and quotes, removed in one pass
+_SIMPLIFY_RE = re.compile(r'\s+(?:OR|AND)\s+|[()"]')
+
+
+@functools.lru_cache(maxsize=256)
+def _simplify_query_cached(query: str) -> str:
+    """Strip boolean operators/quotes and keep the first three words."""
+    simple = _SIMPLIFY_RE.sub(' ', query)
+    
+    # Take first few words (most important)
+    return ' '.join(simple.split()[:3])
+
+
+@functools.lru_cache(maxsize=256)
+def _alternative_searches_cached(primary_query: str) -> Tuple[str, ...]:
+    """Fallback search terms for a query (tuple so cached results stay immutable)."""
+    words = primary_query.split()
+    return (
+        words[0] if words else primary_query,  # First word only
+        "Manager",  # Generic fallback
+        "Analyst",  # Generic fallback
+    )
+
+
+def _extract_location(job: Dict) -> str:
+    """Best-effort display location for a raw job; "Remote" if none can be derived."""
+    try:
+        derived = job.get('locations_derived')
+        if derived:
+            return derived[0]
+        raw = job.get('locations_raw')
+        if raw:
+            addr = raw[0]['address']
+            city = addr.get('addressLocality', '')
+            region = addr.get('addressRegion', '')
+            if city and region:
+                return f"{city}, {region}"
+    except (KeyError, TypeError, IndexError, AttributeError):
+        pass
+    return "Remote"
+
 
 class LinkedInJobSearcher:
     """Search for jobs using RapidAPI LinkedIn API.
@@ -28,6 +88,23 @@ class LinkedInJobSearcher:
             "x-rapidapi-key": api_key,
             "x-rapidapi-host": "linkedin-job-search-api.p.rapidapi.com"
         }
+        
+        # Persistent session: keep-alive + pooling avoids a TCP/TLS handshake per call
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=["GET"],
+                raise_on_status=False
+            )
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
     
     def test_api_connection(self) -> Tuple[bool, str]:
         """Test if the API is working.
@@ -44,9 +121,8 @@ class LinkedInJobSearcher:
                 "description_type": "text"
             }
             
-            response = requests.get(
+            response = self.session.get(
                 self.base_url,
-                headers=self.headers,
                 params=querystring,
                 timeout=10
             )
@@ -96,10 +172,9 @@ class LinkedInJobSearcher:
             print(f"   Simplified to: {simple_keywords}")
             print(f"   Location: {location}")
             
-            response = requests.get(
-                self.base_url, 
-                headers=self.headers, 
-                params=querystring, 
+            response = self.session.get(
+                self.base_url,
+                params=querystring,
                 timeout=30
             )
             
@@ -121,23 +196,17 @@ class LinkedInJobSearcher:
                 print(f"   Response: {response.text[:200]}")
                 return []
             
-            data = response.json()
-            
             # Handle different response formats
-            if isinstance(data, list):
-                jobs = data
-            elif isinstance(data, dict):
-                jobs = data.get('data', data.get('jobs', data.get('results', [])))
-            else:
-                jobs = []
+            jobs = _extract_jobs(response_json(response))
             
             if not jobs:
                 print(f"⚠️ No jobs found for '{simple_keywords}'")
                 print("   Trying fallback searches...")
                 
-                # Try alternative searches
-                for alternative in self._get_alternative_searches(simple_keywords):
-                    alt_jobs = self._try_alternative_search(alternative, location, 10)
+                # Run all alternative searches concurrently, merge in priority order
+                alternatives = self._get_alternative_searches(simple_keywords)
+                results = self._run_alternative_searches(alternatives, location, 10)
+                for alternative, alt_jobs in zip(alternatives, results):
                     if alt_jobs:
                         print(f"✅ Found {len(alt_jobs)} jobs with alternative search: {alternative}")
                         jobs.extend(alt_jobs)
@@ -161,14 +230,7 @@ class LinkedInJobSearcher:
         Returns:
             Simplified query string
         """
-        # Remove boolean operators and parentheses
-        simple = query.replace(" OR ", " ").replace(" AND ", " ")
-        simple = simple.replace("(", "").replace(")", "")
-        simple = simple.replace('"', "")
-        
-        # Take first few words (most important)
-        words = simple.split()[:3]
-        return " ".join(words)
+        return _simplify_query_cached(query)
     
     def _get_alternative_searches(self, primary_query: str) -> List[str]:
         """Generate alternative search terms.
@@ -179,12 +241,78 @@ class LinkedInJobSearcher:
         Returns:
             List of alternative search terms to try
         """
-        alternatives = [
-            primary_query.split()[0] if primary_query.split() else primary_query,  # First word only
-            "Manager",  # Generic fallback
-            "Analyst",  # Generic fallback
-        ]
-        return alternatives
+        return list(_alternative_searches_cached(primary_query))
+    
+    def _alternative_querystring(self, keywords: str, location: str, limit: int) -> Dict:
+        """Build query parameters for an alternative search."""
+        return {
+            "limit": str(limit),
+            "offset": "0",
+            "title_filter": f'"{keywords}"',
+            "location_filter": f'"{location}"',
+            "description_type": "text"
+        }
+    
+    async def _try_alternative_search_async(self, client, keywords: str,
+                                            location: str, limit: int) -> List[Dict]:
+        """Try an alternative search on a shared async client.
+        
+        Args:
+            client: httpx.AsyncClient carrying the API headers
+            keywords: Alternative search keywords
+            location: Location to search in
+            limit: Maximum number of results
+            
+        Returns:
+            List of raw job dictionaries from API
+        """
+        try:
+            response = await client.get(
+                self.base_url,
+                params=self._alternative_querystring(keywords, location, limit)
+            )
+            if response.status_code == 200:
+                return _extract_jobs(response_json(response))
+            return []
+        except Exception:
+            return []
+    
+    async def _search_alternatives_async(self, alternatives: List[str],
+                                         location: str, limit: int) -> List[List[Dict]]:
+        """Issue all alternative searches concurrently over one connection pool."""
+        import httpx
+        
+        async with httpx.AsyncClient(
+            headers=self.headers,
+            http2=http2_available(),
+            timeout=20,
+            limits=httpx.Limits(max_keepalive_connections=10)
+        ) as client:
+            return await asyncio.gather(*[
+                self._try_alternative_search_async(client, keywords, location, limit)
+                for keywords in alternatives
+            ])
+    
+    def _run_alternative_searches(self, alternatives: List[str],
+                                  location: str, limit: int) -> List[List[Dict]]:
+        """Sync entry point for the concurrent alternative searches.
+        
+        Falls back to sequential requests if an event loop is already
+        running in this thread (asyncio.run cannot nest).
+        
+        Returns:
+            One list of raw jobs per alternative, in the same order
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            try:
+                return asyncio.run(
+                    self._search_alternatives_async(alternatives, location, limit)
+                )
+            except ImportError:
+                pass
+        return [self._try_alternative_search(alt, location, limit) for alt in alternatives]
     
     def _try_alternative_search(self, keywords: str, location: str, limit: int) -> List[Dict]:
         """Try an alternative search.
@@ -198,27 +326,14 @@ class LinkedInJobSearcher:
             List of raw job dictionaries from API
         """
         try:
-            querystring = {
-                "limit": str(limit),
-                "offset": "0",
-                "title_filter": f'"{keywords}"',
-                "location_filter": f'"{location}"',
-                "description_type": "text"
-            }
-            
-            response = requests.get(
+            response = self.session.get(
                 self.base_url,
-                headers=self.headers,
-                params=querystring,
+                params=self._alternative_querystring(keywords, location, limit),
                 timeout=20
             )
             
             if response.status_code == 200:
-                data = response.json()
-                if isinstance(data, list):
-                    return data
-                elif isinstance(data, dict):
-                    return data.get('data', data.get('jobs', data.get('results', [])))
+                return _extract_jobs(response_json(response))
             
             return []
         
@@ -234,50 +349,31 @@ class LinkedInJobSearcher:
         Returns:
             List of normalized job dictionaries
         """
-        normalized_jobs = []
-        
-        for job in jobs:
-            try:
-                # Handle location
-                location = "Remote"
-                if job.get('locations_derived') and len(job['locations_derived']) > 0:
-                    location = job['locations_derived'][0]
-                elif job.get('locations_raw'):
-                    try:
-                        loc_raw = job['locations_raw'][0]
-                        if isinstance(loc_raw, dict) and 'address' in loc_raw:
-                            addr = loc_raw['address']
-                            city = addr.get('addressLocality', '')
-                            region = addr.get('addressRegion', '')
-                            if city and region:
-                                location = f"{city}, {region}"
-                    except (KeyError, TypeError, IndexError):
-                        pass
-                
-                normalized_job = {
-                    'id': job.get('id', f"job_{len(normalized_jobs)}"),
-                    'title': job.get('title', 'Unknown Title'),
-                    'company': job.get('organization', 'Unknown Company'),
-                    'location': location,
-                    'description': job.get('description_text', ''),
-                    'url': job.get('url', ''),
-                    'posted_date': job.get('date_posted', 'Unknown'),
-                }
-                
-                normalized_jobs.append(normalized_job)
-                
-            except Exception:
-                continue
-        
-        return normalized_jobs
+        return [
+            {
+                'id': job.get('id', f"job_{i}"),
+                'title': job.get('title', 'Unknown Title'),
+                'company': job.get('organization', 'Unknown Company'),
+                'location': _extract_location(job),
+                'description': job.get('description_text', ''),
+                'url': job.get('url', ''),
+                'posted_date': job.get('date_posted', 'Unknown'),
+            }
+            for i, job in enumerate(jobs)
+            if isinstance(job, dict)
+        ]
 
 
-# Cached instance management
-_cached_linkedin_searcher = None
+@st.cache_resource(show_spinner=False)
+def _create_linkedin_searcher_resource(api_key: str) -> LinkedInJobSearcher:
+    print("📦 Initializing LinkedIn Job Searcher (first time only)...")
+    searcher = LinkedInJobSearcher(api_key)
+    print("✅ LinkedIn Job Searcher cached!")
+    return searcher
 
 
 def get_linkedin_job_searcher(api_key: str = None) -> LinkedInJobSearcher:
-    """Get cached LinkedInJobSearcher - only initializes once.
+    """Get cached LinkedInJobSearcher - one instance per API key per process.
     
     Args:
         api_key: RapidAPI key. If not provided, will try to get from Config.
@@ -285,15 +381,8 @@ def get_linkedin_job_searcher(api_key: str = None) -> LinkedInJobSearcher:
     Returns:
         LinkedInJobSearcher instance
     """
-    global _cached_linkedin_searcher
-    
-    if _cached_linkedin_searcher is None:
-        if api_key is None:
-            from config import Config
-            api_key = Config.RAPIDAPI_KEY
-        
-        print("📦 Initializing LinkedIn Job Searcher (first time only)...")
-        _cached_linkedin_searcher = LinkedInJobSearcher(api_key)
-        print("✅ LinkedIn Job Searcher cached!")
+    if api_key is None:
+        from config import Config
+        api_key = Config.RAPIDAPI_KEY
     
-    return _cached_linkedin_searcher
+    return _create_linkedin_searcher_resource(api_key or "")
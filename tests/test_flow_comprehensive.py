@@ -159,6 +159,264 @@ class TestDatabaseOperations:
             finally:
                 os.chdir(old_cwd)
 
+    
+    def test_cached_query_sees_new_commits(self):
+        """Test memoized read queries refresh after another connection writes"""
+        import sqlite3
+        from database.queries import _cached_query
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = os.path.join(tmpdir, "jobs.db")
+            writer = sqlite3.connect(db_path)
+            writer.execute("CREATE TABLE jobs (title TEXT)")
+            writer.execute("INSERT INTO jobs VALUES ('Data Analyst')")
+            writer.commit()
+            
+            assert _cached_query(db_path, "SELECT title FROM jobs") == [('Data Analyst',)]
+            writer.execute("INSERT INTO jobs VALUES ('Engineer')")
+            writer.commit()
+            assert len(_cached_query(db_path, "SELECT title FROM jobs")) == 2
+            assert _cached_query(db_path, "SELECT title FROM jobs",
+                                 transform=lambda row: row[0].upper()) == ['DATA ANALYST', 'ENGINEER']
+            sql = "SELECT title FROM jobs WHERE title = ?"
+            assert _cached_query(db_path, sql, params=('Engineer',)) == [('Engineer',)]
+            assert _cached_query(db_path, sql, params=('Nurse',)) == []
+            writer.close()
+
+    def test_matched_jobs_batch_skips_only_invalid_rows(self):
+        """Test batched upserts save every valid job and isolate failing rows"""
+        from database import MatchedJobsDB
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db = MatchedJobsDB(os.path.join(tmpdir, "job_post_API.db"))
+            jobs = [
+                {'job_seeker_id': 'JS_1', 'job_id': f'job-{i}', 'job_title': f'Role {i}',
+                 'match_percentage': i}
+                for i in range(5)
+            ]
+            jobs[2]['job_title'] = None  # violates NOT NULL
+            assert db.save_matched_jobs_batch(jobs) == 4
+            assert db.get_matched_job('job-2') is None
+            
+            # Re-saving upserts in place instead of duplicating
+            jobs[2]['job_title'] = 'Role 2'
+            assert db.save_matched_jobs_batch(jobs) == 5
+            assert len(db.get_matched_jobs_by_seeker('JS_1')) == 5
+    
+    def test_top_matches_use_covering_index(self):
+        """Test ranked listings return projected columns via the covering index"""
+        from database import MatchedJobsDB
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db = MatchedJobsDB(os.path.join(tmpdir, "job_post_API.db"))
+            db.save_matched_jobs_batch([
+                {'job_seeker_id': 'JS_1', 'job_id': f'job-{i}', 'job_title': f'Role {i}',
+                 'job_description': 'x' * 5000, 'match_percentage': i}
+                for i in range(5)
+            ])
+            top = db.get_top_matches('JS_1', limit=2)
+            assert [job['job_id'] for job in top] == ['job-4', 'job-3']
+            assert 'job_description' not in top[0]
+            assert [job['job_id'] for job in db.get_recent_matches('JS_1', limit=5)][:1]
+            with db.get_connection() as conn:
+                plan = " ".join(row[3] for row in conn.execute(
+                    "EXPLAIN QUERY PLAN SELECT job_id FROM matched_jobs WHERE job_seeker_id = ? "
+                    "ORDER BY match_percentage DESC, cosine_similarity_score DESC LIMIT 2",
+                    ('JS_1',)
+                ))
+            assert "COVERING INDEX idx_seeker_rank" in plan
+    
+    def test_seeker_ranking_avoids_sort_and_stale_indexes(self):
+        """Test per-seeker ranking uses the composite index without a temp sort"""
+        import sqlite3
+        from database import MatchedJobsDB
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = os.path.join(tmpdir, "job_post_API.db")
+            MatchedJobsDB(db_path)
+            # An older file created the global score index; re-init drops it
+            legacy = sqlite3.connect(db_path)
+            legacy.execute("CREATE INDEX idx_similarity ON matched_jobs(cosine_similarity_score DESC)")
+            legacy.commit()
+            legacy.close()
+            db = MatchedJobsDB(db_path)
+            with db.get_connection() as conn:
+                indexes = {row[0] for row in conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'index'")}
+                plan = " ".join(row[3] for row in conn.execute(
+                    "EXPLAIN QUERY PLAN SELECT * FROM matched_jobs WHERE job_seeker_id = ? "
+                    "ORDER BY match_percentage DESC, cosine_similarity_score DESC", ('JS_1',)
+                ))
+            assert 'idx_similarity' not in indexes and 'idx_match_percentage' not in indexes
+            assert "idx_seeker_rank" in plan and "TEMP B-TREE" not in plan
+    
+    def test_matched_jobs_threshold_keeps_unscored_last(self):
+        """Test get_matched_jobs filters by match and appends unscored jobs"""
+        import database.job_post_api_db as job_post_api_db
+        from database import MatchedJobsDB
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db = MatchedJobsDB(os.path.join(tmpdir, "job_post_API.db"))
+            db.save_matched_jobs_batch([
+                {'job_seeker_id': 'JS_1', 'job_id': f'job-{i}', 'job_title': f'Role {i}',
+                 'match_percentage': pct}
+                for i, pct in enumerate([90, 40, None, 70, 65])
+            ])
+            jobs = db.get_matched_jobs('JS_1', min_match=60, purpose='interview')
+            assert [job['job_id'] for job in jobs] == ['job-0', 'job-3', 'job-4', 'job-2']
+            assert 'application_url' not in jobs[0]
+            assert len(db.get_matched_jobs('JS_1', min_match=60, limit=2)) == 2
+            with db.get_connection() as conn:
+                plan = " ".join(row[3] for row in conn.execute(
+                    "EXPLAIN QUERY PLAN " + job_post_api_db._SQL_MATCHED_JOBS['general'][0], ('JS_1', 60, 10)))
+            assert "match_percentage>?" in plan
+    
+    def test_matched_job_text_lives_in_side_table(self):
+        """Test legacy files migrate to a job_id-keyed table with text split off"""
+        import sqlite3
+        from database import MatchedJobsDB
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = os.path.join(tmpdir, "job_post_API.db")
+            # Older single-table layout with the text inline
+            legacy = sqlite3.connect(db_path)
+            legacy.execute("""
+                CREATE TABLE matched_jobs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT, job_seeker_id TEXT NOT NULL,
+                    job_id TEXT UNIQUE NOT NULL, job_title TEXT NOT NULL, company_name TEXT,
+                    location TEXT, job_description TEXT, required_skills TEXT,
+                    preferred_skills TEXT, experience_required TEXT, salary_min REAL,
+                    salary_max REAL, employment_type TEXT, industry TEXT, posted_date TEXT,
+                    application_url TEXT, cosine_similarity_score REAL, match_percentage INTEGER,
+                    skill_match_score REAL, experience_match_score REAL, matched_skills TEXT,
+                    missing_skills TEXT, matched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            legacy.execute("INSERT INTO matched_jobs (job_seeker_id, job_id, job_title, "
+                           "job_description) VALUES ('JS_1', 'old', 'Old', 'Legacy text')")
+            legacy.commit()
+            legacy.close()
+            
+            db = MatchedJobsDB(db_path)
+            assert db.save_matched_job({'job_seeker_id': 'JS_1', 'job_id': 'new', 'job_title': 'New',
+                                 'job_description': 'Full text', 'matched_skills': 'Python',
+                                 'match_percentage': 80}) == 'new'
+            assert db.get_matched_job('old')['job_description'] == 'Legacy text'
+            assert db.get_job_for_resume('JS_1', 'new')['matched_skills'] == 'Python'
+            assert db.get_jobs_for_interview('JS_1')[0]['job_description'] == 'Full text'
+            with db.get_connection() as conn:
+                columns = {row[1] for row in conn.execute("PRAGMA table_info(matched_jobs)")}
+                assert 'job_description' not in columns and 'id' not in columns
+                plan = " ".join(row[3] for row in conn.execute(
+                    "EXPLAIN QUERY PLAN SELECT * FROM matched_jobs WHERE job_id = ?", ('new',)))
+                assert "PRIMARY KEY" in plan
+                db.delete_matched_job('new')
+                assert conn.execute("SELECT COUNT(*) FROM matched_jobs_text").fetchone()[0] == 1
+    
+    def test_iter_all_matched_jobs_streams_in_batches(self, monkeypatch):
+        """Test streaming all matched jobs yields every row across fetch batches"""
+        import database.job_post_api_db as job_post_api_db
+        from database import MatchedJobsDB
+        
+        monkeypatch.setattr(job_post_api_db, 'STREAM_BATCH_SIZE', 2)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db = MatchedJobsDB(os.path.join(tmpdir, "job_post_API.db"))
+            db.save_matched_jobs_batch([
+                {'job_seeker_id': 'JS_1', 'job_id': f'job-{i}', 'job_title': f'Role {i}'}
+                for i in range(5)
+            ])
+            jobs = db.iter_all_matched_jobs()
+            assert next(jobs)['job_seeker_id'] == 'JS_1'
+            jobs.close()  # abandoning the stream returns the connection
+            assert sorted(job['job_id'] for job in db.iter_all_matched_jobs()) == \
+                [f'job-{i}' for i in range(5)]
+            assert len(db.get_all_matched_jobs()) == 5
+    
+    def test_db_connections_are_pooled_per_file(self):
+        """Test get_connection reuses pooled connections and resets row factory"""
+        import sqlite3
+        from database import HeadhunterDB
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db = HeadhunterDB(os.path.join(tmpdir, "head_hunter_jobs.db"))
+            with db.get_connection() as conn:
+                first = conn
+                conn.row_factory = None
+            with db.get_connection() as conn:
+                assert conn is first
+                assert conn.row_factory is sqlite3.Row
+            try:
+                with db.get_connection() as conn:
+                    conn.execute("CREATE TABLE scratch (x INTEGER)")
+                    conn.execute("INSERT INTO scratch VALUES (1)")
+                    raise RuntimeError("abort")
+            except RuntimeError:
+                pass
+            with db.get_connection() as conn:
+                assert conn.execute("SELECT COUNT(*) FROM scratch").fetchone()[0] == 0
+    
+    def test_matched_jobs_read_and_write_connections(self):
+        """Test writers lock up front and readers never commit"""
+        from database import MatchedJobsDB
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db = MatchedJobsDB(os.path.join(tmpdir, "job_post_API.db"))
+            with db.get_write_connection() as conn:
+                assert conn.in_transaction  # BEGIN IMMEDIATE before any statement
+            with db.get_read_connection() as conn:
+                conn.execute("INSERT INTO matched_jobs (job_seeker_id, job_id, job_title) "
+                             "VALUES ('JS_1', 'stray', 'Stray')")
+            assert db.get_matched_job('stray') is None
+            db.save_matched_jobs_batch([{'job_seeker_id': 'JS_1', 'job_id': 'job-1',
+                                         'job_title': 'Role 1'}])
+            assert db.delete_matched_job('job-1') is True
+            assert db.get_matched_job('job-1') is None
+    
+    def test_failed_rollback_keeps_original_error(self, monkeypatch):
+        """Test a connection that can't roll back is closed and the caller's error kept"""
+        import sqlite3
+        import database.connection as connection
+
+        class BrokenConnection:
+            closed = False
+            row_factory = None
+
+            def rollback(self):
+                raise sqlite3.OperationalError("disk I/O error")
+
+            def close(self):
+                self.closed = True
+
+        class FakePool:
+            def __init__(self):
+                self.conn, self.returned = BrokenConnection(), []
+
+            def get(self):
+                return self.conn
+
+            def put(self, conn):
+                self.returned.append(conn)
+
+        pool = FakePool()
+        monkeypatch.setattr(connection, '_get_pool', lambda db_path: pool)
+        with pytest.raises(ValueError, match="caller error"):
+            with connection.pooled_connection("unused.db"):
+                raise ValueError("caller error")
+        assert pool.conn.closed and pool.returned == []
+    
+    def test_db_connections_use_wal_and_tuned_pragmas(self):
+        """Test database connections are opened in WAL mode with tuned PRAGMAs"""
+        from database import MatchedJobsDB
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db = MatchedJobsDB(os.path.join(tmpdir, "job_post_API.db"))
+            with db.get_connection() as conn:
+                assert conn.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+                assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+                assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+                assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+
 
 class TestJobMatcher:
     """Test job matching functionality."""
@@ -196,6 +454,154 @@ class TestJobMatcher:
         assert 'matched_skills' in result
         assert 0 <= result['overall_score'] <= 100
     
+    def test_calculate_match_scores_skill_overlap(self):
+        """Test skill matching finds overlapping skills in title and description"""
+        from core.job_matcher import calculate_match_scores
+
+        jobs = [{
+            'title': 'Data Analyst',
+            'description': 'Need SQL and JavaScript experience',
+            'similarity_score': 80,
+        }]
+        result = calculate_match_scores(jobs, {'skills': ['SQL', 'Java', 'JavaScript', 'Data', 'Rust']})[0]
+
+        assert sorted(result['matched_skills']) == ['data', 'java', 'javascript', 'sql']
+        assert result['skill_match_percentage'] == 80.0
+        assert result['combined_score'] == 80.0
+
+    def test_match_score_matrix_agrees_with_simple_match(self):
+        """Test vectorized job x seeker scores equal analyze_match_simple"""
+        from core.job_matcher import analyze_match_simple, match_score_matrix, top_matches_for_job
+
+        jobs = [
+            (1, 't', 'Analyst', 'd', 'python sql excel', 'Acme', 'finance', 'x', 'hong kong',
+             '', '', '3-5 years', '', 1, 2, 'HKD', '', 'english, cantonese'),
+            (2, 't', 'Engineer', 'd', 'java aws', 'Beta', 'tech', 'x', 'singapore',
+             '', '', 'fresh graduate', '', 1, 2, 'HKD', '', ''),
+        ]
+        seekers = [
+            (1, 'A', 'python sql', '1-3 years', 'BSc', 'p', 'finance', 'hong kong', '', '', 'English'),
+            (2, 'B', 'java', '10+ years', 'MSc', 'p', 'retail', 'kowloon', '', '', 'Mandarin'),
+            (3, 'C', '', 'other', 'BA', 'p', 'tech', 'singapore', '', '', ''),
+        ]
+
+        scores = match_score_matrix(jobs, seekers)
+        for i, job in enumerate(jobs):
+            for j, seeker in enumerate(seekers):
+                assert int(scores[i, j]) == analyze_match_simple(job, seeker)['match_score']
+
+        top = top_matches_for_job(jobs[0], seekers, k=2)
+        assert [seeker[0] for seeker, _ in top] == [1, 3]
+
+    def test_embedding_cache_roundtrip(self):
+        """Test embeddings are persisted and served from the SQLite cache"""
+        import numpy as np
+        from core.job_matcher import EmbeddingCache
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = EmbeddingCache(os.path.join(tmpdir, "emb.db"))
+            key = EmbeddingCache.make_key("model", "Data Analyst")
+            assert cache.get(key) is None
+
+            cache.put(key, "model", [0.25, -0.5, 1.0])
+            cached = cache.get(key)
+            assert cached.dtype == np.float32
+            assert cached.tolist() == [0.25, -0.5, 1.0]
+            assert not cached.flags.writeable
+            assert EmbeddingCache.make_key("other", "Data Analyst") != key
+
+            reloaded = EmbeddingCache(os.path.join(tmpdir, "emb.db"))
+            assert reloaded.get(key).tolist() == [0.25, -0.5, 1.0]
+
+    def test_wire_vectors_are_short_and_close(self):
+        """Test Pinecone wire quantization keeps vectors within 1e-4"""
+        import json
+        import numpy as np
+        from core.job_matcher import _to_wire
+
+        rng = np.random.default_rng(0)
+        emb = rng.normal(size=(2, 384)).astype(np.float32)
+        emb /= np.linalg.norm(emb, axis=1, keepdims=True)
+
+        wire = _to_wire(emb)
+        assert np.abs(wire - emb).max() <= 5e-5 + 1e-9
+        assert len(json.dumps(wire[0].tolist())) * 2 < len(json.dumps(emb[0].tolist()))
+
+    def test_wait_for_vectors_polls_index_stats(self):
+        """Test post-index wait returns once the vector count catches up"""
+        from core import JobMatcher
+
+        class FakeIndex:
+            def __init__(self):
+                self.counts = iter([10, 10, 12])
+
+            def describe_index_stats(self):
+                return {'total_vector_count': next(self.counts, 12)}
+
+        matcher = JobMatcher()
+        matcher._index = FakeIndex()
+        assert matcher.wait_for_vectors(12, timeout=5.0, interval=0.0) is True
+        assert matcher.wait_for_vectors(20, timeout=0.0) is False
+
+    def test_indexed_job_log_persists(self):
+        """Test indexed job hashes survive a reload from SQLite"""
+        from core.job_matcher import IndexedJobLog
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = os.path.join(tmpdir, "emb.db")
+            job_hash = IndexedJobLog.make_hash("job-matcher", "Data Analyst Acme SQL")
+            log = IndexedJobLog(db_path)
+            assert job_hash not in log
+
+            log.add_many([(job_hash, "job_1")])
+            assert job_hash in log
+            assert job_hash in IndexedJobLog(db_path)
+            assert IndexedJobLog.make_hash("other-index", "Data Analyst Acme SQL") != job_hash
+
+    def test_auto_embedding_backend_falls_back_on_onnx_failure(self, monkeypatch):
+        """Test 'auto' falls back to SentenceTransformer when the ONNX export fails"""
+        import core.job_matcher as job_matcher
+
+        def failing_export(model_name, export_dir):
+            raise OSError("read-only file system")
+
+        class FakeSentenceTransformer:
+            def __init__(self, model_name):
+                self.model_name = model_name
+
+        monkeypatch.setattr(job_matcher, 'OnnxSentenceEncoder', failing_export)
+        monkeypatch.setattr(job_matcher, '_get_sentence_transformer_class',
+                            lambda: FakeSentenceTransformer)
+        load = job_matcher._get_sentence_transformer_model_cached
+        load.clear()
+        try:
+            assert isinstance(load('fallback-test-model', 'auto'), FakeSentenceTransformer)
+            with pytest.raises(OSError):
+                load('fallback-test-model', 'onnx')
+        finally:
+            load.clear()
+
+    def test_indexed_job_log_cleared_for_empty_index(self):
+        """Test an empty (recreated) Pinecone index resets the indexed-job log"""
+        from core import JobMatcher
+        from core.job_matcher import IndexedJobLog
+
+        class EmptyIndex:
+            def describe_index_stats(self):
+                return {'total_vector_count': 0}
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            matcher = JobMatcher()
+            matcher.indexed_jobs = IndexedJobLog(os.path.join(tmpdir, "emb.db"))
+            matcher.indexed_jobs.add_many([("h1", "job_1")])
+            matcher._index = EmptyIndex()
+            matcher._sync_indexed_jobs()
+            assert "h1" not in matcher.indexed_jobs
+            assert "h1" not in IndexedJobLog(os.path.join(tmpdir, "emb.db"))
+            matcher.indexed_jobs.add_many([("h2", "job_2")])
+            matcher._sync_indexed_jobs()  # only checked once per matcher
+            assert "h2" in matcher.indexed_jobs
+
     def test_analyze_match_simple(self):
         """Test simple match analysis - verifies function exists and is callable"""
         from core.job_matcher import analyze_match_simple
@@ -224,6 +630,102 @@ class TestResumeParser:
         # GPT4JobRoleDetector uses analyze() method
         assert hasattr(detector, 'analyze') or hasattr(detector, '__init__')
 
+    def test_completion_retries_transient_errors_and_skips_missing_fallback(self, monkeypatch):
+        """Test 5xx/connection errors are retried and a missing fallback re-raises the real error"""
+        import httpx
+        import openai
+        import core.resume_parser as resume_parser
+        from core import GPT4JobRoleDetector
+
+        request = httpx.Request("POST", "https://example.invalid")
+        server_error = openai.InternalServerError(
+            "boom", response=httpx.Response(500, request=request), body=None)
+        rate_limit = openai.RateLimitError(
+            "slow down", response=httpx.Response(429, request=request), body=None)
+        not_found = openai.NotFoundError(
+            "no deployment", response=httpx.Response(404, request=request), body=None)
+
+        class FakeClient:
+            def __init__(self, outcomes):
+                self.outcomes = list(outcomes)
+                self.models = []
+                self.chat = self
+                self.completions = self
+
+            def create(self, model, **kwargs):
+                self.models.append(model)
+                outcome = self.outcomes.pop(0)
+                if isinstance(outcome, Exception):
+                    raise outcome
+                return outcome
+
+        class FallbackConfig:
+            AZURE_MODEL = 'main'
+            AZURE_FALLBACK_MODEL = 'backup'
+
+        monkeypatch.setattr(resume_parser.time, 'sleep', lambda seconds: None)
+        detector = GPT4JobRoleDetector()
+        detector._client = FakeClient([server_error, openai.APIConnectionError(request=request), "ok"])
+        assert detector._create_completion(messages=[]) == "ok"
+
+        detector = GPT4JobRoleDetector(config=FallbackConfig)
+        detector._client = FakeClient([rate_limit] * 3 + [not_found])
+        with pytest.raises(openai.RateLimitError):
+            detector._create_completion(messages=[])
+        assert detector._client.models == ['main'] * 3 + ['backup']
+
+    def test_analysis_cache_similarity_lookup(self):
+        """Test analysis cache hits only above the similarity threshold"""
+        from core.resume_parser import ResumeAnalysisCache
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = ResumeAnalysisCache(os.path.join(tmpdir, "analysis.db"), threshold=0.97)
+            assert cache.lookup([1.0, 0.0]) is None
+
+            cache.store([1.0, 0.0], {"primary_role": "Data Analyst"})
+            assert cache.lookup([0.999, 0.0447])["primary_role"] == "Data Analyst"
+            assert cache.lookup([0.0, 1.0]) is None
+
+    def test_analysis_cache_checks_hash_and_every_chunk(self):
+        """Test an edit below the resume header misses the analysis cache"""
+        from core.resume_parser import ResumeAnalysisCache
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = ResumeAnalysisCache(os.path.join(tmpdir, "analysis.db"), threshold=0.97)
+            text_hash = ResumeAnalysisCache.make_hash("Jane Doe\nData Analyst\nSQL")
+            cache.store([[1.0, 0.0], [0.0, 1.0]], {"primary_role": "Data Analyst"}, text_hash)
+            assert cache.get_exact(text_hash)["primary_role"] == "Data Analyst"
+            assert cache.get_exact(ResumeAnalysisCache.make_hash("Jane Doe\nData Analyst\nSAS")) is None
+
+            # Same header chunk, different lower chunk
+            assert cache.lookup([[1.0, 0.0], [0.6, 0.8]]) is None
+            assert cache.lookup([[1.0, 0.0]]) is None  # different chunk count
+            assert cache.lookup([[1.0, 0.0], [0.0447, 0.999]])["primary_role"] == "Data Analyst"
+
+    def test_local_resume_analysis_fast_path(self):
+        """Test local analysis handles clear resumes and defers ambiguous ones"""
+        from core.resume_parser import local_resume_analysis
+
+        resume = (
+            "Jane Doe\nSenior Data Analyst | Hong Kong\n"
+            "Skills: Python, SQL, Tableau, Power BI, Excel, C++, Agile, machine learning"
+        )
+        result = local_resume_analysis(resume)
+        assert result['primary_role'] == "Data Analyst"
+        assert result['seniority_level'] == "Senior"
+        assert "C++" in result['skills']
+        assert "Machine Learning" in result['skills']
+
+        assert local_resume_analysis("Jane Doe\nSkills: Python, SQL") is None
+
+        # Everyday words and soft skills don't make a resume look unambiguous
+        prose = ("Jane Doe\nSenior Financial Analyst\nI like to go hiking in spring and rest, "
+                 "swift and agile, ruby ring. Excel at leadership and communication.")
+        assert local_resume_analysis(prose) is None
+        soft = resume + ", Leadership, Communication"
+        assert local_resume_analysis(soft, min_skills=9) is None
+        assert local_resume_analysis(soft)['simple_search_terms'] == ["Data Analyst", "Python", "SQL"]
+
 
 class TestConfiguration:
     """Test configuration management."""
@@ -255,6 +757,16 @@ class TestConfiguration:
         
         assert Config.DB_PATH_JOB_SEEKER is not None
         assert Config.DB_PATH_HEAD_HUNTER is not None
+    
+    def test_config_database_paths_are_paths(self):
+        """Test database paths are stored as Path objects"""
+        from pathlib import Path
+        from config import Config
+        from database.job_seeker_db import DB_PATH_JOB_SEEKER
+        
+        assert isinstance(Config.DB_PATH_COMPLETION_CACHE, Path)
+        assert isinstance(Config.DIR_ONNX_MODELS, Path)
+        assert isinstance(DB_PATH_JOB_SEEKER, Path)
 
 
 class TestSalaryAnalyzer:
@@ -348,6 +860,35 @@ class TestRateLimiting:
         assert hasattr(tracker, 'add_usage')
         assert hasattr(tracker, 'get_summary')
     
+    def test_token_tracker_sums_threads(self):
+        """Test usage added from several threads is summed on read"""
+        import threading
+        from core import TokenUsageTracker
+        
+        tracker = TokenUsageTracker()
+        
+        def work():
+            for _ in range(100):
+                tracker.add_usage("gpt-4o-mini", 10, 5)
+            tracker.add_embedding_tokens(7)
+        
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        summary = tracker.get_summary()
+        assert len(tracker._shards) == 0  # exited threads folded into the base
+        assert summary['prompt_tokens'] == 4000
+        assert summary['completion_tokens'] == 2000
+        assert summary['embedding_tokens'] == 28
+        assert summary['total_tokens'] == 6028
+        assert summary['usage_by_model']['gpt-4o-mini'] == {"prompt": 4000, "completion": 2000}
+        assert tracker.get_total_cost() > 0
+        tracker.reset()
+        assert tracker.get_summary()['total_tokens'] == 0
+    
     def test_rate_limiter(self):
         """Test RateLimiter"""
         from core import RateLimiter
@@ -358,6 +899,43 @@ class TestRateLimiting:
         # Check it has a method for rate limiting
         assert hasattr(limiter, 'wait_if_needed') or hasattr(limiter, '__init__')
 
+    
+    def test_rate_limiter_sliding_window(self):
+        """Test RateLimiter expires calls after the window and waits for a slot"""
+        import time
+        from core import RateLimiter
+        
+        sleeps = []
+        limiter = RateLimiter(max_calls=2, time_window=0.2,
+                              sleep_func=lambda s: (sleeps.append(s), time.sleep(s)))
+        assert limiter.allow_request() and limiter.allow_request()
+        assert not limiter.allow_request()
+        assert limiter.get_remaining_calls() == 0
+        assert 0 < limiter.get_reset_time() <= 0.2
+        limiter.wait_if_needed()
+        assert len(sleeps) == 1 and 0 < sleeps[0] <= 0.2
+        assert limiter.get_remaining_calls() < 2
+        time.sleep(0.25)
+        assert limiter.get_remaining_calls() == 2
+        assert limiter.get_reset_time() == 0.0
+
+    def test_rate_limiter_waiters_never_exceed_limit(self):
+        """Test threads woken for the same slot re-check instead of all proceeding"""
+        import time
+        import threading
+        from core import RateLimiter
+        
+        limiter = RateLimiter(max_calls=2, time_window=0.2)
+        assert limiter.allow_request() and limiter.allow_request()
+        threads = [threading.Thread(target=limiter.wait_if_needed) for _ in range(3)]
+        start = time.monotonic()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        # Two waiters fit once the first calls expire; the third needs another window
+        assert time.monotonic() - start >= 0.35
+        assert len(limiter.calls) <= 2
 
 class TestInterviewModule:
     """Test interview functionality."""
@@ -376,6 +954,402 @@ class TestInterviewModule:
         assert evaluate_answer is not None
         assert generate_final_summary is not None
 
+    def test_evaluate_answers_preserves_order(self):
+        """Test concurrent evaluation returns one result per answer, in order"""
+        from core import evaluate_answers
+
+        class UnconfiguredConfig:
+            @staticmethod
+            def check_azure_credentials():
+                return False, "not configured"
+
+        job = (1, 'Data Analyst', 'desc', 'resp', 'SQL', 'Acme', 'Finance', 'Mid')
+        answer = "I cleaned the sales data in SQL and built a weekly dashboard for the team."
+        results = evaluate_answers([("Q1", answer), ("Q2", answer), ("Q3", answer)], job,
+                                   config=UnconfiguredConfig)
+        assert results == ['{"error": "not configured"}'] * 3
+        assert evaluate_answers([], job) == []
+
+    def test_evaluate_answers_batch_fills_missing_items(self, monkeypatch):
+        """Test one batched scoring call, with per-answer fallback for gaps"""
+        import json
+        import core.interview as interview
+
+        class ConfiguredConfig:
+            AZURE_ENDPOINT = "https://example.openai.azure.com"
+            AZURE_API_KEY = "key"
+            AZURE_API_VERSION = "2024-02-15-preview"
+            INTERVIEW_FAST_MODEL = "fast"
+
+            @staticmethod
+            def check_azure_credentials():
+                return True, ""
+
+        batched = []
+        monkeypatch.setattr(interview, "_get_client", lambda *args: None)
+        monkeypatch.setattr(interview, "_rescore_completion", lambda client, **kwargs: (
+            batched.append(kwargs) or '{"scores": [{"score": 7, "feedback": "ok"}, {"feedback": "no score"}]}'
+        ))
+        monkeypatch.setattr(interview, "evaluate_answers", lambda pairs, *args, **kwargs: [
+            json.dumps({"score": 5, "feedback": f"single {q}"}) for q, _ in pairs
+        ])
+
+        job = (1, 'Data Analyst', 'desc', 'resp', 'SQL', 'Acme', 'Finance', 'Mid')
+        answer = "I cleaned the sales data in SQL and built a weekly dashboard for the team."
+        results = interview.evaluate_answers_batch(
+            [("Q1", answer), ("Q2", answer), ("Q3", answer), ("Q4", "no idea")], job,
+            config=ConfiguredConfig
+        )
+        assert len(batched) == 1 and batched[0]['messages'][1]['content'].count(answer) == 3
+        assert [json.loads(r)["feedback"] for r in results[:3]] == ["ok", "single Q2", "single Q3"]
+        assert results[3] == interview.TRIVIAL_ANSWER_EVALUATION
+
+    def test_trivial_answers_scored_without_api_call(self):
+        """Test short or echoed answers get the canned score before any client setup"""
+        import json
+        from core.interview import evaluate_answer, TRIVIAL_ANSWER_EVALUATION
+
+        class ExplodingConfig:
+            @staticmethod
+            def check_azure_credentials():
+                raise AssertionError("API should not be configured for trivial answers")
+
+        job = (1, 'Data Analyst', 'desc', 'resp', 'SQL', 'Acme', 'Finance', 'Mid')
+        question = "Describe a time you improved a slow SQL report for stakeholders."
+        for answer in ("", "  idk  ", question.lower()):
+            assert evaluate_answer(question, answer, job, config=ExplodingConfig) == TRIVIAL_ANSWER_EVALUATION
+        assert json.loads(TRIVIAL_ANSWER_EVALUATION)["score"] == 2
+
+    def test_evaluate_and_generate_next_returns_both(self):
+        """Test the combined evaluation/follow-up call returns (evaluation, question)"""
+        from core import evaluate_and_generate_next
+
+        class UnconfiguredConfig:
+            @staticmethod
+            def check_azure_credentials():
+                return False, "not configured"
+
+        job = (1, 'Data Analyst', 'desc', 'resp', 'SQL', 'Acme', 'Finance', 'Mid')
+        answer = "I cleaned the sales data in SQL and built a weekly dashboard for the team."
+        evaluation, next_question = evaluate_and_generate_next(
+            "Q1", answer, job, None, config=UnconfiguredConfig
+        )
+        assert evaluation == '{"error": "not configured"}'
+        assert next_question == "Error: not configured"
+
+        # Trivial answers are scored locally; only the follow-up hits the API
+        from core.interview import TRIVIAL_ANSWER_EVALUATION
+        evaluation, next_question = evaluate_and_generate_next(
+            "Q1", "A1", job, None, config=UnconfiguredConfig
+        )
+        assert evaluation == TRIVIAL_ANSWER_EVALUATION
+        assert next_question == "Error: not configured"
+
+    def test_prefetch_interview_question_returns_future(self):
+        """Test question prefetch runs in the background and resolves to the result"""
+        from core import prefetch_interview_question
+
+        class UnconfiguredConfig:
+            @staticmethod
+            def check_azure_credentials():
+                return False, "not configured"
+
+        job = (1, 'Data Analyst', 'desc', 'resp', 'SQL', 'Acme', 'Finance', 'Mid')
+        future = prefetch_interview_question(job, None, ["Q1"], config=UnconfiguredConfig)
+        assert future.result(timeout=5) == "Error: not configured"
+
+    def test_apply_batch_evaluation(self):
+        """Test one batched result fills scores/summary for every answer"""
+        from core import initialize_interview_session, apply_batch_evaluation
+
+        job = (1, 'Data Analyst', 'desc', 'resp', 'SQL', 'Acme', 'Finance', 'Mid')
+        interview = initialize_interview_session(job)
+        interview['questions'] = ["Q1", "Q2"]
+        interview['answers'] = ["A1", "A2"]
+        interview['pending'] = [{'q': "Q1", 'a': "A1"}, {'q': "Q2", 'a': "A2"}]
+
+        assert apply_batch_evaluation(interview, '{"error": "not configured"}') == "not configured"
+        assert not interview['completed'] and len(interview['pending']) == 2
+
+        result = '{"scores": [{"score": 8, "feedback": "Good"}], "summary": {"overall_score": 75}}'
+        assert apply_batch_evaluation(interview, result) is None
+        assert interview['completed'] and interview['pending'] == []
+        assert interview['summary'] == {"overall_score": 75}
+        assert [s['score'] for s in interview['scores']] == [8, 'N/A']
+
+        interview['completed'] = False
+        assert apply_batch_evaluation(interview, "not json") is None
+        assert interview['summary'] == {"error": "Summary parsing failed"}
+        assert interview['completed']
+
+    def test_chat_completion_streams_deltas(self):
+        """Test streamed completions forward each delta and return the full text"""
+        from types import SimpleNamespace
+        from core.interview import _chat_completion, DETERMINISTIC_SEED
+
+        def chunk(text):
+            return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=text))])
+
+        class FakeCompletions:
+            def create(self, **kwargs):
+                assert kwargs['stream'] is True
+                assert kwargs['seed'] == DETERMINISTIC_SEED
+                return iter([SimpleNamespace(choices=[]), chunk("Tell me "), chunk(None), chunk("about SQL. ")])
+
+        client = SimpleNamespace(chat=SimpleNamespace(completions=FakeCompletions()))
+        seen = []
+        text = _chat_completion(client, model="m", messages=[], temperature=0,
+                                max_tokens=10, on_token=seen.append)
+        assert seen == ["Tell me ", "about SQL. "]
+        assert text == "Tell me about SQL."
+
+    def test_summarize_skills_keeps_whole_leading_skills(self):
+        """Test long skill requirements are trimmed to whole skills within budget"""
+        from core.interview import summarize_skills
+
+        assert summarize_skills("Python, SQL") == "Python, SQL"
+        assert summarize_skills("") == ""
+        long_skills = ", ".join(f"Skill {i} framework" for i in range(200))
+        trimmed = summarize_skills(long_skills, budget_tokens=20)
+        assert long_skills.startswith(trimmed)
+        assert trimmed.endswith("framework") and len(trimmed) < len(long_skills)
+
+    def test_interview_client_is_shared(self):
+        """Test interview calls reuse one pooled client per credential set"""
+        pytest.importorskip("openai")
+        import httpx
+        from core.interview import _get_client
+        
+        first = _get_client("https://example.openai.azure.com/openai/", "key", "2024-02-15-preview")
+        second = _get_client("https://example.openai.azure.com/openai/", "key", "2024-02-15-preview")
+        assert first is second
+        assert isinstance(first._client, httpx.Client)
+
+    def test_azure_client_shared_per_transport_options(self):
+        """Test the shared client factory reuses clients and cleans endpoints"""
+        pytest.importorskip("openai")
+        from core.azure_client import clean_endpoint, get_azure_openai_client
+        
+        assert clean_endpoint("https://x.openai.azure.com/openai/") == "https://x.openai.azure.com"
+        args = ("https://example.openai.azure.com", "key", "2024-02-15-preview")
+        insecure = get_azure_openai_client(*args, verify=False, max_retries=0)
+        assert get_azure_openai_client(*args, verify=False, max_retries=0) is insecure
+        assert get_azure_openai_client(*args) is not insecure
+        assert insecure.max_retries == 0
+
+    def test_summary_records_are_canonical(self):
+        """Test summary prompt records drop run metadata and normalize scores"""
+        from core.interview import _summary_records
+        
+        first = {'questions': ["Why us? "], 'answers': ["Growth."],
+                 'scores': [{'score': "8", 'feedback': "Good ", 'confidence': 0.4}]}
+        replay = {'questions': ["Why us?"], 'answers': ["Growth. "],
+                  'scores': [{'feedback': "Good", 'score': 8.0, 'ts': 1700000000}]}
+        assert _summary_records(first) == _summary_records(replay)
+        assert _summary_records(first)[0]['score'] == 8
+        missing = {'questions': ["Q"], 'answers': ["A"], 'scores': [{'score': 'N/A'}]}
+        assert _summary_records(missing)[0]['score'] == 'N/A'
+
+    def test_evaluation_prompt_puts_dynamic_text_last(self):
+        """Test scoring prompts keep the rubric first and the Q&A at the end"""
+        from core.interview import EVALUATION_RUBRIC, _evaluation_request
+        
+        job = (1, "Data Analyst", "desc", "resp", "SQL", "Acme", "Finance", "2 years")
+        first = _evaluation_request("Why SQL?", "Joins.", job, None)["messages"]
+        second = _evaluation_request("Why Python?", "Pandas.", job, None)["messages"]
+        assert first[0] == second[0]
+        assert first[1]["content"].startswith(EVALUATION_RUBRIC)
+        assert second[1]["content"].rstrip().endswith("Pandas.")
+
+    def test_json_schema_only_on_supporting_api_versions(self):
+        """Test strict schemas are requested only where structured outputs exist"""
+        from types import SimpleNamespace
+        from core.interview import EVALUATION_SCHEMA, _response_format
+        
+        new = SimpleNamespace(default_query={'api-version': '2024-10-21'})
+        old = SimpleNamespace(default_query={'api-version': '2024-02-15-preview'})
+        assert _response_format(new, EVALUATION_SCHEMA) == {
+            "type": "json_schema", "json_schema": EVALUATION_SCHEMA}
+        assert _response_format(old, EVALUATION_SCHEMA) == {"type": "json_object"}
+        assert _response_format(new, True) == {"type": "json_object"}
+        assert _response_format(new, False) is None
+        schema = EVALUATION_SCHEMA["schema"]
+        assert set(schema["required"]) == set(schema["properties"])
+
+    def test_interview_model_routing(self):
+        """Test fast/quality deployment routing and confidence parsing"""
+        from core.interview import _interview_model, _evaluation_confidence
+
+        class RoutedConfig:
+            AZURE_OPENAI_DEPLOYMENT = 'main'
+            INTERVIEW_FAST_MODEL = 'small'
+            INTERVIEW_QUALITY_MODEL = None
+
+        assert _interview_model(RoutedConfig, 'fast') == 'small'
+        assert _interview_model(RoutedConfig, 'quality') == 'main'
+        assert _evaluation_confidence('{"score": 7, "confidence": 0.4}') == 0.4
+        assert _evaluation_confidence('{"score": 7}') == 1.0
+        assert _evaluation_confidence('not json') == 0.0
+
+    def test_opening_questions_are_cached_without_seeker_details(self, monkeypatch):
+        """Test shared opening questions use a job-only prompt and keep growing the pool"""
+        import core.interview as interview
+
+        class RoutedConfig:
+            AZURE_OPENAI_DEPLOYMENT = 'main'
+            INTERVIEW_FAST_MODEL = None
+
+        calls = []
+        monkeypatch.setattr(interview, '_configured_client',
+                            lambda config=None: (RoutedConfig, object(), None))
+        monkeypatch.setattr(interview, '_question_completion',
+                            lambda client, **kwargs: calls.append(kwargs) or "Q?")
+        job = (1, 'Data Analyst', 'desc', 'resp', 'SQL', 'Acme', 'Finance', 'Mid')
+        seeker = ('BSc', '3 years', 'SQL', 'Teamwork', 'Dashboards')
+        ctx = interview.build_interview_context(job, seeker)
+
+        monkeypatch.setattr(interview.random, 'random', lambda: 0.99)
+        assert interview.generate_interview_question(job, seeker, context=ctx) == "Q?"
+        monkeypatch.setattr(interview.random, 'random', lambda: 0.0)
+        interview.generate_interview_question(job, seeker, context=ctx)
+        assert 'Dashboards' not in calls[0]['messages'][0]['content']
+        assert calls[0]['messages'][0]['content'] == interview.build_interview_context(job)
+        assert [call['no_cache'] for call in calls] == [False, True]
+
+    def test_reset_interview_session_in_place(self):
+        """Test restart clears progress but keeps the session dict and context"""
+        from core import initialize_interview_session, reset_interview_session
+
+        job = (1, 'Data Analyst', 'desc', 'resp', 'SQL', 'Acme', 'Finance', 'Mid')
+        interview = initialize_interview_session(job)
+        ctx = interview['ctx_system']
+        interview.update({'questions': ["Q1"], 'answers': ["A1"], 'current_question': 1,
+                          'completed': True, 'summary': {'overall_score': 80}})
+        assert reset_interview_session(interview) is interview
+        assert interview['questions'] == [] and interview['answers'] == []
+        assert interview['current_question'] == 0 and not interview['completed']
+        assert interview['summary'] is None and interview['ctx_system'] is ctx
+
+    def test_interview_calls_share_system_prefix(self):
+        """Test question/evaluation/summary messages start with the same system prompt"""
+        from core.interview import _interview_messages, build_interview_context
+
+        job = (1, 'Data Analyst', 'desc', 'resp', 'SQL', 'Acme', 'Finance', 'Mid')
+        seeker = ('BSc', '3 years', 'SQL', 'Teamwork', 'Dashboards')
+        first = _interview_messages(job, seeker, "question prompt")
+        second = _interview_messages(list(job), list(seeker), "evaluation prompt")
+        assert first[0] == second[0]
+        assert first[0]['content'] == build_interview_context(job, seeker)
+        assert 'Data Analyst' in first[0]['content'] and 'Dashboards' in first[0]['content']
+        assert first[1] == {"role": "user", "content": "question prompt"}
+
+        from core import initialize_interview_session
+        ctx = initialize_interview_session(job, seeker)['ctx_system']
+        assert ctx == first[0]['content']
+        assert _interview_messages(job, seeker, "summary prompt", ctx)[0]['content'] is ctx
+
+    def test_completion_cache_namespaces_and_similarity(self):
+        """Test completion cache hits per namespace and above the threshold"""
+        from core.completion_cache import CompletionCache
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = CompletionCache(os.path.join(tmpdir, "completions.db"))
+            h = CompletionCache.make_hash("q|gpt-4o-mini|0.8", "prompt")
+            cache.store("q|gpt-4o-mini|0.8", h, [1.0, 0.0], "Tell me about SQL.")
+
+            assert cache.lookup("q|gpt-4o-mini|0.8", h, None, 0.95, 3600) == "Tell me about SQL."
+            other = CompletionCache.make_hash("q|gpt-4o-mini|0.8", "other prompt")
+            assert cache.lookup("q|gpt-4o-mini|0.8", other, [0.999, 0.0447], 0.95, 3600) == "Tell me about SQL."
+            assert cache.lookup("q|gpt-4o-mini|0.8", other, [0.0, 1.0], 0.95, 3600) is None
+            assert cache.lookup("q|gpt-4o-mini|0.0", other, [1.0, 0.0], 0.95, 3600) is None
+            assert cache.lookup("q|gpt-4o-mini|0.8", h, None, 0.95, -1) is None
+
+            # Exact hits come from memory, and from SQLite after a restart
+            assert cache.get_exact(h, 3600) == "Tell me about SQL."
+            reopened = CompletionCache(os.path.join(tmpdir, "completions.db"))
+            assert reopened.get_exact(h, 3600) == "Tell me about SQL."
+            assert reopened.get_exact(other, 3600) is None
+
+    def test_completion_cache_samples_similar_entries(self):
+        """Test sampled lookups pick among all near-duplicates above threshold"""
+        from core.completion_cache import CompletionCache
+        from core.interview import _question_seed_key
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = CompletionCache(os.path.join(tmpdir, "completions.db"))
+            near = [0.6, 0.8]
+            cache.store("seed", "h1", [1.0, 0.0], "Question A")
+            cache.store("seed", "h2", near, "Question B")
+            cache.store("seed", "h3", [0.0, 1.0], "Unrelated")
+            picks = {cache.lookup_similar("seed", [1.0, 0.0], 0.5, 3600, sample=True)
+                     for _ in range(50)}
+            assert picks == {"Question A", "Question B"}
+            assert cache.lookup_similar("seed", [1.0, 0.0], 0.5, 3600) == "Question A"
+            assert cache.lookup_similar("seed", [-1.0, 0.0], 0.5, 3600, sample=True) is None
+
+        job = (1, "Senior Backend Engineer", "desc", "resp", "Python", "Acme", "Fintech", "5 years")
+        assert _question_seed_key(job) == "Senior Backend Engineer Fintech 5 years"
+
+    def test_semantic_cache_skips_sampled_calls_unless_idempotent(self):
+        """Test high-temperature completions are only cached when marked idempotent"""
+        import core.completion_cache as completion_cache
+        from core.completion_cache import CompletionCache, semantic_cache
+
+        calls = []
+
+        def complete(*, model, messages, temperature):
+            calls.append(temperature)
+            return f"answer {len(calls)}"
+
+        sampled = semantic_cache(namespace='t_sampled')(complete)
+        reusable = semantic_cache(namespace='t_reusable', idempotent=True)(complete)
+        messages = [{"role": "user", "content": "hi"}]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            previous = completion_cache._completion_cache
+            completion_cache._completion_cache = CompletionCache(
+                os.path.join(tmpdir, "completions.db"), embed_fn=lambda text: None
+            )
+            try:
+                assert sampled(model="m", messages=messages, temperature=0.7) == "answer 1"
+                assert sampled(model="m", messages=messages, temperature=0.7) == "answer 2"
+                assert sampled(model="m", messages=messages, temperature=0) == "answer 3"
+                assert sampled(model="m", messages=messages, temperature=0) == "answer 3"
+                assert reusable(model="m", messages=messages, temperature=0.8) == "answer 4"
+                assert reusable(model="m", messages=messages, temperature=0.8) == "answer 4"
+            finally:
+                completion_cache._completion_cache = previous
+        assert len(calls) == 4
+
+
+    def test_semantic_cache_exact_mode_ignores_similar_prompts(self):
+        """Test exact-only caching never serves a near-duplicate prompt's answer"""
+        import core.completion_cache as completion_cache
+        from core.completion_cache import CompletionCache, semantic_cache
+
+        calls, embedded = [], []
+
+        def complete(*, model, messages, temperature):
+            calls.append(messages[0]["content"])
+            return f"parsed {len(calls)}"
+
+        parse = semantic_cache(namespace='t_exact', exact=True)(complete)
+        same_header = lambda text: embedded.append(text) or [1.0, 0.0]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            previous = completion_cache._completion_cache
+            completion_cache._completion_cache = CompletionCache(
+                os.path.join(tmpdir, "completions.db"), embed_fn=same_header
+            )
+            try:
+                cv_a = [{"role": "user", "content": "Jane Doe\nSummary\nSalary: 50k"}]
+                cv_b = [{"role": "user", "content": "Jane Doe\nSummary\nSalary: 80k"}]
+                assert parse(model="m", messages=cv_a, temperature=0) == "parsed 1"
+                assert parse(model="m", messages=cv_b, temperature=0) == "parsed 2"
+                assert parse(model="m", messages=cv_a, temperature=0) == "parsed 1"
+            finally:
+                completion_cache._completion_cache = previous
+        assert embedded == []
 
 class TestSemanticSearch:
     """Test semantic search functionality."""
@@ -444,6 +1418,57 @@ class TestExternalServices:
         assert IndeedJobScraper is not None
         assert get_indeed_job_scraper is not None
 
+    def test_async_page_fetch_retries_transient_status(self, monkeypatch):
+        """Test a throttled page is retried instead of silently dropped"""
+        import asyncio
+        import httpx
+        import core.job_processor as job_processor
+
+        calls = {}
+
+        def handler(request):
+            page = request.url.params['page']
+            calls[page] = calls.get(page, 0) + 1
+            if page == '2' and calls[page] == 1:
+                return httpx.Response(429)
+            return httpx.Response(200, json={'data': [{'job_id': page}]})
+
+        class MockAsyncClient(httpx.AsyncClient):
+            def __init__(self, **kwargs):
+                kwargs.pop('http2', None)
+                super().__init__(transport=httpx.MockTransport(handler), **kwargs)
+
+        monkeypatch.setattr(httpx, 'AsyncClient', MockAsyncClient)
+        monkeypatch.setattr(job_processor, 'JSEARCH_BACKOFF_FACTOR', 0)
+        backend = job_processor.JobMatcherBackend()
+        results = asyncio.run(backend._fetch_pages_async({}, "analyst", [1, 2, 3]))
+        assert results == [(200, [{'job_id': '1'}]), (200, [{'job_id': '2'}]),
+                           (200, [{'job_id': '3'}])]
+        assert calls['2'] == 2
+
+    def test_json_loads_matches_stdlib(self):
+        """Test fast JSON decoding agrees with the stdlib, including errors"""
+        import json
+        import math
+        from utils.json_utils import json_loads
+        
+        assert json_loads(b'{"data": [{"job_title": "Analyst"}]}') == {"data": [{"job_title": "Analyst"}]}
+        assert math.isnan(json_loads('{"score": NaN}')["score"])
+        with pytest.raises(json.JSONDecodeError):
+            json_loads("not json")
+    
+    def test_json_dumps_matches_stdlib(self):
+        """Test fast JSON encoding produces the same text as the stdlib"""
+        import json
+        from utils.json_utils import json_dumps
+        
+        data = [{"q": "Résumé 中文", "a": "line\n\"quoted\""}, {"b": 1, "a": None}]
+        assert json_dumps(data, indent=True) == json.dumps(data, ensure_ascii=False, indent=2)
+        assert json_dumps(data, sort_keys=True) == json.dumps(
+            data, ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+        # Non-string keys fall back to the stdlib encoder
+        assert json.loads(json_dumps({1: "x"})) == {"1": "x"}
+
 
 class TestEmbeddingGeneration:
     """Test embedding generation."""
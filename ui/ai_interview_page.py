@@ -18,14 +18,39 @@ import json
 import streamlit as st
 from typing import Dict, Optional, List, Tuple
 
-from database.queries import get_jobs_for_interview, get_job_seeker_profile_tuple
+from utils.json_utils import json_loads
+from database.queries import (
+    get_jobs_for_interview,
+    get_job_seeker_profile_tuple,
+    get_job_seeker_profile_tuple_by_id,
+)
 from core.interview import (
     initialize_interview_session,
+    reset_interview_session,
+    build_interview_context,
     generate_interview_question,
     evaluate_answer,
+    evaluate_and_generate_next,
+    evaluate_and_summarize,
+    apply_batch_evaluation,
+    prefetch_interview_question,
     generate_final_summary
 )
 
+# Streamlit < 1.37 has no st.fragment; the block then reruns with the page
+_fragment = getattr(st, 'fragment', None) or (lambda fn: fn)
+
+
+def _rerun_fragment() -> None:
+    """Rerun just the interview fragment (the whole page without fragments)."""
+    if getattr(st, 'fragment', None) is not None:
+        try:
+            st.rerun(scope="fragment")
+        except st.errors.StreamlitAPIException:
+            # Only allowed during a fragment rerun, not a full-page run
+            pass
+    st.rerun()
+
 
 def ai_interview_page():
     """AI Interview Page - Streamlit UI.
@@ -52,8 +77,7 @@ def ai_interview_page():
         if st.button("Cancel & Use different job", width="stretch"):
             st.session_state.selected_job = None
             st.session_state.selected_job_for_resume = None
-            if 'interview' in st.session_state:
-                del st.session_state.interview
+            _discard_interview()
             if 'interview_started' in st.session_state:
                 del st.session_state.interview_started
             if '_interview_job_key' in st.session_state:
@@ -64,8 +88,7 @@ def ai_interview_page():
             st.session_state.selected_job = None
             st.session_state.selected_job_for_resume = None
             st.session_state.current_page = "job_recommendations"
-            if 'interview' in st.session_state:
-                del st.session_state.interview
+            _discard_interview()
             if 'interview_started' in st.session_state:
                 del st.session_state.interview_started
             if '_interview_job_key' in st.session_state:
@@ -173,9 +196,12 @@ def ai_interview_page():
             jobs, selected_job = _select_matched_job(matched_jobs)
         else:
             jobs = headhunter_jobs
-            job_options = {f"#{job[0]} {job[1]} - {job[5]}": job for job in jobs}
-            selected_job_key = st.selectbox("Select Interview Position", list(job_options.keys()))
-            selected_job = job_options[selected_job_key]
+            # Select by index: no label->job dict per rerun, and duplicate labels stay distinct
+            job_idx = st.selectbox(
+                "Select Interview Position", range(len(jobs)),
+                format_func=lambda i: f"#{jobs[i][0]} {jobs[i][1]} - {jobs[i][5]}"
+            )
+            selected_job = jobs[job_idx]
         # Define a variable for the AI's "Briefing"
         job_context = selected_job[2] if len(selected_job) > 2 else ""
     
@@ -202,8 +228,7 @@ def ai_interview_page():
     # Reset interview if the target job changed (prevents cross-job state leaks)
     current_job_key = f"{selected_job[1]}::{selected_job[5]}::{selected_job[0]}"
     if st.session_state.get("_interview_job_key") != current_job_key:
-        if 'interview' in st.session_state:
-            del st.session_state.interview
+        _discard_interview()
         if 'interview_started' in st.session_state:
             del st.session_state.interview_started
         st.session_state._interview_job_key = current_job_key
@@ -218,11 +243,21 @@ def ai_interview_page():
     if not st.session_state.get("interview_started", False):
         if st.button("🚀 Start Interview", type="primary", width="stretch"):
             st.session_state.interview_started = True
-            st.session_state.interview = initialize_interview_session(selected_job)
+            existing = st.session_state.get('interview')
+            ctx = build_interview_context(
+                tuple(selected_job), tuple(current_seeker_profile) if current_seeker_profile else None
+            )
+            # Reuse a session reset in place by Restart (same job and profile)
+            if not (existing and existing.get('ctx_system') == ctx and not existing['questions']):
+                st.session_state.interview = initialize_interview_session(selected_job, current_seeker_profile)
 
             # Generate first question immediately on start
             with st.spinner("AI is preparing interview questions..."):
-                first_question = generate_interview_question(selected_job, current_seeker_profile)
+                first_question = generate_interview_question(
+                    selected_job, current_seeker_profile,
+                    context=st.session_state.interview['ctx_system'],
+                    on_token=_stream_to(st.empty())
+                )
                 if not first_question.startswith("AI question generation failed"):
                     st.session_state.interview['questions'].append(first_question)
                     st.session_state.interview['current_question'] = 1
@@ -232,11 +267,22 @@ def ai_interview_page():
                     st.error(first_question)
         return
 
+    _interview_fragment(selected_job, current_seeker_profile)
+
+
+@_fragment
+def _interview_fragment(selected_job: tuple, current_seeker_profile: Optional[tuple]):
+    """Question/answer and summary region of the interview page.
+    
+    Runs as a Streamlit fragment: typing, toggling and submitting answers
+    rerun only this block, not the job lookup and selection above it.
+    """
     # Interview state should exist if started; recover if it doesn't.
     if 'interview' not in st.session_state:
-        st.session_state.interview = initialize_interview_session(selected_job)
+        st.session_state.interview = initialize_interview_session(selected_job, current_seeker_profile)
 
     interview = st.session_state.interview
+    ctx_system = interview.get('ctx_system')
 
     # Start/continue interview
     if not interview['completed']:
@@ -250,58 +296,92 @@ def ai_interview_page():
                                 placeholder="Please describe your answer in detail...",
                                 key=f"answer_{interview['current_question']}")
 
+            # Generate the next question while the candidate is answering this one
+            next_idx = interview['current_question'] + 1
+            prefetched = interview.setdefault('prefetched', {})
+            if next_idx <= interview['total_questions'] and next_idx not in prefetched:
+                prefetched[next_idx] = prefetch_interview_question(
+                    selected_job, current_seeker_profile, interview['questions'],
+                    context=ctx_system
+                )
+
+            score_now = st.toggle(
+                "Show score after each answer",
+                key="interview_score_now",
+                help="Scores each answer as you go (one extra AI call per answer). "
+                     "Otherwise all answers are scored together at the end."
+            )
+
             if st.button("📤 Submit Answer", type="primary", width="stretch"):
                 if answer.strip():
-                    with st.spinner("AI is evaluating your answer..."):
-                        # Evaluate current answer
-                        evaluation = evaluate_answer(
-                            interview['questions'][-1],
-                            answer,
-                            selected_job
-                        )
-
-                        try:
-                            eval_data = json.loads(evaluation)
-                            if 'error' not in eval_data:
-                                # Save answer and evaluation
-                                interview['answers'].append(answer)
-                                interview['scores'].append(eval_data)
-
-                                # Check if all questions are completed
-                                if interview['current_question'] == interview['total_questions']:
-                                    # Generate final summary
-                                    with st.spinner("AI is generating interview summary..."):
-                                        summary = generate_final_summary(interview, selected_job)
-                                        try:
-                                            summary_data = json.loads(summary)
-                                            interview['summary'] = summary_data
-                                            interview['completed'] = True
-                                        except (json.JSONDecodeError, KeyError, TypeError):
-                                            interview['summary'] = {"error": "Summary parsing failed"}
-                                            interview['completed'] = True
-                                else:
-                                    # Generate next question
-                                    previous_qa = {
-                                        'question': interview['questions'][-1],
-                                        'answer': answer
-                                    }
-                                    next_question = generate_interview_question(
-                                        selected_job, current_seeker_profile, previous_qa
-                                    )
-                                    if not next_question.startswith("AI question generation failed"):
-                                        interview['questions'].append(next_question)
-                                        interview['current_question'] += 1
-                                    else:
-                                        st.error(next_question)
-
-                                st.rerun()
+                    question = interview['questions'][-1]
+                    is_last = interview['current_question'] == interview['total_questions']
+                    eval_data = None
+                    next_question = None if is_last else _take_prefetched_question(
+                        interview, interview['current_question'] + 1, answer
+                    )
+                    # The last answer is scored together with the summary in one call
+                    if score_now and not is_last:
+                        with st.expander("📡 Live AI output", expanded=False):
+                            on_token = _stream_to(st.empty(), language="json")
+                        with st.spinner("AI is evaluating your answer..."):
+                            if next_question:
+                                evaluation = evaluate_answer(
+                                    question,
+                                    answer,
+                                    selected_job,
+                                    seeker_profile=current_seeker_profile,
+                                    context=ctx_system,
+                                    on_token=on_token
+                                )
                             else:
-                                st.error(eval_data['error'])
-                        except json.JSONDecodeError:
-                            st.error("Evaluation result parsing failed")
+                                # One call returns the evaluation and the follow-up question
+                                evaluation, next_question = evaluate_and_generate_next(
+                                    question, answer, selected_job, current_seeker_profile,
+                                    context=ctx_system, on_token=on_token
+                                )
+                            try:
+                                eval_data = json_loads(evaluation)
+                            except json.JSONDecodeError:
+                                eval_data = {'error': "Evaluation result parsing failed"}
+
+                    if eval_data is not None and 'error' in eval_data:
+                        st.error(eval_data['error'])
+                    elif is_last:
+                        _record_answer(interview, question, answer, eval_data)
+                        with st.spinner("AI is generating interview summary..."):
+                            error = _finish_interview(interview, selected_job, current_seeker_profile)
+                        if error:
+                            # Un-record so resubmitting retries cleanly
+                            interview['answers'].pop()
+                            (interview['scores'] if eval_data is not None else interview['pending']).pop()
+                            st.error(error)
+                        else:
+                            _rerun_fragment()
+                    else:
+                        # Generate next question; scoring is deferred to the end
+                        if next_question is None:
+                            with st.spinner("AI is preparing the next question..."):
+                                next_question = generate_interview_question(
+                                    selected_job, current_seeker_profile,
+                                    {'question': question, 'answer': answer},
+                                    context=ctx_system,
+                                    on_token=_stream_to(st.empty())
+                                )
+                        if not next_question.startswith("AI question generation failed"):
+                            _record_answer(interview, question, answer, eval_data)
+                            interview['questions'].append(next_question)
+                            interview['current_question'] += 1
+                            _rerun_fragment()
+                        else:
+                            st.error(next_question)
                 else:
                     st.warning("Please enter your answer")
 
+            if score_now and interview['scores'] and len(interview['scores']) == len(interview['answers']):
+                last = interview['scores'][-1]
+                st.caption(f"Previous answer: {last.get('score', 'N/A')}/10 — {last.get('feedback', '')}")
+
             # Display progress
             progress = interview['current_question'] / interview['total_questions']
             st.progress(progress)
@@ -350,27 +430,126 @@ def ai_interview_page():
 
             # Detailed Q&A records
             with st.expander("📝 View Detailed Q&A Records"):
-                for i, (question, answer, score_data) in enumerate(zip(
-                    interview['questions'],
-                    interview['answers'],
-                    interview['scores']
-                )):
-                    st.write(f"#### Question {i+1}")
-                    st.write(f"**Question:** {question}")
-                    st.write(f"**Answer:** {answer}")
-                    if isinstance(score_data, dict):
-                        st.write(f"**Score:** {score_data.get('score', 'N/A')}/10")
-                        st.write(f"**Feedback:** {score_data.get('feedback', '')}")
-                    st.markdown("---")
+                # One markdown element instead of ~5 per question on every rerun
+                st.markdown(_qa_records_markdown(interview))
 
             # Restart interview
             if st.button("🔄 Restart Interview", width="stretch"):
-                del st.session_state.interview
-                if 'interview_started' in st.session_state:
-                    del st.session_state.interview_started
+                reset_interview_session(interview)
+                st.session_state.interview_started = False
                 st.rerun()
 
 
+def _qa_records_markdown(interview: Dict) -> str:
+    """Render every Q&A record of a finished interview as one markdown block."""
+    blocks = []
+    for i, (question, answer, score_data) in enumerate(zip(
+        interview['questions'],
+        interview['answers'],
+        interview['scores']
+    )):
+        lines = [
+            f"#### Question {i+1}",
+            f"**Question:** {question}",
+            f"**Answer:** {answer}",
+        ]
+        if isinstance(score_data, dict):
+            lines.append(f"**Score:** {score_data.get('score', 'N/A')}/10")
+            lines.append(f"**Feedback:** {score_data.get('feedback', '')}")
+        lines.append("---")
+        blocks.append("\n\n".join(lines))
+    return "\n\n".join(blocks)
+
+
+# Answers shorter than this are treated as too thin to judge the prefetched
+# question against, so a regular follow-up is generated instead
+PREFETCH_MIN_ANSWER_CHARS = 20
+
+
+def _take_prefetched_question(interview: Dict, question_number: int,
+                              answer: str) -> Optional[str]:
+    """Return the prefetched question for this slot, or None to regenerate."""
+    future = interview.get('prefetched', {}).pop(question_number, None)
+    if future is None or len(answer.strip()) <= PREFETCH_MIN_ANSWER_CHARS:
+        if future is not None:
+            future.cancel()
+        return None
+    try:
+        question = future.result()
+    except Exception:
+        return None
+    if question.startswith(("AI question generation failed", "Error:")):
+        return None
+    return question
+
+
+def _discard_interview() -> None:
+    """Drop the interview state, cancelling any queued question prefetches."""
+    interview = st.session_state.pop('interview', None)
+    if interview:
+        for future in interview.get('prefetched', {}).values():
+            future.cancel()
+
+
+def _record_answer(interview: Dict, question: str, answer: str,
+                   eval_data: Optional[Dict]) -> None:
+    """Save an answer, with its score if it was evaluated immediately."""
+    interview['answers'].append(answer)
+    if eval_data is not None:
+        interview['scores'].append(eval_data)
+    else:
+        interview.setdefault('pending', []).append({'q': question, 'a': answer})
+
+
+def _stream_to(placeholder, language: Optional[str] = None):
+    """Return an on_token callback that renders the text so far into placeholder.
+    
+    Plain text is shown as markdown (questions); with ``language`` the
+    partial output is shown as a code block (raw JSON preview).
+    """
+    parts = []
+
+    def on_token(delta: str) -> None:
+        parts.append(delta)
+        text = "".join(parts)
+        if language:
+            placeholder.code(text, language=language)
+        else:
+            placeholder.markdown(text)
+
+    return on_token
+
+
+def _finish_interview(interview: Dict, selected_job: tuple,
+                      seeker_profile: Optional[tuple]) -> Optional[str]:
+    """Score any deferred answers and build the summary.
+    
+    Uses a single evaluate_and_summarize call when answers are pending;
+    if every answer was already scored, only the summary is generated.
+    
+    Returns:
+        Error message to show, or None once the interview is completed
+    """
+    with st.expander("📡 Live AI output", expanded=False):
+        on_token = _stream_to(st.empty(), language="json")
+
+    if interview.get('pending'):
+        result = evaluate_and_summarize(interview, selected_job,
+                                        seeker_profile=seeker_profile,
+                                        on_token=on_token)
+        return apply_batch_evaluation(interview, result)
+
+    summary = generate_final_summary(interview, selected_job,
+                                     seeker_profile=seeker_profile,
+                                     on_token=on_token)
+    try:
+        interview['summary'] = json_loads(summary)
+    except (json.JSONDecodeError, KeyError, TypeError):
+        interview['summary'] = {"error": "Summary parsing failed"}
+    interview['completed'] = True
+    return None
+
+
 def _select_matched_job(matched_jobs: List[Dict]) -> Tuple[List, tuple]:
     """Display matched job selection and convert to interview tuple format.
     
@@ -386,7 +565,7 @@ def _select_matched_job(matched_jobs: List[Dict]) -> Tuple[List, tuple]:
         # Fallback conversion
         def convert_matched_job_to_interview_tuple(job):
             return (
-                job.get('id', 0),
+                job.get('job_id', 0),
                 job.get('job_title', ''),
                 job.get('job_description', ''),
                 '',  # main_responsibilities
@@ -396,15 +575,14 @@ def _select_matched_job(matched_jobs: List[Dict]) -> Tuple[List, tuple]:
                 job.get('experience_required', '')
             )
     
-    # Create display options
-    job_options = {}
-    for job in matched_jobs:
-        match_pct = job.get('match_percentage', 0)
-        display_key = f"🎯 {match_pct}% | {job.get('job_title', 'Unknown')} - {job.get('company_name', 'Unknown')}"
-        job_options[display_key] = job
+    def format_job(i: int) -> str:
+        job = matched_jobs[i]
+        return (f"🎯 {job.get('match_percentage', 0)}% | {job.get('job_title', 'Unknown')} - "
+                f"{job.get('company_name', 'Unknown')}")
     
-    selected_job_key = st.selectbox("Select Interview Position", list(job_options.keys()))
-    selected_job_dict = job_options[selected_job_key]
+    job_idx = st.selectbox("Select Interview Position", range(len(matched_jobs)),
+                           format_func=format_job)
+    selected_job_dict = matched_jobs[job_idx]
     
     # Convert to tuple format expected by interview module
     selected_job_tuple = convert_matched_job_to_interview_tuple(selected_job_dict)
@@ -421,15 +599,10 @@ def _get_seeker_profile_for_interview(job_seeker_id: str) -> Optional[tuple]:
     Returns:
         Profile tuple or None
     """
-    try:
-        from core.job_seeker_flow import get_job_seeker_profile, convert_profile_to_interview_tuple
-        profile = get_job_seeker_profile(job_seeker_id)
-        if profile:
-            return convert_profile_to_interview_tuple(profile)
-    except ImportError:
-        pass
-    except Exception:
-        pass
+    # Memoized tuple query: this runs on every rerun of the interview page
+    profile = get_job_seeker_profile_tuple_by_id(job_seeker_id)
+    if profile:
+        return profile
     
     # Fallback to old method
     return get_job_seeker_profile_tuple()
@@ -1,4 +1,5 @@
 """Dashboard display components"""
+import sys
 import streamlit as st
 import pandas as pd
 from core.salary_analyzer import calculate_salary_band
@@ -16,11 +17,15 @@ def calculate_match_scores(jobs, user_skills_str):
     - Empty user skills: skill_match_pct = 0
     - Out-of-bounds semantic scores: clamped to 0-100
     - Missing job data: graceful fallbacks
+    
+    Candidate skills are built with a set comprehension (no throwaway list)
+    and interned, since the same few skill strings are compared against
+    every job.
     """
     if not user_skills_str:
         user_skills_str = ''
     
-    candidate_skills = set([s.lower().strip() for s in str(user_skills_str).split(',') if s.strip()])
+    candidate_skills = {sys.intern(s.lower().strip()) for s in str(user_skills_str).split(',') if s.strip()}
     total_skills = len(candidate_skills)
     
     for job_result in jobs:
@@ -48,7 +48,7 @@ def recruitment_match_dashboard():
 def recruitment_match_page():
     """Recruitment Match Page"""
     from database.queries import get_all_jobs_for_matching_tuples, get_all_job_seekers_formatted
-    from core.job_matcher import analyze_match_simple
+    from core.job_matcher import top_matches_for_job
     
     # Import WebSocket utilities with fallback
     try:
@@ -104,9 +104,12 @@ def recruitment_match_page():
     # Select position for matching
     st.subheader("🔍 Select Position to Match")
 
-    job_options = {f"#{job[0]} {job[1]} - {job[5]}": job for job in jobs}
-    selected_job_key = st.selectbox("Select Position", list(job_options.keys()))
-    selected_job = job_options[selected_job_key]
+    # Select by index: no label->job dict per rerun, and duplicate labels stay distinct
+    job_idx = st.selectbox(
+        "Select Position", range(len(jobs)),
+        format_func=lambda i: f"#{jobs[i][0]} {jobs[i][1]} - {jobs[i][5]}"
+    )
+    selected_job = jobs[job_idx]
 
     # Display position details
     with st.expander("📋 Position Details", expanded=True):
@@ -134,32 +137,26 @@ def recruitment_match_page():
         st.subheader("📈 Match Results")
 
         results = []
-        total_candidates = min(len(seekers), max_candidates)
         
-        # Use ProgressTracker for WebSocket keepalive during matching
-        with ProgressTracker("Smart Matching", total_steps=total_candidates) as tracker:
-            for i, seeker in enumerate(seekers[:max_candidates]):
-                tracker.update(i + 1, f"Analyzing candidate {i + 1}/{total_candidates}...")
-                
-                # Send keepalive every 3 candidates to maintain connection
-                if i % 3 == 0:
-                    _websocket_keepalive(f"Matching candidate {i + 1}")
-
-                # Use simplified matching algorithm
-                analysis_result = analyze_match_simple(selected_job, seeker)
-                match_score = analysis_result.get('match_score', 0)
-
-                if match_score >= min_match_score:
-                    results.append({
-                        'seeker_id': seeker[0],
-                        'name': seeker[1],
-                        'current_title': seeker[9],
-                        'experience': seeker[3],
-                        'education': seeker[4],
-                        'match_score': match_score,
-                        'analysis': analysis_result,
-                        'raw_data': seeker
-                    })
+        # Score all seekers in one vectorized pass, keep the top N
+        with ProgressTracker("Smart Matching", total_steps=1) as tracker:
+            _websocket_keepalive("Matching candidates")
+            top_matches = top_matches_for_job(
+                selected_job, seekers, max_candidates, min_score=min_match_score
+            )
+            tracker.update(1, f"Analyzed {len(seekers)} candidates")
+
+        for seeker, analysis_result in top_matches:
+            results.append({
+                'seeker_id': seeker[0],
+                'name': seeker[1],
+                'current_title': seeker[9],
+                'experience': seeker[3],
+                'education': seeker[4],
+                'match_score': analysis_result.get('match_score', 0),
+                'analysis': analysis_result,
+                'raw_data': seeker
+            })
 
         # Display results
         if results:
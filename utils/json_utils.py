@@ -0,0 +1,59 @@
+"""
+JSON encoding/decoding helpers.
+
+Uses orjson when it is installed (several times faster than the stdlib
+on the multi-KB job search and completion payloads) and falls back to the
+standard json module otherwise.
+"""
+
+import json
+
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+
+def json_loads(data):
+    """Decode JSON from str/bytes, preferring orjson.
+
+    Input orjson rejects but the stdlib accepts (e.g. NaN literals) is
+    retried with ``json.loads``, so results and raised errors
+    (``json.JSONDecodeError``) match the stdlib.
+    """
+    if _orjson is not None:
+        try:
+            return _orjson.loads(data)
+        except _orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def json_dumps(obj, indent: bool = False, sort_keys: bool = False) -> str:
+    """Encode to a UTF-8 JSON string (non-ASCII kept as-is), preferring orjson.
+
+    Output is compact, or 2-space indented with ``indent=True``; the stdlib
+    fallback uses the same separators so both produce identical text.
+    Objects orjson can't encode (non-str keys, huge ints) go through
+    ``json.dumps`` as well.
+    """
+    if _orjson is not None:
+        option = 0
+        if indent:
+            option |= _orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= _orjson.OPT_SORT_KEYS
+        try:
+            return _orjson.dumps(obj, option=option).decode('utf-8')
+        except TypeError:
+            pass
+    return json.dumps(
+        obj, ensure_ascii=False, sort_keys=sort_keys,
+        indent=2 if indent else None,
+        separators=(',', ': ') if indent else (',', ':')
+    )
+
+
+def response_json(response):
+    """Decode a requests/httpx response body (drop-in for ``response.json()``)."""
+    return json_loads(response.content)
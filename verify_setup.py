@@ -65,7 +65,7 @@ def check_required_modules() -> Tuple[int, int]:
         ("matplotlib", "matplotlib"),
         ("plotly", "plotly"),
         ("scikit-learn", "sklearn"),
-        ("PyPDF2", "PyPDF2"),
+        ("pymupdf", "fitz"),
         ("python-docx", "docx"),
         ("pinecone-client", "pinecone"),
         ("sentence-transformers", "sentence_transformers"),